@@ -0,0 +1,140 @@
+"""
+Environment fixtures of test classes.
+
+Each fixture runs a cheap health probe first and cleanup/setup is executed only if the probe reports a problem,
+for example adb is restarted only if `adb devices` fails and emulators are killed only if some are running.
+"""
+# pylint: disable=broad-except
+import time
+
+import psutil
+
+from core.base_test.test_context import TestContext
+from core.enums.fixture_type import FixtureType
+from core.enums.os_type import OSType
+from core.log.log import Log
+from core.settings import Settings
+from core.utils.device.adb import Adb, ANDROID_HOME
+from core.utils.device.device_manager import DeviceManager
+from core.utils.gradle import Gradle
+from core.utils.process import Process
+from products.nativescript.tns import Tns
+
+
+class Fixtures(object):
+    # Time spent in each fixture during the test run {fixture name: seconds}
+    DURATIONS = {}
+
+    @staticmethod
+    def setup(fixtures):
+        """
+        Ensure environment required by test class.
+        Processes of {N} CLI and Gradle daemons are checked for all classes, other fixtures only if declared.
+        :param fixtures: List of FixtureType values (usually `FIXTURES` of the test class).
+        :return: dict {fixture name: action} (action is None if fixture was healthy).
+        """
+        steps = [('tns', Fixtures.__probe_tns, Tns.kill)]
+        if FixtureType.CLEAN_GRADLE in fixtures or not Settings.GRADLE_REUSE_DAEMON:
+            steps.append((str(FixtureType.CLEAN_GRADLE), Fixtures.__probe_gradle, Gradle.kill))
+        else:
+            steps.append(('gradle', Fixtures.__probe_gradle, Gradle.kill_stuck))
+        if FixtureType.ADB in fixtures:
+            steps.append((str(FixtureType.ADB), Fixtures.__probe_adb, Adb.restart))
+        if FixtureType.EMULATOR in fixtures:
+            steps.append((str(FixtureType.EMULATOR), Fixtures.__probe_emulator, DeviceManager.Emulator.stop))
+        if FixtureType.SIMULATOR in fixtures:
+            steps.append((str(FixtureType.SIMULATOR), Fixtures.__probe_simulator, DeviceManager.Simulator.stop))
+        if FixtureType.NO_DEVICES in fixtures:
+            steps.append(('no emulators', Fixtures.__probe_no_emulators, Fixtures.__stop_emulators))
+            steps.append(('no simulators', Fixtures.__probe_no_simulators, Fixtures.__stop_simulators))
+
+        actions = {}
+        for name, probe, action in steps:
+            start = time.time()
+            reason = probe()
+            if reason is not None:
+                Log.info('Fixture {0}: {1}, fix it.'.format(name, reason))
+                action()
+            duration = time.time() - start
+            Fixtures.DURATIONS[name] = Fixtures.DURATIONS.get(name, 0) + duration
+            Log.debug('Fixture {0}: {1} in {2:.2f} sec.'.format(name, 'fixed' if reason else 'healthy', duration))
+            actions[name] = reason
+        return actions
+
+    @staticmethod
+    def get_report():
+        """
+        Get time spent in fixtures since the test run started.
+        """
+        lines = ['Fixtures:']
+        for name, duration in sorted(Fixtures.DURATIONS.items(), key=lambda item: -item[1]):
+            lines.append('  {0:<20} {1:.1f}s'.format(name, duration))
+        return '\n'.join(lines)
+
+    @staticmethod
+    def __probe_tns():
+        for proc in psutil.process_iter():
+            try:
+                if 'node' not in proc.name():
+                    continue
+                cmdline = ' '.join(proc.cmdline())
+            except Exception:
+                continue
+            if Settings.HOST_OS is OSType.WINDOWS or Settings.Executables.TNS in cmdline or 'webpack.js' in cmdline:
+                return 'process {0} is running'.format(proc.pid)
+        return None
+
+    @staticmethod
+    def __probe_gradle():
+        daemons = Gradle.get_daemons()
+        if daemons:
+            return '{0} daemon(s) running'.format(len(daemons))
+        return None
+
+    @staticmethod
+    def __probe_adb():
+        if ANDROID_HOME is None:
+            return None
+        result = Adb.run_adb_command(command='devices', timeout=10, fail_safe=True)
+        if result.exit_code != 0:
+            return '`adb devices` failed'
+        if 'offline' in result.output:
+            return 'offline devices found'
+        return None
+
+    @staticmethod
+    def __probe_emulator():
+        if ANDROID_HOME is None or DeviceManager.Emulator.is_running(emulator=Settings.Emulators.DEFAULT):
+            return None
+        return '{0} is not running'.format(Settings.Emulators.DEFAULT.avd)
+
+    @staticmethod
+    def __probe_simulator():
+        if Settings.HOST_OS is not OSType.OSX:
+            return None
+        if DeviceManager.Simulator.is_running(simulator_info=Settings.Simulators.DEFAULT):
+            return None
+        return '{0} is not running'.format(Settings.Simulators.DEFAULT.name)
+
+    @staticmethod
+    def __probe_no_emulators():
+        for cmdline in ['qemu', 'emulator64']:
+            if Process.is_running_by_commandline(commandline=cmdline):
+                return 'emulators are running'
+        return None
+
+    @staticmethod
+    def __probe_no_simulators():
+        if Settings.HOST_OS is OSType.OSX and Process.is_running_by_name(proc_name='launchd_sim'):
+            return 'simulators are running'
+        return None
+
+    @staticmethod
+    def __stop_emulators():
+        DeviceManager.Emulator.stop()
+        TestContext.STARTED_DEVICES = []
+
+    @staticmethod
+    def __stop_simulators():
+        DeviceManager.Simulator.stop()
+        TestContext.STARTED_DEVICES = []
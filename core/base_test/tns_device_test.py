@@ -1,5 +1,6 @@
 from core.base_test.tns_test import TnsTest
 from core.enums.device_type import DeviceType
+from core.enums.fixture_type import FixtureType
 from core.enums.os_type import OSType
 from core.settings import Settings
 from core.utils.device.adb import Adb
@@ -7,6 +8,7 @@ from core.utils.device.device_manager import DeviceManager
 
 
 class TnsDeviceTest(TnsTest):
+    FIXTURES = [FixtureType.ADB, FixtureType.NO_DEVICES]
     android_device = None
     ios_device = None
 
@@ -1,10 +1,12 @@
 from core.base_test.tns_test import TnsTest
+from core.enums.fixture_type import FixtureType
 from core.settings import Settings
 from core.utils.device.adb import Adb
 from core.utils.device.device_manager import DeviceManager
 
 
 class TnsRunAndroidTest(TnsTest):
+    FIXTURES = [FixtureType.ADB, FixtureType.EMULATOR]
     emu = None
 
     @classmethod
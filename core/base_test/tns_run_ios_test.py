@@ -1,10 +1,13 @@
 from core.base_test.tns_test import TnsTest
+from core.enums.fixture_type import FixtureType
 from core.settings import Settings
 from core.utils.device.device_manager import DeviceManager
 from core.utils.device.simctl import Simctl
 
 
 class TnsRunIOSTest(TnsTest):
+    FIXTURES = [FixtureType.SIMULATOR]
+
     @classmethod
     def setUpClass(cls):
         TnsTest.setUpClass()
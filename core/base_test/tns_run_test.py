@@ -1,4 +1,5 @@
 from core.base_test.tns_test import TnsTest
+from core.enums.fixture_type import FixtureType
 from core.enums.os_type import OSType
 from core.settings import Settings
 from core.utils.device.adb import Adb
@@ -7,6 +8,7 @@ from core.utils.device.simctl import Simctl
 
 
 class TnsRunTest(TnsTest):
+    FIXTURES = [FixtureType.ADB, FixtureType.EMULATOR, FixtureType.SIMULATOR]
     emu = None
     sim = None
 
@@ -3,21 +3,28 @@ import inspect
 import os
 import unittest
 
+from core.base_test.fixtures import Fixtures
 from core.base_test.test_context import TestContext
+from core.enums.fixture_type import FixtureType
 from core.enums.os_type import OSType
 from core.log.log import Log
 from core.settings import Settings
-from core.utils.device.adb import Adb
+from core.utils.chrome.chrome_pool import ChromePool
 from core.utils.device.device_manager import DeviceManager
 from core.utils.file_utils import Folder, File
 from core.utils.gradle import Gradle
+from core.utils.npm_store import NpmStore
 from core.utils.process import Process
+from core.utils.wait import Wait
 from core.utils.xcode import Xcode
 from products.nativescript.tns import Tns
 
 
 # noinspection PyBroadException
 class TnsTest(unittest.TestCase):
+    # Environment required by test class (see `Fixtures`), by default devices are stopped if running.
+    FIXTURES = [FixtureType.NO_DEVICES]
+
     @classmethod
     def setUpClass(cls):
         # Get class name and log
@@ -25,24 +32,26 @@ class TnsTest(unittest.TestCase):
         TestContext.STARTED_DEVICES = []
         TestContext.TEST_APP_NAME = None
         TestContext.CLASS_NAME = cls.__name__
+        test_class = cls
         try:
             for item in inspect.stack():
-                TestContext.CLASS_NAME = item[0].f_locals['cls'].__name__
+                test_class = item[0].f_locals['cls']
+                TestContext.CLASS_NAME = test_class.__name__
         except Exception:
             pass
         Log.test_class_start(class_name=TestContext.CLASS_NAME)
 
-        # Kill processes
-        Adb.restart()
-        Tns.kill()
-        Gradle.kill()
-        TnsTest.kill_emulators()
+        # Ensure environment (processes and devices are cleaned only if health checks fail)
+        Fixtures.setup(fixtures=getattr(test_class, 'FIXTURES', TnsTest.FIXTURES))
+        Log.info(Fixtures.get_report())
         TnsTest.__clean_backup_folder_and_dictionary()
         # Ensure log folders are create
         Folder.create(Settings.TEST_OUT_HOME)
         Folder.create(Settings.TEST_OUT_LOGS)
         Folder.create(Settings.TEST_OUT_IMAGES)
         Folder.create(Settings.TEST_OUT_TEMP)
+        if Settings.NPM_STORE_ENABLED:
+            NpmStore.start()
 
         # Set default simulator based on Xcode version
         if Settings.HOST_OS == OSType.OSX:
@@ -57,8 +66,9 @@ class TnsTest(unittest.TestCase):
     def setUp(self):
         TestContext.TEST_NAME = self._testMethodName
         Log.test_start(test_name=TestContext.TEST_NAME)
+        Wait.reset()
         Tns.kill()
-        Gradle.kill()
+        Gradle.reset()
         TnsTest.__clean_backup_folder_and_dictionary()
 
     def tearDown(self):
@@ -66,7 +76,7 @@ class TnsTest(unittest.TestCase):
 
         # Kill processes
         Tns.kill()
-        Gradle.kill()
+        Gradle.reset()
         Process.kill_all_in_context()
         TnsTest.restore_files()
         # Analise test result
@@ -83,6 +93,7 @@ class TnsTest(unittest.TestCase):
         else:
             self.get_screenshots()
             self.archive_apps()
+        Log.info(Wait.get_report())
         Log.test_end(test_name=TestContext.TEST_NAME, outcome=outcome)
 
     @classmethod
@@ -91,9 +102,9 @@ class TnsTest(unittest.TestCase):
         Logic executed after all core_tests in class.
         """
         Tns.kill()
-        TnsTest.kill_emulators()
+        ChromePool.kill()
         Process.kill_all_in_context()
-        Folder.clean(Settings.TEST_OUT_TEMP)
+        Folder.clean(Settings.TEST_OUT_TEMP, background=True)
         Log.test_class_end(TestContext.CLASS_NAME)
 
     @staticmethod
@@ -131,16 +142,9 @@ class TnsTest(unittest.TestCase):
     @staticmethod
     def restore_files():
         if TestContext.BACKUP_FILES:
-            for file_path in TestContext.BACKUP_FILES:
-                file_name = TestContext.BACKUP_FILES[file_path]
-                file_temp_path = os.path.join(Settings.BACKUP_FOLDER, file_name)
-                # delete file not from the original template
-                if not File.exists(file_temp_path):
-                    File.delete(file_path)
-                else:
-                    File.copy(file_temp_path, file_path)
-                    File.delete(file_temp_path)
-            TnsTest.__clean_backup_folder_and_dictionary()
+            count = len(TestContext.BACKUP_FILES)
+            restored = File.restore_files()
+            Log.info('Restored {0} of {1} backed up files.'.format(len(restored), count))
         else:
             Log.info('No files to restore!')
 
@@ -0,0 +1,17 @@
+"""
+Environment fixture enum (fixtures are declared by test classes in `FIXTURES`).
+"""
+from aenum import IntEnum
+
+
+class FixtureType(IntEnum):
+    _init_ = 'value string'
+
+    ADB = 1, 'adb'
+    EMULATOR = 2, 'emulator'
+    SIMULATOR = 3, 'simulator'
+    NO_DEVICES = 4, 'no devices'
+    CLEAN_GRADLE = 5, 'clean gradle'
+
+    def __str__(self):
+        return self.string
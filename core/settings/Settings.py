@@ -36,10 +36,8 @@ def get_env():
 
 
 def get_project_home():
-    home = os.getcwd()
-    while not os.path.exists(os.path.join(home, 'requirements.txt')):
-        home = os.path.split(home)[0]
-    return home
+    # This file is in <project home>/core/settings
+    return os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
 
 
 HOST_OS = get_os()
@@ -64,6 +62,29 @@ SSH_CLONE = os.environ.get('SSH_CLONE', False)
 
 BACKUP_FOLDER = os.path.join(TEST_RUN_HOME, "backup_folder")
 
+# Folders cleaned in background are moved here first (should be on the same file system as apps and outputs)
+TRASH_HOME = os.path.join(TEST_RUN_HOME, '.trash')
+
+# Perf results history (append-only, kept between test runs, so it should not be under TEST_OUT_HOME)
+PERF_HISTORY = os.environ.get('PERF_HISTORY', os.path.join(TEST_RUN_HOME, 'perf_history.jsonl'))
+
+# Persistent caches (kept between test runs, for example file index of Android SDK)
+CACHE_HOME = os.environ.get('CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache', 'nativescript-tooling-qa'))
+
+# Local store of npm packages (see `NpmStore`), set NPM_STORE_ENABLED=false to always use npm registry directly
+NPM_REGISTRY = os.environ.get('NPM_REGISTRY', 'https://registry.npmjs.org')
+NPM_STORE = os.environ.get('NPM_STORE', os.path.join(CACHE_HOME, 'npm_store'))
+NPM_STORE_ENABLED = os.environ.get('NPM_STORE_ENABLED', 'true').lower() == 'true'
+
+# Reuse Gradle daemon and ~/.gradle between tests (only stuck daemons are killed), set to false for cold builds
+GRADLE_REUSE_DAEMON = os.environ.get('GRADLE_REUSE_DAEMON', 'true').lower() == 'true'
+
+# Reuse Chrome browser between tests (see `ChromePool`), set to false to start new browser for each test
+CHROME_REUSE_SESSION = os.environ.get('CHROME_REUSE_SESSION', 'true').lower() == 'true'
+
+# Baseline manifests for app size tests (content of apk/ipa files)
+SIZE_BASELINES = os.environ.get('SIZE_BASELINES', os.path.join(ASSETS_HOME, 'app_size'))
+
 
 def resolve_package(name, variable, default=str(ENV)):
     tag = os.environ.get(variable, default)
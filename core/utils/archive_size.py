@@ -0,0 +1,139 @@
+"""
+Size analyzer for application packages (.apk, .ipa and other zip archives).
+
+Sizes are read from the central directory of the archive, so archive is not extracted.
+"""
+import json
+import os
+import zipfile
+
+from core.utils.file_utils import File, Folder
+
+
+class ArchiveSize(object):
+    # Depth of path prefixes used to group entries (for example `lib/arm64-v8a` or `assets/snapshots`).
+    PREFIX_DEPTH = {'lib': 2, 'assets': 2, 'Payload': 3}
+
+    @staticmethod
+    def get_entries(archive):
+        """
+        Get sizes of all files in archive.
+        :param archive: Path to archive.
+        :return: dict {path: {'compressed': bytes, 'uncompressed': bytes}}.
+        """
+        entries = {}
+        zip_file = zipfile.ZipFile(archive, 'r')
+        try:
+            for info in zip_file.infolist():
+                if not info.filename.endswith('/'):
+                    entries[info.filename] = {'compressed': info.compress_size, 'uncompressed': info.file_size}
+        finally:
+            zip_file.close()
+        return entries
+
+    @staticmethod
+    def get_prefix(path):
+        """
+        Get prefix used to group entries, for example `lib/x86` for `lib/x86/libNativeScript.so`.
+        :param path: Path of entry in archive.
+        :return: Prefix as string (path itself for files in the root of the archive).
+        """
+        parts = path.split('/')
+        depth = ArchiveSize.PREFIX_DEPTH.get(parts[0], 1)
+        if len(parts) <= depth:
+            return '/'.join(parts[:-1]) if len(parts) > 1 else path
+        return '/'.join(parts[:depth])
+
+    @staticmethod
+    def get_sizes(entries):
+        """
+        Get sizes grouped by path prefix.
+        :param entries: Entries (result of `get_entries`).
+        :return: dict {prefix: {'compressed': bytes, 'uncompressed': bytes, 'count': files}}.
+        """
+        sizes = {}
+        for path, size in entries.items():
+            group = sizes.setdefault(ArchiveSize.get_prefix(path), {'compressed': 0, 'uncompressed': 0, 'count': 0})
+            group['compressed'] += size['compressed']
+            group['uncompressed'] += size['uncompressed']
+            group['count'] += 1
+        return sizes
+
+    @staticmethod
+    def get_size(entries, prefix, compressed=False):
+        """
+        Get total size of entries under path prefix.
+        :param entries: Entries (result of `get_entries`).
+        :param prefix: Path prefix (for example `lib` or `assets/app`).
+        :param compressed: If true return compressed size, otherwise uncompressed size.
+        :return: Size in bytes.
+        """
+        key = 'compressed' if compressed else 'uncompressed'
+        prefix = prefix.rstrip('/') + '/'
+        return sum(size[key] for path, size in entries.items() if path.startswith(prefix))
+
+    @staticmethod
+    def save_manifest(entries, manifest):
+        """
+        Save entries as json manifest (can be used later as baseline).
+        :param entries: Entries (result of `get_entries`).
+        :param manifest: Path to manifest file.
+        """
+        Folder.create(os.path.dirname(manifest))
+        File.write(path=manifest, text=json.dumps(entries, sort_keys=True, indent=2))
+
+    @staticmethod
+    def load_manifest(manifest):
+        """
+        Load json manifest.
+        :param manifest: Path to manifest file.
+        :return: Entries or None if manifest does not exist.
+        """
+        if not File.exists(manifest):
+            return None
+        return json.loads(File.read(manifest))
+
+    @staticmethod
+    def diff(entries, baseline, compressed=True):
+        """
+        Compare entries with baseline.
+        :param entries: Entries (result of `get_entries`).
+        :param baseline: Baseline entries.
+        :param compressed: If true compare compressed sizes, otherwise uncompressed sizes.
+        :return: List of (path, baseline size, actual size) tuples for added, removed and changed files
+                 (size is None if file does not exist), ordered by size difference (biggest growth first).
+        """
+        key = 'compressed' if compressed else 'uncompressed'
+        changes = []
+        for path in set(entries.keys()) | set(baseline.keys()):
+            old = baseline[path][key] if path in baseline else None
+            new = entries[path][key] if path in entries else None
+            if old != new:
+                changes.append((path, old, new))
+        changes.sort(key=lambda change: (change[1] or 0) - (change[2] or 0))
+        return changes
+
+    @staticmethod
+    def get_diff_report(entries, baseline, compressed=True, limit=20):
+        """
+        Get human readable diff of entries and baseline.
+        :param entries: Entries (result of `get_entries`).
+        :param baseline: Baseline entries.
+        :param compressed: If true compare compressed sizes, otherwise uncompressed sizes.
+        :param limit: Max number of files in the report.
+        :return: Report as string.
+        """
+        changes = ArchiveSize.diff(entries=entries, baseline=baseline, compressed=compressed)
+        old_total = sum((old or 0) for _, old, _ in changes)
+        new_total = sum((new or 0) for _, _, new in changes)
+        lines = ['{0} files changed, {1:+d} bytes:'.format(len(changes), new_total - old_total)]
+        for path, old, new in changes[:limit]:
+            if old is None:
+                lines.append('  + {0} ({1} bytes)'.format(path, new))
+            elif new is None:
+                lines.append('  - {0} ({1} bytes)'.format(path, old))
+            else:
+                lines.append('  * {0} ({1} -> {2} bytes, {3:+d})'.format(path, old, new, new - old))
+        if len(changes) > limit:
+            lines.append('  ... and {0} more.'.format(len(changes) - limit))
+        return os.linesep.join(lines)
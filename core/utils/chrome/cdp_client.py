@@ -0,0 +1,443 @@
+"""
+Client of Chrome DevTools Protocol (CDP).
+
+Connects directly to the websocket endpoint printed by `tns debug`
+(`...inspector.html?experiments=true&ws=localhost:<port>`),
+so debug tests do not need Chrome, Selenium or UI automation.
+
+Notes:
+- Websocket client is implemented here (only features needed for CDP), so there are no extra dependencies.
+- Messages are received by background thread, so events are collected all the time (not only while waiting).
+
+Usage:
+    client = CdpClient(url=CdpClient.get_url(log))
+    client.enable(['Runtime', 'Debugger'])
+    client.set_breakpoint(file_name='main-view-model.js', line=17)
+    client.wait_for_paused(timeout=30)
+    client.close()
+"""
+# pylint: disable=broad-except
+import base64
+import hashlib
+import json
+import os
+import re
+import socket
+import struct
+import threading
+import time
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+class CdpError(Exception):
+    pass
+
+
+class WebSocket(object):
+    """
+    Minimal websocket client (RFC 6455) on top of blocking socket.
+    """
+    TEXT = 0x1
+    BINARY = 0x2
+    CLOSE = 0x8
+    PING = 0x9
+    PONG = 0xA
+
+    def __init__(self, sock, data=None):
+        """
+        :param sock: Connected socket (after handshake).
+        :param data: Data received after handshake response.
+        """
+        self.sock = sock
+        self.__buffer = bytearray(data or b'')
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def connect(url, timeout=30):
+        """
+        Open websocket connection.
+        :param url: Websocket url, for example `ws://localhost:40000`.
+        :param timeout: Timeout in seconds.
+        :return: WebSocket object.
+        """
+        parsed = urlparse(url)
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+        sock = socket.create_connection((parsed.hostname, parsed.port or 80), timeout=timeout)
+        key = base64.b64encode(os.urandom(16)).decode('ascii')
+        request = ['GET {0} HTTP/1.1'.format(path),
+                   'Host: {0}:{1}'.format(parsed.hostname, parsed.port or 80),
+                   'Upgrade: websocket',
+                   'Connection: Upgrade',
+                   'Sec-WebSocket-Key: ' + key,
+                   'Sec-WebSocket-Version: 13']
+        sock.sendall(('\r\n'.join(request) + '\r\n\r\n').encode('ascii'))
+        response = bytearray()
+        while response.find(b'\r\n\r\n') < 0:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            response += chunk
+        header, _, data = bytes(response).partition(b'\r\n\r\n')
+        lines = header.decode('latin-1').split('\r\n')
+        if ' 101 ' not in lines[0] + ' ':
+            sock.close()
+            raise CdpError('Websocket handshake with {0} failed: {1}'.format(url, lines[0]))
+        headers = dict((name.strip().lower(), value.strip()) for name, _, value in
+                       [line.partition(':') for line in lines[1:] if line])
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode('ascii')).digest()).decode('ascii')
+        if headers.get('sec-websocket-accept') != accept:
+            sock.close()
+            raise CdpError('Websocket handshake with {0} failed: invalid Sec-WebSocket-Accept.'.format(url))
+        # Messages are received by background thread, it should block until next message
+        sock.settimeout(None)
+        return WebSocket(sock=sock, data=data)
+
+    def send(self, text):
+        self.__send_frame(WebSocket.TEXT, text.encode('utf-8'))
+
+    def recv(self):
+        """
+        Receive next message (ping frames are answered automatically).
+        :return: Text of the message or None if connection is closed.
+        """
+        message = bytearray()
+        while True:
+            try:
+                fin, opcode, payload = self.__read_frame()
+            except (socket.error, IOError):
+                return None
+            if opcode == WebSocket.PING:
+                self.__send_frame(WebSocket.PONG, payload)
+            elif opcode == WebSocket.CLOSE:
+                try:
+                    self.__send_frame(WebSocket.CLOSE, payload[:2])
+                except (socket.error, IOError):
+                    pass
+                return None
+            elif opcode != WebSocket.PONG:
+                message += payload
+                if fin:
+                    return bytes(message).decode('utf-8')
+
+    def close(self):
+        try:
+            self.__send_frame(WebSocket.CLOSE, struct.pack('!H', 1000))
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+        self.sock.close()
+
+    def __send_frame(self, opcode, payload):
+        # Frames sent by client are always masked
+        frame = bytearray([0x80 | opcode])
+        length = len(payload)
+        if length < 126:
+            frame.append(0x80 | length)
+        elif length < 65536:
+            frame.append(0x80 | 126)
+            frame += struct.pack('!H', length)
+        else:
+            frame.append(0x80 | 127)
+            frame += struct.pack('!Q', length)
+        mask = bytearray(os.urandom(4))
+        frame += mask
+        frame += bytearray(byte ^ mask[i % 4] for i, byte in enumerate(bytearray(payload)))
+        # Pong frames are sent by the receiving thread, so frames should not interleave
+        with self.__lock:
+            self.sock.sendall(bytes(frame))
+
+    def __read_frame(self):
+        first, second = self.__read(2)
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack('!H', bytes(self.__read(2)))[0]
+        elif length == 127:
+            length = struct.unpack('!Q', bytes(self.__read(8)))[0]
+        mask = self.__read(4) if second & 0x80 else None
+        payload = self.__read(length)
+        if mask is not None:
+            for i in range(length):
+                payload[i] ^= mask[i % 4]
+        return bool(first & 0x80), first & 0x0F, bytes(payload)
+
+    def __read(self, count):
+        while len(self.__buffer) < count:
+            chunk = self.sock.recv(max(4096, count - len(self.__buffer)))
+            if not chunk:
+                raise IOError('Connection closed.')
+            self.__buffer += chunk
+        data = self.__buffer[:count]
+        del self.__buffer[:count]
+        return data
+
+
+class CdpClient(object):
+    """
+    CDP client with helpers for Runtime, Debugger, Network and DOM domains.
+    All received events are stored in `events` as (method, params) tuples.
+    """
+
+    def __init__(self, url, timeout=30):
+        """
+        Connect to debug backend.
+        :param url: Websocket url (see `get_url`).
+        :param timeout: Default timeout (in seconds) for commands and waits.
+        """
+        self.url = url
+        self.timeout = timeout
+        self.events = []
+        self.paused = None
+        self.__id = 0
+        self.__responses = {}
+        self.__closed = False
+        self.__condition = threading.Condition()
+        self.__ws = WebSocket.connect(url=url, timeout=timeout)
+        self.__reader = threading.Thread(target=self.__read_messages, args=(self.__ws,))
+        self.__reader.daemon = True
+        self.__reader.start()
+
+    @staticmethod
+    def get_url(text):
+        """
+        Get websocket url from output of `tns debug`.
+        :param text: Output of `tns debug` (or debug url).
+        :return: Websocket url (for example `ws://localhost:40000`) or None if debug url is not found.
+        """
+        match = re.search(r'[?&]ws=([\w.\-]+:\d+[^\s&]*)', text)
+        if match is None:
+            return None
+        return 'ws://' + match.group(1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.__ws is not None:
+            self.__ws.close()
+            self.__ws = None
+        self.__reader.join(self.timeout)
+
+    def send(self, method, params=None, timeout=None):
+        """
+        Send command and wait for the response.
+        :param method: Command, for example `Runtime.evaluate`.
+        :param params: Parameters of command as dict.
+        :param timeout: Timeout in seconds (default is `timeout` of the client).
+        :return: Result of the command as dict.
+        """
+        assert self.__ws is not None, 'CDP client is not connected.'
+        with self.__condition:
+            self.__id += 1
+            message_id = self.__id
+        self.__ws.send(json.dumps({'id': message_id, 'method': method, 'params': params or {}}))
+        response = self.__wait(lambda: self.__responses.pop(message_id, None), timeout=timeout,
+                               description='response of ' + method)
+        if 'error' in response:
+            raise CdpError('{0} failed: {1}'.format(method, response['error'].get('message')))
+        return response.get('result', {})
+
+    def wait_for_event(self, method, predicate=None, timeout=None, since=0):
+        """
+        Wait for event.
+        :param method: Event, for example `Network.responseReceived`.
+        :param predicate: Optional function that accepts event params and returns True for expected event.
+        :param timeout: Timeout in seconds (default is `timeout` of the client).
+        :param since: Check only events received after `since` events (use len(client.events) before an action).
+        :return: Params of the event.
+        """
+        def find():
+            return [params for event_method, params in self.events[since:]
+                    if event_method == method and (predicate is None or predicate(params))]
+
+        return self.__wait(find, timeout=timeout, description=method)[0]
+
+    def get_events(self, method):
+        """
+        Get params of received events.
+        :param method: Event name or domain (for example `Network.requestWillBeSent` or `Network`).
+        """
+        return [params for event_method, params in self.events
+                if event_method == method or event_method.startswith(method + '.')]
+
+    def enable(self, domains):
+        """
+        Enable domains (events of enabled domains are collected).
+        :param domains: List of domains, for example ['Runtime', 'Debugger'].
+        """
+        for domain in domains:
+            self.send(domain + '.enable')
+
+    # Runtime
+
+    def evaluate(self, expression):
+        """
+        Evaluate expression in global scope.
+        :return: Value of the result (or description for objects that can not be serialized).
+        """
+        result = self.send('Runtime.evaluate', {'expression': expression, 'returnByValue': True})
+        return CdpClient.__get_value(result)
+
+    def get_console_messages(self):
+        """
+        Get console messages (`Runtime` domain should be enabled).
+        :return: List of messages as strings.
+        """
+        messages = []
+        for params in self.get_events('Runtime.consoleAPICalled'):
+            args = [str(arg.get('value', arg.get('description', ''))) for arg in params.get('args', [])]
+            messages.append(' '.join(args))
+        for params in self.get_events('Console.messageAdded'):
+            messages.append(params.get('message', {}).get('text', ''))
+        return messages
+
+    def wait_for_console_message(self, text, timeout=None):
+        """
+        Wait until console message that contains `text` is logged.
+        """
+        self.__wait(lambda: [m for m in self.get_console_messages() if text in m], timeout=timeout,
+                    description='console message ' + text)
+
+    # Debugger
+
+    def set_breakpoint(self, file_name, line, column=0):
+        """
+        Set breakpoint in all scripts with url that ends with `file_name`.
+        :param file_name: File name, for example `main-view-model.js`.
+        :param line: Line number (1-based, like in Chrome DevTools UI).
+        :param column: Column number (0-based).
+        :return: Breakpoint id.
+        """
+        result = self.send('Debugger.setBreakpointByUrl', {'urlRegex': '.*' + re.escape(file_name) + '$',
+                                                           'lineNumber': line - 1, 'columnNumber': column})
+        return result['breakpointId']
+
+    def remove_breakpoint(self, breakpoint_id):
+        self.send('Debugger.removeBreakpoint', {'breakpointId': breakpoint_id})
+
+    def wait_for_paused(self, timeout=None):
+        """
+        Wait until debugger is paused (on breakpoint, `debugger` statement or `--debug-brk`).
+        :return: Params of `Debugger.paused` event (`reason`, `callFrames`, `hitBreakpoints`).
+        """
+        return self.__wait(lambda: [self.paused] if self.paused is not None else None, timeout=timeout,
+                           description='Debugger.paused')[0]
+
+    def resume(self):
+        self.send('Debugger.resume')
+
+    def evaluate_on_call_frame(self, expression, call_frame_id=None):
+        """
+        Evaluate expression when debugger is paused (like watch expressions in Chrome DevTools).
+        :param expression: Expression.
+        :param call_frame_id: Call frame id (default is top call frame).
+        :return: Value of the result (or description for objects that can not be serialized).
+        """
+        assert self.paused is not None, 'Debugger is not paused.'
+        if call_frame_id is None:
+            call_frame_id = self.paused['callFrames'][0]['callFrameId']
+        result = self.send('Debugger.evaluateOnCallFrame', {'callFrameId': call_frame_id, 'expression': expression})
+        return CdpClient.__get_value(result)
+
+    # Network
+
+    def get_requests(self):
+        """
+        Get urls of network requests (`Network` domain should be enabled).
+        """
+        return [params['request']['url'] for params in self.get_events('Network.requestWillBeSent')]
+
+    def wait_for_response(self, url, timeout=None):
+        """
+        Wait until response for url (or part of url) is received.
+        :return: Response object of `Network.responseReceived` event (`status`, `headers`, `mimeType`, ...).
+        """
+        params = self.wait_for_event('Network.responseReceived', timeout=timeout,
+                                     predicate=lambda event: url in event['response']['url'])
+        return params['response']
+
+    # DOM
+
+    def get_document(self):
+        """
+        Get whole DOM tree.
+        :return: Root node.
+        """
+        result = self.send('DOM.getDocument', {'depth': -1})
+        return result['root']
+
+    def find_nodes(self, text):
+        """
+        Find DOM nodes that contain text in node name, value or attributes.
+        :return: List of nodes.
+        """
+        found = []
+        nodes = [self.get_document()]
+        while nodes:
+            node = nodes.pop(0)
+            values = [node.get('nodeName', ''), node.get('nodeValue', '')] + node.get('attributes', [])
+            if [value for value in values if text in value]:
+                found.append(node)
+            nodes.extend(node.get('children', []))
+        return found
+
+    def set_attribute(self, node_id, name, value):
+        self.send('DOM.setAttributeValue', {'nodeId': node_id, 'name': name, 'value': value})
+
+    def __wait(self, condition, timeout, description):
+        """
+        Wait until condition returns non-empty value (condition is checked each time message is received).
+        :return: Value returned by condition.
+        """
+        end_time = time.time() + (timeout or self.timeout)
+        with self.__condition:
+            while True:
+                value = condition()
+                if value:
+                    return value
+                if self.__closed:
+                    raise CdpError('Connection to {0} closed while waiting for {1}.'.format(self.url, description))
+                remaining = end_time - time.time()
+                if remaining <= 0:
+                    raise CdpError('Timeout while waiting for {0}.'.format(description))
+                self.__condition.wait(remaining)
+
+    def __read_messages(self, ws):
+        while True:
+            text = ws.recv()
+            with self.__condition:
+                if text is None:
+                    self.__closed = True
+                    self.__condition.notify_all()
+                    return
+                message = json.loads(text)
+                if 'id' in message:
+                    self.__responses[message['id']] = message
+                else:
+                    method, params = message.get('method'), message.get('params', {})
+                    if method == 'Debugger.paused':
+                        self.paused = params
+                    elif method == 'Debugger.resumed':
+                        self.paused = None
+                    self.events.append((method, params))
+                self.__condition.notify_all()
+
+    @staticmethod
+    def __get_value(result):
+        if result.get('exceptionDetails'):
+            details = result['exceptionDetails']
+            raise CdpError('Evaluation failed: {0}'.format(details.get('exception', {}).get('description', details)))
+        remote_object = result['result']
+        if 'value' in remote_object:
+            return remote_object['value']
+        return remote_object.get('description')
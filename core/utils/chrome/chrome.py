@@ -1,31 +1,45 @@
+# pylint: disable=broad-except
 import os
-from time import sleep
-
-from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
+import time
 
 from core.enums.os_type import OSType
 from core.log.log import Log
 from core.settings import Settings
 from core.utils.ci.jenkins import Jenkins
 from core.utils.file_utils import Folder
+from core.utils.json_utils import JsonUtils
+from core.utils.lazy_import import LazyModule
 from core.utils.process import Process
+from core.utils.wait import Wait
+
+webdriver = LazyModule('selenium.webdriver')
+webdriver_manager = LazyModule('webdriver_manager.chrome')
 
 
 class Chrome(object):
+    # Path of chromedriver is cached in this file (so `ChromeDriverManager().install()` is not called for each browser).
+    DRIVER_CACHE = os.path.join(Settings.CACHE_HOME, 'chromedriver.json')
+
+    # Cached chromedriver path is verified with `ChromeDriverManager().install()` when it is older (in seconds).
+    DRIVER_CACHE_MAX_AGE = 24 * 60 * 60
+
     driver = None
     implicitly_wait = None
 
     def __init__(self, kill_old=True, implicitly_wait=20):
         if kill_old:
             self.kill()
-        path = ChromeDriverManager().install()
         Log.info('Starting Google Chrome ...')
         profile_path = os.path.join(Settings.TEST_OUT_TEMP, 'chrome_profile')
-        Folder.clean(profile_path)
+        Folder.clean(profile_path, background=True)
         options = webdriver.ChromeOptions()
         options.add_argument('user-data-dir={0}'.format(profile_path))
-        self.driver = webdriver.Chrome(executable_path=path, chrome_options=options)
+        try:
+            self.driver = webdriver.Chrome(executable_path=Chrome.get_driver_path(), chrome_options=options)
+        except Exception as error:
+            # Cached chromedriver may not support Chrome (for example after Chrome update), so install it again
+            Log.info('Failed to start Google Chrome with cached chromedriver: {0}'.format(error))
+            self.driver = webdriver.Chrome(executable_path=Chrome.get_driver_path(update=True), chrome_options=options)
         self.implicitly_wait = implicitly_wait
         self.driver.implicitly_wait(self.implicitly_wait)
         self.driver.maximize_window()
@@ -36,6 +50,69 @@ class Chrome(object):
         self.driver.get(url)
         Log.info('Open url: ' + url)
 
+    @staticmethod
+    def get_driver_path(update=False):
+        """
+        Get path of chromedriver (cached in `DRIVER_CACHE` for `DRIVER_CACHE_MAX_AGE` seconds).
+        :param update: If True call `ChromeDriverManager().install()` even if cached path is available.
+        :return: Path of chromedriver binary.
+        """
+        path = None if update else Chrome.get_cached_driver_path()
+        if path is None:
+            path = webdriver_manager.ChromeDriverManager().install()
+            Folder.create(os.path.dirname(Chrome.DRIVER_CACHE))
+            JsonUtils.write(Chrome.DRIVER_CACHE, {'path': path, 'time': time.time()})
+        return path
+
+    @staticmethod
+    def get_cached_driver_path():
+        """
+        Get path of chromedriver from `DRIVER_CACHE`.
+        :return: Path of chromedriver or None if cache is missing, invalid or expired.
+        """
+        if not os.path.isfile(Chrome.DRIVER_CACHE):
+            return None
+        try:
+            cache = JsonUtils.read(Chrome.DRIVER_CACHE)
+            if time.time() - cache['time'] < Chrome.DRIVER_CACHE_MAX_AGE and os.path.isfile(cache['path']):
+                return cache['path']
+        except Exception as error:
+            Log.debug('Ignore invalid chromedriver cache: {0}'.format(error))
+        return None
+
+    def is_alive(self):
+        """
+        Check if browser and driver still respond.
+        """
+        if self.driver is None:
+            return False
+        try:
+            return len(self.driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def reset(self):
+        """
+        Reset browser state without restarting it: close extra tabs, clear storage and cookies, open blank page.
+        """
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+        try:
+            self.driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+        except Exception:
+            pass  # Storage is not available on some pages (for example `about:blank` or `chrome-devtools://`).
+        self.driver.delete_all_cookies()
+        # `delete_all_cookies` deletes only cookies of current domain, clear all if driver can send CDP commands.
+        execute_cdp_cmd = getattr(self.driver, 'execute_cdp_cmd', None)
+        if execute_cdp_cmd is not None:
+            execute_cdp_cmd('Network.clearBrowserCookies', {})
+        self.driver.get('about:blank')
+        self.driver.implicitly_wait(self.implicitly_wait)
+        Log.info('Reset Chrome browser.')
+
     def kill(self, force=Jenkins.is_ci()):
         """
         Kill Chrome browsers instance(s).
@@ -59,7 +136,7 @@ class Chrome(object):
 
     def get_absolute_center(self, element):
         self.focus()
-        sleep(1)
+        Wait.until(lambda: self.driver.execute_script('return document.hasFocus()'), timeout=1, period=0.1)
         rel_x = element.location['x']
         rel_y = element.location['y']
         nav_panel_height = self.driver.execute_script('return window.outerHeight - window.innerHeight;')
@@ -1,7 +1,6 @@
-from time import sleep
-
 import pyautogui
 from aenum import IntEnum
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -31,6 +30,8 @@ class ChromeDevTools(object):
     source_panel = None
     shadow_root_element_script = "return arguments[0].shadowRoot"
     shadow_inner_element_script = "return arguments[0].querySelector(arguments[1]).shadowRoot"
+    is_editing_script = "var e = document.deepActiveElement ? document.deepActiveElement() : document.activeElement;" \
+                        "return !!e && (e.isContentEditable || e.tagName === 'TEXTAREA' || e.tagName === 'INPUT');"
 
     def __init__(self, chrome, platform, tab=None):
         # Start Chrome and open debug url
@@ -61,6 +62,29 @@ class ChromeDevTools(object):
     def __get_shadow_element_in_shadow_dom(self, value, shadow_dom_root_element):
         return self.chrome.driver.execute_script(self.shadow_inner_element_script, shadow_dom_root_element, value)
 
+    def __wait(self, condition, timeout=1):
+        """
+        Wait until UI is ready after an action (timeout is max time, by default UI reacts within 1 second).
+        :param condition: Function that returns True when UI is ready (WebDriver errors are treated as not ready).
+        :param timeout: Timeout in seconds.
+        :return: True if UI is ready before timeout, otherwise False.
+        """
+
+        def check():
+            try:
+                return bool(condition())
+            except WebDriverException:
+                return False
+
+        self.chrome.driver.implicitly_wait(0)
+        try:
+            return Wait.until(check, timeout=timeout, period=0.1)
+        finally:
+            self.chrome.driver.implicitly_wait(self.chrome.implicitly_wait)
+
+    def __is_editing(self):
+        return self.chrome.driver.execute_script(self.is_editing_script)
+
     def __refresh_main_panel(self):
         content_panel_selector = "div[slot='insertion-point-main'][class='vbox flex-auto tabbed-pane']"
         content_holder = self.chrome.driver.find_element(By.CSS_SELECTOR, content_panel_selector)
@@ -74,7 +98,7 @@ class ChromeDevTools(object):
         if 'toolbar-state-on' in button.get_attribute("class"):
             Log.info('Expand dev tools main pannel.')
             button.click()
-            sleep(1)
+            self.__wait(lambda: 'toolbar-state-on' not in button.get_attribute("class"))
         else:
             Log.info('Dev tools main panel already expanded.')
 
@@ -106,7 +130,7 @@ class ChromeDevTools(object):
         Log.info('Navigate to {0}.'.format(str(tab)))
         element = self.main_panel.find_element(By.ID, str(tab))
         element.click()
-        sleep(1)
+        self.__wait(lambda: element.get_attribute('aria-selected') == 'true')
         self.__refresh_main_panel()
         if verify:
             if tab == ChromeDevToolsTabs.SOURCES:
@@ -127,41 +151,34 @@ class ChromeDevTools(object):
         :param file_name: Name of file.
         """
         self.chrome.focus()
-        sleep(1)
 
         # Double click to set focus
         panel = self.chrome.driver.find_element(By.ID, "sources-panel-sources-view")
         x, y = self.chrome.get_absolute_center(panel)
         pyautogui.click(x, y, 2, 0.05)
-        sleep(1)
+        self.__wait(lambda: self.chrome.driver.execute_script('return document.hasFocus()'))
         if Settings.HOST_OS == OSType.OSX:
             pyautogui.hotkey('command', 'p')
             # ActionChains(self.chrome.driver).send_keys(Keys.COMMAND, "p").perform()
         else:
             pyautogui.hotkey('ctrl', 'p')
-        sleep(1)
-        shadow_dom_element = self.chrome.driver.find_element(By.CSS_SELECTOR,
-                                                             "div[style='z-index: 3000;'][class='vbox flex-auto']")
+        popup_selector = "div[style='z-index: 3000;'][class='vbox flex-auto']"
+        self.__wait(lambda: self.chrome.driver.find_elements(By.CSS_SELECTOR, popup_selector))
+        shadow_dom_element = self.chrome.driver.find_element(By.CSS_SELECTOR, popup_selector)
         shadow_root = self.__expand_shadow_element(shadow_dom_element)
 
         popup = self.__get_shadow_element_in_shadow_dom(".vbox.flex-auto", shadow_root)
         search_box = popup.find_element(By.CSS_SELECTOR, "span > div > div")
-        search_box.click()
-        sleep(1)
-        search_box.clear()
-        sleep(1)
-        search_box.send_keys(file_name)
-        sleep(1)
-        search_box.click()
-        sleep(1)
-        search_box.clear()
-        sleep(1)
-        search_box.send_keys(file_name)
-        sleep(1)
-        search_box.click()
-        sleep(1)
+
+        # Type file name (retry once, because first keys might be lost while quick open dialog is loading)
+        for _ in range(2):
+            search_box.click()
+            search_box.clear()
+            search_box.send_keys(file_name)
+            if self.__wait(lambda: file_name in search_box.text, timeout=3):
+                break
         search_box.send_keys(Keys.ENTER)
-        sleep(1)
+        self.__wait(lambda: not self.chrome.driver.find_elements(By.CSS_SELECTOR, popup_selector))
 
     def breakpoint(self, line):
         """
@@ -174,8 +191,9 @@ class ChromeDevTools(object):
         lines = source.find_elements(By.CSS_SELECTOR, "div[class=\'CodeMirror-linenumber CodeMirror-gutter-elt\']")
         length = len(lines)
         assert len(lines) >= line, "Line {0} not found! Total lines of code: {1}".format(str(line), str(length))
+        breakpoints = len(source.find_elements(By.CSS_SELECTOR, ".cm-breakpoint"))
         lines[line - 1].click()
-        sleep(1)
+        self.__wait(lambda: len(source.find_elements(By.CSS_SELECTOR, ".cm-breakpoint")) != breakpoints)
         Log.info("Toggle breakpoint on line {0}".format(str(line)))
 
     def continue_debug(self):
@@ -187,7 +205,7 @@ class ChromeDevTools(object):
         button = debug_panel.find_element(By.CSS_SELECTOR, "button[aria-label='Pause script execution']")
         assert 'toolbar-state-on' in button.get_attribute("class"), "Continue button not enabled!"
         button.click()
-        sleep(1)
+        self.__wait(lambda: 'toolbar-state-on' not in button.get_attribute("class"))
 
     def __find_line_by_text(self, text):
         shadow_dom_element = self.chrome.driver.find_element(By.CSS_SELECTOR, "div[id='elements-content'] > div")
@@ -216,13 +234,12 @@ class ChromeDevTools(object):
         assert span is not None, "Failed to find element with text " + old_text
         x, y = self.chrome.get_absolute_center(span)
         pyautogui.click(x, y, clicks=3, interval=0.1)
-        sleep(1)
+        self.__wait(self.__is_editing)
         pyautogui.doubleClick(x, y)
-        sleep(1)
+        self.__wait(self.__is_editing)
         pyautogui.typewrite(new_text, interval=0.25)
-        sleep(1)
         pyautogui.press('enter')
-        sleep(1)
+        self.__wait(lambda: self.__find_line_by_text(text=new_text) is not None, timeout=2)
         Log.info('Replace "{0}" with "{1}".'.format(old_text, new_text))
 
     def doubleclick_line(self, text):
@@ -234,7 +251,7 @@ class ChromeDevTools(object):
         assert line is not None, "Failed to find line with text " + text
         x, y = self.chrome.get_absolute_center(line)
         pyautogui.doubleClick(x, y)
-        sleep(2)
+        self.__wait(self.__is_editing, timeout=2)
         Log.info('Double click line with text "{0}".'.format(text))
 
     def __clean_console(self):
@@ -245,7 +262,7 @@ class ChromeDevTools(object):
         root_element = self.__expand_shadow_element(root_holder)
         button = root_element.find_element(By.CSS_SELECTOR, "button[aria-label='Clear console']")
         button.click()
-        sleep(1)
+        self.__wait(lambda: not self.chrome.driver.find_elements(By.CSS_SELECTOR, ".console-message-wrapper"))
 
     def type_on_console(self, text, clear_console=True):
         """
@@ -258,7 +275,7 @@ class ChromeDevTools(object):
         console = self.chrome.driver.find_element(By.CSS_SELECTOR, "div[id='console-prompt']")
         actions = ActionChains(self.chrome.driver)
         actions.click(console).perform()
-        sleep(1)
+        self.__wait(self.__is_editing)
         for _ in range(1, 25):
             actions.send_keys(Keys.BACKSPACE).perform()
         actions.send_keys(text).perform()
@@ -279,7 +296,7 @@ class ChromeDevTools(object):
         if 'true' not in str(expander.get_attribute("aria-expanded")):
             Log.info('Expand watch expression bar.')
             expander.click()
-            sleep(2)
+            self.__wait(lambda: 'true' in str(expander.get_attribute("aria-expanded")), timeout=2)
 
         # Add expression
         tool_bar_holder = self.__expand_shadow_element(watch_bar_holder) \
@@ -287,13 +304,13 @@ class ChromeDevTools(object):
         tool_bar = self.__expand_shadow_element(tool_bar_holder)
         add_button = tool_bar.find_element(By.CSS_SELECTOR, "button[aria-label='Add expression']")
         add_button.click()
-        sleep(1)
+        self.__wait(self.__is_editing)
         for _ in range(1, 25):
             actions.send_keys(Keys.BACKSPACE).perform()
         actions.send_keys(expression).perform()
-        sleep(1)
         actions.send_keys(Keys.ENTER).perform()
-        sleep(3)
+        expected_text = expression if expected_result is None else expected_result
+        self.__wait(lambda: not self.__is_editing() and expected_text in watch_bar_holder.text, timeout=4)
         Log.info('Add watch expression: {0}'.format(expression))
 
         # Verify result
@@ -312,5 +329,5 @@ class ChromeDevTools(object):
         root = self.__expand_shadow_element(toolbar)
         button = root.find_element(By.CSS_SELECTOR, "button[aria-label='Clear']")
         button.click()
-        sleep(1)
+        self.__wait(lambda: not network.find_elements(By.CSS_SELECTOR, "tr.data-grid-data-grid-node.revealed"))
         Log.info("Clear Network tab.")
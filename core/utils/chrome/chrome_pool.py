@@ -0,0 +1,90 @@
+"""
+Pool of Chrome browser sessions.
+
+Starting Chrome (and chromedriver) is slow, so released sessions are reset (see `Chrome.reset`) and reused by next
+tests instead of killing them. Set CHROME_REUSE_SESSION=false to start new browser for each test.
+
+Usage:
+    self.chrome = ChromePool.acquire()
+    ...
+    ChromePool.release(self.chrome)
+"""
+# pylint: disable=broad-except
+import threading
+
+from core.log.log import Log
+from core.settings import Settings
+from core.utils.chrome.chrome import Chrome
+
+
+class ChromePool(object):
+    # Released sessions that can be reused.
+    IDLE = []
+
+    # Sessions acquired (and not released yet).
+    BUSY = []
+
+    __lock = threading.Lock()
+
+    @staticmethod
+    def acquire(implicitly_wait=20):
+        """
+        Get Chrome session (reuse idle session if available, otherwise start new browser).
+        :param implicitly_wait: Implicit wait of the driver (in seconds).
+        :return: Chrome object.
+        """
+        with ChromePool.__lock:
+            while ChromePool.IDLE:
+                chrome = ChromePool.IDLE.pop()
+                if chrome.is_alive():
+                    chrome.implicitly_wait = implicitly_wait
+                    chrome.driver.implicitly_wait(implicitly_wait)
+                    ChromePool.BUSY.append(chrome)
+                    Log.info('Reuse Google Chrome session.')
+                    return chrome
+                ChromePool.__kill(chrome)
+            # Kill old browsers only if none of them is in use
+            kill_old = not ChromePool.BUSY
+        chrome = Chrome(kill_old=kill_old, implicitly_wait=implicitly_wait)
+        with ChromePool.__lock:
+            ChromePool.BUSY.append(chrome)
+        return chrome
+
+    @staticmethod
+    def release(chrome):
+        """
+        Release Chrome session (it is reset and kept for next tests if `Settings.CHROME_REUSE_SESSION` is True).
+        Releasing session more than once (or None) is allowed and ignored.
+        :param chrome: Chrome object returned by `acquire`.
+        """
+        with ChromePool.__lock:
+            if chrome is None or chrome not in ChromePool.BUSY:
+                return
+            ChromePool.BUSY.remove(chrome)
+        if Settings.CHROME_REUSE_SESSION and chrome.is_alive():
+            try:
+                chrome.reset()
+                with ChromePool.__lock:
+                    ChromePool.IDLE.append(chrome)
+                return
+            except Exception as error:
+                Log.info('Failed to reset Google Chrome session: {0}'.format(error))
+        ChromePool.__kill(chrome)
+
+    @staticmethod
+    def kill():
+        """
+        Kill idle sessions (sessions in use are not touched).
+        """
+        with ChromePool.__lock:
+            idle = list(ChromePool.IDLE)
+            ChromePool.IDLE = []
+        for chrome in idle:
+            ChromePool.__kill(chrome)
+
+    @staticmethod
+    def __kill(chrome):
+        try:
+            chrome.kill(force=False)
+        except Exception as error:
+            Log.info('Failed to kill Google Chrome session: {0}'.format(error))
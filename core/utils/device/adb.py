@@ -1,3 +1,4 @@
+# pylint: disable=too-many-public-methods
 import logging
 import os
 import re
@@ -10,20 +11,25 @@ from core.utils.file_utils import File
 from core.utils.process import Process
 from core.utils.run import run
 from core.utils.version import Version
+from core.utils.wait import Wait
 
 ANDROID_HOME = os.environ.get('ANDROID_HOME')
-ADB_PATH = os.path.join(ANDROID_HOME, 'platform-tools', 'adb')
 
 
 class Adb(object):
     @staticmethod
     def run_adb_command(command, device_id=None, wait=True, timeout=60, fail_safe=False, log_level=logging.DEBUG):
         if device_id is None:
-            command = '{0} {1}'.format(ADB_PATH, command)
+            command = '{0} {1}'.format(Adb.get_adb_path(), command)
         else:
-            command = '{0} -s {1} {2}'.format(ADB_PATH, device_id, command)
+            command = '{0} -s {1} {2}'.format(Adb.get_adb_path(), device_id, command)
         return run(cmd=command, wait=wait, timeout=timeout, fail_safe=fail_safe, log_level=log_level)
 
+    @staticmethod
+    def get_adb_path():
+        assert ANDROID_HOME is not None, 'ANDROID_HOME environment variable is not set.'
+        return os.path.join(ANDROID_HOME, 'platform-tools', 'adb')
+
     @staticmethod
     def get_ids(include_emulators=False):
         """
@@ -69,11 +75,15 @@ class Adb(object):
         aapt_executable = 'aapt'
         if Settings.HOST_OS is OSType.WINDOWS:
             aapt_executable += '.exe'
+        assert ANDROID_HOME is not None, 'ANDROID_HOME environment variable is not set.'
         base_path = os.path.join(ANDROID_HOME, 'build-tools')
-        return File.find(base_path=base_path, file_name=aapt_executable, exact_match=True)
+        return File.find(base_path=base_path, file_name=aapt_executable, exact_match=True, index=True)
 
     @staticmethod
     def restart():
+        if ANDROID_HOME is None:
+            Log.info('ANDROID_HOME is not set, skip adb restart.')
+            return
         Log.info("Restart adb.")
         Adb.run_adb_command('kill-server')
         Process.kill(proc_name='adb')
@@ -116,7 +126,7 @@ class Adb(object):
         start_time = time.time()
         end_time = start_time + timeout
         while not booted:
-            time.sleep(check_interval)
+            Wait.sleep(check_interval)
             booted = Adb.is_running(device_id=device_id)
             if (booted is True) or (time.time() > end_time):
                 break
@@ -146,9 +156,11 @@ class Adb(object):
         Adb.run_adb_command(command='shell rm /sdcard/window_dump.xml', device_id=device_id)
         result = Adb.run_adb_command(command='shell uiautomator dump', device_id=device_id)
         if 'UI hierchary dumped to' in result.output:
-            time.sleep(1)
-            Adb.pull(device_id=device_id, source='/sdcard/window_dump.xml', target=temp_file)
-            if File.exists(temp_file):
+            def pull():
+                Adb.pull(device_id=device_id, source='/sdcard/window_dump.xml', target=temp_file)
+                return File.exists(temp_file)
+
+            if Wait.until(pull, timeout=5, period=0.5):
                 result = File.read(temp_file)
                 File.delete(temp_file)
                 return result
@@ -310,6 +322,104 @@ class Adb(object):
         assert 'Events injected: 1' in output, 'Failed to start {0}.'.format(app_id)
         Log.info('{0} started successfully.'.format(app_id))
 
+    @staticmethod
+    def start_application_with_timing(device_id, app_id, activity='com.tns.NativeScriptActivity'):
+        """
+        Start application and wait until it is launched (with `am start -W`).
+        :param device_id: Device id.
+        :param app_id: App id.
+        :param activity: Name of launcher activity.
+        :return: dict with launch times in milliseconds (`ThisTime`, `TotalTime` and `WaitTime`).
+        """
+        command = 'shell am start -W -n {0}/{1}'.format(app_id, activity)
+        output = Adb.run_adb_command(command=command, device_id=device_id, wait=True).output
+        times = Adb.parse_start_times(output)
+        assert 'TotalTime' in times, 'Failed to start {0}. Output: {1}'.format(app_id, output)
+        Log.info('{0} started in {1} ms.'.format(app_id, times['TotalTime']))
+        return times
+
+    @staticmethod
+    def parse_start_times(output):
+        """
+        Parse output of `am start -W`.
+        :param output: Output of `am start -W` command.
+        :return: dict with launch times in milliseconds (only times that are present in the output).
+        """
+        times = {}
+        for key, value in re.findall(r'^\s*(ThisTime|TotalTime|WaitTime):\s*(\d+)', output, re.MULTILINE):
+            times[key] = int(value)
+        return times
+
+    @staticmethod
+    def parse_displayed_times(logcat, app_id):
+        """
+        Parse `Displayed` events of ActivityManager from logcat.
+        Example: `I/ActivityManager( 1234): Displayed org.nativescript.TestApp/com.tns.NativeScriptActivity: +1s234ms`
+        :param logcat: Logcat as string.
+        :param app_id: App id.
+        :return: List of times in milliseconds.
+        """
+        times = []
+        pattern = r'Displayed {0}/\S+: \+(?:(\d+)s)?(\d+)ms'.format(re.escape(app_id))
+        for seconds, milliseconds in re.findall(pattern, logcat):
+            times.append(int(seconds or 0) * 1000 + int(milliseconds))
+        return times
+
+    @staticmethod
+    def get_memory_info(device_id, app_id):
+        """
+        Get memory usage of running application (`dumpsys meminfo` and `/proc/<pid>/status`).
+        :param device_id: Device id.
+        :param app_id: App id.
+        :return: dict with memory info in KB (see `parse_meminfo` and `parse_proc_status`), empty if app is not running.
+        """
+        output = Adb.run_adb_command(command='shell dumpsys meminfo {0}'.format(app_id), device_id=device_id,
+                                     wait=True, fail_safe=True).output
+        info = Adb.parse_meminfo(output)
+        if 'pid' in info:
+            command = 'shell cat /proc/{0}/status'.format(info['pid'])
+            output = Adb.run_adb_command(command=command, device_id=device_id, wait=True, fail_safe=True).output
+            info.update(Adb.parse_proc_status(output))
+        return info
+
+    @staticmethod
+    def parse_meminfo(output):
+        """
+        Parse output of `dumpsys meminfo <package>`.
+        :param output: Output of `dumpsys meminfo <package>` command.
+        :return: dict with `pid` and `pss`, `java_heap`, `native_heap` (in KB), empty if app is not running.
+        """
+        info = {}
+        match = re.search(r'MEMINFO in pid (\d+)', output)
+        if match is None:
+            return info
+        info['pid'] = int(match.group(1))
+        # Take values from 'App Summary' section, older Android versions have only the table with PSS values.
+        patterns = {'pss': [r'TOTAL PSS:\s+(\d+)', r'^\s*TOTAL:\s+(\d+)', r'^\s*TOTAL\s+(\d+)'],
+                    'java_heap': [r'Java Heap:\s+(\d+)', r'^\s*Dalvik Heap\s+(\d+)'],
+                    'native_heap': [r'Native Heap:\s+(\d+)', r'^\s*Native Heap\s+(\d+)']}
+        for key, key_patterns in patterns.items():
+            for pattern in key_patterns:
+                match = re.search(pattern, output, re.MULTILINE)
+                if match is not None:
+                    info[key] = int(match.group(1))
+                    break
+        return info
+
+    @staticmethod
+    def parse_proc_status(output):
+        """
+        Parse content of `/proc/<pid>/status`.
+        :param output: Content of `/proc/<pid>/status`.
+        :return: dict with `vm_rss`, `vm_hwm` (in KB) and `threads`.
+        """
+        info = {}
+        for key, name in [('vm_rss', 'VmRSS'), ('vm_hwm', 'VmHWM'), ('threads', 'Threads')]:
+            match = re.search(r'^{0}:\s+(\d+)'.format(name), output, re.MULTILINE)
+            if match is not None:
+                info[key] = int(match.group(1))
+        return info
+
     @staticmethod
     def stop_application(device_id, app_id):
         """
@@ -378,4 +488,5 @@ class Adb(object):
             command='shell kill {0}'.format(pid),
             wait=True, device_id=device_id)
         assert result.output == "", "Process {0} not killed! Logs:{1}".format(process_name, result.output)
-        time.sleep(5)
+        pids = set(pid.split())
+        Wait.until(lambda: not pids & set(Adb.get_process_pid(device_id, process_name).split()), timeout=5, period=0.5)
@@ -94,7 +94,7 @@ class Device(object):
                 break
             else:
                 Log.info(error_msg + ' Waiting ...')
-                time.sleep(retry_delay)
+                Wait.sleep(retry_delay)
         if not found:
             text = self.get_text()
             Log.info('Current text: {0}{1}'.format(os.linesep, text))
@@ -158,7 +158,7 @@ class Device(object):
                     diff_image = result[2]
                     error_msg += ' Diff is {0} %.'.format(result[1])
                     Log.info(error_msg)
-                    time.sleep(3)
+                    Wait.sleep(1)
             if not match:
                 if diff_image is not None:
                     diff_image_path = expected_image.replace('.png', '_diff.png')
@@ -167,10 +167,31 @@ class Device(object):
         else:
             Log.info('Expected image not found!')
             Log.info('Actual image will be saved as expected: ' + expected_image)
-            time.sleep(timeout)
-            self.get_screen(path=expected_image, log_level=logging.DEBUG)
+            self.wait_for_stable_screen(path=expected_image, timeout=timeout)
             assert False, "Expected image not found!"
 
+    def wait_for_stable_screen(self, path, timeout=30, period=1):
+        """
+        Wait until screen is not changed between two screenshots and save it.
+        :param path: Path to image that will be saved.
+        :param timeout: Timeout in seconds.
+        :param period: Time between screenshots in seconds.
+        :return: True if screen is stable before timeout, otherwise False (last screen is saved anyway).
+        """
+        previous_image = path.replace('.png', '_previous.png')
+        self.get_screen(path=previous_image, log_level=logging.DEBUG)
+
+        def is_stable():
+            self.get_screen(path=path, log_level=logging.DEBUG)
+            if ImageUtils.image_match(actual_image=path, expected_image=previous_image, tolerance=0)[0]:
+                return True
+            File.copy(source=path, target=previous_image)
+            return False
+
+        stable = Wait.until(is_stable, timeout=timeout, period=period)
+        File.delete(path=previous_image)
+        return stable
+
     def get_pixels_by_color(self, color):
         image_path = os.path.join(Settings.TEST_OUT_IMAGES, self.name,
                                   'screen_{0}.png'.format(int(time.time() * 1000)))
@@ -196,7 +217,7 @@ class Device(object):
                 break
             else:
                 Log.info(err_msg)
-                time.sleep(1)
+                Wait.sleep(1)
         assert found, err_msg
 
     def get_main_color(self):
@@ -0,0 +1,95 @@
+"""
+Sample memory usage of application while test scenario runs.
+"""
+import threading
+import time
+
+from core.log.log import Log
+from core.utils.device.adb import Adb
+
+
+class MemorySampler(object):
+    """
+    Poll memory info of application in background thread.
+
+    Usage:
+        with MemorySampler(device_id=emu.id, app_id=app_id) as sampler:
+            # Run test scenario
+        summary = sampler.get_summary()
+    """
+
+    def __init__(self, device_id=None, app_id=None, interval=1.0, read=None):
+        """
+        :param device_id: Device id.
+        :param app_id: App id.
+        :param interval: Interval between samples in seconds.
+        :param read: Function that returns memory info as dict (by default `Adb.get_memory_info`).
+        """
+        if read is None:
+            def read():
+                return Adb.get_memory_info(device_id=device_id, app_id=app_id)
+        self.read = read
+        self.interval = interval
+        self.samples = []
+        self.__stop_event = threading.Event()
+        self.__thread = None
+        self.__start_time = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        self.samples = []
+        self.__stop_event.clear()
+        self.__start_time = time.time()
+        self.__thread = threading.Thread(target=self.__sample)
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """
+        Stop sampling (sample is taken one more time, so there is at least one sample).
+        """
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        self.__take_sample()
+        Log.info('Memory samples: {0}, summary: {1}'.format(len(self.samples), self.get_summary()))
+
+    def get_series(self, key):
+        """
+        Get values of specific key.
+        :param key: Key of memory info (for example `pss`).
+        :return: List of (seconds since start, value) tuples.
+        """
+        return [(offset, info[key]) for offset, info in self.samples if key in info]
+
+    def get_summary(self):
+        """
+        Get peak and mean of each key.
+        :return: dict {key: {'peak': value, 'mean': value}}.
+        """
+        summary = {}
+        keys = set()
+        for _, info in self.samples:
+            keys.update(info.keys())
+        keys.discard('pid')
+        for key in sorted(keys):
+            values = [value for _, value in self.get_series(key)]
+            summary[key] = {'peak': max(values), 'mean': float(sum(values)) / len(values)}
+        return summary
+
+    def __sample(self):
+        while not self.__stop_event.is_set():
+            self.__take_sample()
+            self.__stop_event.wait(self.interval)
+
+    def __take_sample(self):
+        info = self.read()
+        if info:
+            self.samples.append((time.time() - self.__start_time, info))
@@ -1,10 +1,10 @@
 # pylint: disable=import-error
 # pylint: disable=broad-except
 # pylint: disable=too-many-nested-blocks
-from time import sleep
-
 import atomac
 
+from core.utils.wait import Wait
+
 
 # noinspection PyBroadException
 class SimAuto(object):
@@ -26,7 +26,7 @@ class SimAuto(object):
                 if device_info.name in name:
                     window = simulator.findFirstR(AXTitle=name)
                     window.activate()
-                    sleep(1)
+                    Wait.until(lambda: window.AXMain, timeout=1, period=0.1)
                     element = window.findFirstR(AXTitle=text)
                     if element is not None:
                         return element
@@ -39,6 +39,25 @@ class SimAuto(object):
         except Exception:
             return None
 
+    @staticmethod
+    def wait_for_stable_position(device_info, text, timeout=5, period=0.2):
+        """
+        Wait until element stops moving (for example until animation of alert is finished).
+        :param device_info: Device info.
+        :param text: Text of the element.
+        :param timeout: Timeout in seconds.
+        :param period: Interval between checks in seconds.
+        :return: True if position of the element is the same in two subsequent checks.
+        """
+        positions = []
+
+        def is_stable():
+            element = SimAuto.find(device_info=device_info, text=text)
+            positions.append(None if element is None else tuple(element.AXPosition))
+            return len(positions) > 1 and positions[-1] is not None and positions[-1] == positions[-2]
+
+        return Wait.until(is_stable, timeout=timeout, period=period)
+
     @staticmethod
     def is_text_visible(device_info, text):
         element = SimAuto.find(device_info=device_info, text=text)
@@ -6,6 +6,7 @@ from core.log.log import Log
 from core.utils.file_utils import File
 from core.utils.process import Process
 from core.utils.run import run
+from core.utils.wait import Wait
 from core.utils.xcode import Xcode
 
 
@@ -69,7 +70,7 @@ class Simctl(object):
         start_time = time.time()
         end_time = start_time + timeout
         while not booted:
-            time.sleep(2)
+            Wait.sleep(2)
             booted = Simctl.is_running(simulator_info)
             if booted or time.time() > end_time:
                 return booted
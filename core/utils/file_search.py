@@ -0,0 +1,155 @@
+"""
+File search (breadth-first, with exclude patterns and optional persistent index).
+"""
+import fnmatch
+import hashlib
+import json
+import os
+
+from core.log.log import Log
+from core.settings import Settings
+
+
+class FileSearch(object):
+    @staticmethod
+    def walk(base_path, excludes=None, followlinks=False):
+        """
+        Walk folder breadth-first (files closer to the root are returned first).
+        :param base_path: Base path.
+        :param excludes: List of patterns (relative to base path) for folders that should be skipped,
+                         for example ['node_modules', 'platforms/*/build'].
+        :param followlinks: If true walk into symlinks to folders (each real folder is visited only once).
+        :return: Generator of (depth, folder, list of file names) tuples.
+        """
+        visited = set()
+        level = [base_path]
+        depth = 0
+        while level:
+            next_level = []
+            for folder in sorted(level):
+                if followlinks:
+                    real_path = os.path.realpath(folder)
+                    if real_path in visited:
+                        continue
+                    visited.add(real_path)
+                try:
+                    names = sorted(os.listdir(folder))
+                except OSError:
+                    continue
+                files = []
+                for name in names:
+                    path = os.path.join(folder, name)
+                    if os.path.isdir(path):
+                        if (followlinks or not os.path.islink(path)) and \
+                                not FileSearch.is_excluded(base_path, path, excludes):
+                            next_level.append(path)
+                    else:
+                        files.append(name)
+                yield depth, folder, files
+            level = next_level
+            depth += 1
+
+    @staticmethod
+    def is_excluded(base_path, path, excludes):
+        """
+        Check if path matches any of the exclude patterns.
+        Patterns without `/` are matched against the name of the folder, other patterns against relative path.
+        """
+        if not excludes:
+            return False
+        relative_path = os.path.relpath(path, base_path).replace(os.sep, '/')
+        name = os.path.basename(path)
+        for pattern in excludes:
+            if fnmatch.fnmatch(relative_path if '/' in pattern else name, pattern):
+                return True
+        return False
+
+    @staticmethod
+    def find(base_path, match, excludes=None, followlinks=False, max_results=None, index=False):
+        """
+        Find files.
+        :param base_path: Base path.
+        :param match: Function that accepts file name and returns True if file matches.
+        :param excludes: List of exclude patterns (see `walk`).
+        :param followlinks: If true walk into symlinks to folders.
+        :param max_results: Stop search when at least `max_results` matches are found (all matches on the same depth
+                            are returned, so results are always the closest to the root).
+        :param index: If true use persistent index of the folder (use it only for trees that are not modified often,
+                      for example Android SDK). Index is rebuilt when top level folders change or file is missing.
+        :return: List of paths ordered by depth and length of the path.
+        """
+        if index:
+            matches = FileSearch.__find_in_index(base_path, match, excludes, followlinks, max_results)
+            if matches is not None:
+                return matches
+        matches = []
+        current_depth = 0
+        for depth, folder, files in FileSearch.walk(base_path, excludes=excludes, followlinks=followlinks):
+            if depth != current_depth:
+                if max_results is not None and len(matches) >= max_results:
+                    break
+                current_depth = depth
+            for name in files:
+                if match(name):
+                    matches.append((depth, os.path.join(folder, name)))
+        matches.sort(key=lambda m: (m[0], len(m[1]), m[1]))
+        return [path for _, path in matches]
+
+    @staticmethod
+    def get_index_file(base_path, excludes=None, followlinks=False):
+        key = json.dumps([os.path.abspath(base_path), excludes, followlinks])
+        return os.path.join(Settings.CACHE_HOME, 'file_index',
+                            hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    @staticmethod
+    def __get_state(base_path):
+        """
+        Get mtime of base path and its sub-folders (changed when items are added or removed).
+        """
+        state = {}
+        for path in [base_path] + [os.path.join(base_path, name) for name in sorted(os.listdir(base_path))]:
+            if os.path.isdir(path):
+                state[os.path.basename(path)] = os.stat(path).st_mtime
+        return state
+
+    @staticmethod
+    def __find_in_index(base_path, match, excludes, followlinks, max_results):
+        if not os.path.isdir(base_path):
+            return None
+        index_file = FileSearch.get_index_file(base_path, excludes, followlinks)
+        state = FileSearch.__get_state(base_path)
+        index = None
+        if os.path.isfile(index_file):
+            try:
+                with open(index_file) as json_file:
+                    index = json.load(json_file)
+            except ValueError:
+                index = None
+        if index is None or index['state'] != state:
+            Log.debug('Build file index of {0}'.format(base_path))
+            files = []
+            for depth, folder, names in FileSearch.walk(base_path, excludes=excludes, followlinks=followlinks):
+                files.extend([depth, os.path.relpath(os.path.join(folder, name), base_path)] for name in names)
+            files.sort(key=lambda f: (f[0], len(f[1]), f[1]))
+            index = {'state': state, 'files': files}
+            if not os.path.isdir(os.path.dirname(index_file)):
+                os.makedirs(os.path.dirname(index_file))
+            with open(index_file, 'w') as json_file:
+                json.dump(index, json_file)
+
+        matches = []
+        current_depth = 0
+        for depth, relative_path in index['files']:
+            if depth != current_depth:
+                if max_results is not None and len(matches) >= max_results:
+                    break
+                current_depth = depth
+            if match(os.path.basename(relative_path)):
+                path = os.path.join(base_path, relative_path)
+                if not os.path.exists(path):
+                    # Index is outdated (file deleted deeper in the tree), so search without the index.
+                    Log.debug('File index of {0} is outdated.'.format(base_path))
+                    os.remove(index_file)
+                    return None
+                matches.append(path)
+        return matches
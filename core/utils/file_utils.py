@@ -6,25 +6,69 @@ File and Folder utils.
 # pylint: disable=broad-except
 # pylint: disable=no-name-in-module
 # pylint: disable=import-error
+import atexit
+import ctypes
+import ctypes.util
 import errno
 import fnmatch
+import hashlib
 import os
 import shutil
 import stat
 import tarfile
+import threading
+import uuid
 import zipfile
+from multiprocessing.pool import ThreadPool
 
 from core.base_test.test_context import TestContext
 from core.enums.os_type import OSType
 from core.log.log import Log
 from core.settings import Settings
+from core.utils.file_search import FileSearch
 from core.utils.process import Process
 
+try:
+    import queue
+except ImportError:
+    # Python 2
+    import Queue as queue
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        # Python 2 with scandir package
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+
+# ioctl request that clones file content on Linux (btrfs, xfs with reflink=1, overlayfs on top of them).
+FICLONE = 0x40049409
+
 
 # noinspection PyBroadException
 class Folder(object):
+    __trash_queue = None
+    __trash_lock = threading.Lock()
+
     @staticmethod
-    def clean(folder):
+    def clean(folder, background=False):
+        """
+        Delete folder.
+        :param folder: Folder path.
+        :param background: If True move folder to `Settings.TRASH_HOME` and delete it in background thread
+                           (folder is deleted synchronously if it can not be moved, for example it is on another disk).
+                           Use `Folder.flush` to wait until folders in trash are deleted.
+        """
+        if background and Folder.exists(folder=folder) and Folder.__move_to_trash(folder):
+            return
         if Folder.exists(folder=folder):
             Log.debug("Clean folder: " + folder)
             try:
@@ -46,6 +90,59 @@ class Folder(object):
                     Process.kill_by_handle(folder)
                     os.system('rm -rf {0}'.format(folder))
 
+    @staticmethod
+    def flush():
+        """
+        Wait until folders moved to trash by `Folder.clean(folder, background=True)` are deleted.
+        """
+        if Folder.__trash_queue is not None:
+            Folder.__trash_queue.join()
+
+    @staticmethod
+    def __move_to_trash(folder):
+        folder = os.path.abspath(folder)
+        trash = os.path.abspath(Settings.TRASH_HOME)
+        if (trash + os.sep).startswith(folder + os.sep):
+            return False
+        Folder.create(trash)
+        if os.stat(trash).st_dev != os.stat(folder).st_dev:
+            return False
+        trash_queue = Folder.__get_trash_queue()
+        trash_path = os.path.join(trash, '{0}-{1}'.format(os.path.basename(folder), uuid.uuid4().hex))
+        try:
+            os.rename(folder, trash_path)
+        except OSError as error:
+            Log.debug('Failed to move {0} to trash: {1}'.format(folder, error))
+            return False
+        Log.debug('Clean folder (in background): ' + folder)
+        trash_queue.put(trash_path)
+        return True
+
+    @staticmethod
+    def __get_trash_queue():
+        with Folder.__trash_lock:
+            if Folder.__trash_queue is None:
+                Folder.__trash_queue = queue.Queue()
+                # Delete also folders left in trash by previous (killed) test runs.
+                for name in os.listdir(Settings.TRASH_HOME):
+                    Folder.__trash_queue.put(os.path.join(Settings.TRASH_HOME, name))
+                thread = threading.Thread(target=Folder.__empty_trash)
+                thread.daemon = True
+                thread.start()
+                atexit.register(Folder.flush)
+        return Folder.__trash_queue
+
+    @staticmethod
+    def __empty_trash():
+        while True:
+            path = Folder.__trash_queue.get()
+            try:
+                Folder.clean(path)
+            except Exception as error:
+                Log.debug('Failed to delete {0}: {1}'.format(path, error))
+            finally:
+                Folder.__trash_queue.task_done()
+
     @staticmethod
     def exists(folder):
         return os.path.isdir(folder)
@@ -64,18 +161,22 @@ class Folder(object):
                 raise
 
     @staticmethod
-    def copy(source, target, clean_target=True, only_files=False):
+    def copy(source, target, clean_target=True, only_files=False, clone=False, shared=None):
         """
         Copy folders.
         :param source: Source folder.
         :param target: Target folder.
         :param clean_target: If True clean target folder before copy.
         :param only_files: If True only the files from source folder are copied to target folder.
+        :param clone: If True clone the folder (see `Folder.clone`), use it for copies of app fixtures.
+        :param shared: Patterns of folders that can be hard linked when folder is cloned (see `Folder.clone`).
         """
         if clean_target:
             Folder.clean(folder=target)
         Log.info('Copy {0} to {1}'.format(source, target))
-        if only_files is True:
+        if clone and Folder.exists(source):
+            Folder.clone(source=source, target=target, shared=shared)
+        elif only_files is True:
             files = os.listdir(source)
 
             for f in files:
@@ -90,20 +191,164 @@ class Folder(object):
                 else:
                     raise
 
+    # Folders with files that are not modified by tests, so they can be hard linked when folder is cloned.
+    SHARED_FOLDERS = ['node_modules']
+
+    @staticmethod
+    def clone(source, target, shared=None, workers=8):
+        """
+        Clone folder (cheaper than copy for big folders like apps with node_modules).
+        Each file is cloned with reflink (copy-on-write) if file system supports it, otherwise files in shared folders
+        are hard linked and other files are copied (in parallel). Symlinks are copied as symlinks.
+        Notice: Hard linked files share content with source folder, `File.write` and `File.replace` break the link
+        before file is modified, but other tools may write through it (use `File.is_shared` to check files).
+        :param source: Source folder.
+        :param target: Target folder (files that already exist are overwritten).
+        :param shared: List of patterns for shared folders (by default `Folder.SHARED_FOLDERS`), see `FileSearch`.
+        :param workers: Number of threads used to copy files.
+        :return: dict with count of files per method {'reflink': count, 'link': count, 'copy': count}.
+        """
+        if shared is None:
+            shared = Folder.SHARED_FOLDERS
+        files = []
+        for root, dirs, names in os.walk(source):
+            target_root = os.path.join(target, os.path.relpath(root, source))
+            Folder.create(target_root)
+            is_shared = Folder.__is_shared(source, root, shared)
+            for name in dirs + names:
+                path = os.path.join(root, name)
+                if os.path.islink(path):
+                    target_path = os.path.join(target_root, name)
+                    if os.path.lexists(target_path):
+                        os.remove(target_path)
+                    os.symlink(os.readlink(path), target_path)
+                elif name in names:
+                    files.append((path, os.path.join(target_root, name), is_shared))
+            # Symlinks to folders are copied as symlinks, so do not walk into them.
+            dirs[:] = [name for name in dirs if not os.path.islink(os.path.join(root, name))]
+
+        state = {'reflink': True}
+        pool = ThreadPool(workers)
+        try:
+            methods = pool.map(lambda item: Folder.__clone_file(item[0], item[1], item[2], state), files)
+        finally:
+            pool.close()
+            pool.join()
+        result = dict((method, methods.count(method)) for method in ['reflink', 'link', 'copy'])
+        Log.debug('Clone {0} to {1}: {2}'.format(source, target, result))
+        return result
+
+    @staticmethod
+    def __is_shared(base_path, folder, shared):
+        """
+        Check if folder or any of its parents (up to base path) matches patterns of shared folders.
+        """
+        while folder != base_path and folder.startswith(base_path):
+            if FileSearch.is_excluded(base_path, folder, shared):
+                return True
+            folder = os.path.dirname(folder)
+        return False
+
     @staticmethod
-    def get_size(folder):
+    def __clone_file(source, target, shared, state):
+        """
+        Clone single file.
+        :param state: State shared by all files of the clone (reflink is not tried again if it is not supported).
+        :return: Method used to clone the file ('reflink', 'link' or 'copy').
+        """
+        if os.path.lexists(target):
+            os.remove(target)
+        if state['reflink']:
+            if File.reflink(source, target):
+                shutil.copystat(source, target)
+                return 'reflink'
+            state['reflink'] = False
+        if shared:
+            try:
+                os.link(source, target)
+                return 'link'
+            except (OSError, AttributeError):
+                pass
+        shutil.copy2(source, target)
+        return 'copy'
+
+    # Sizes of folders: {path: (mtime of folder, size of files in folder, list of sub-folders)}
+    SIZE_CACHE = {}
+
+    @staticmethod
+    def get_size(folder, workers=1, cache=False):
         """
         Get folder size in bytes.
         :param folder: Folder path.
+        :param workers: Number of threads (if bigger than 1 top level sub-folders are processed in parallel).
+        :param cache: If true reuse results for folders not modified since last call (compared by mtime of folder).
+        Notice: mtime of folder changes when files are added, removed or renamed, but not when file is edited in place,
+        so do not use cache for folders where files are edited (it is OK for node_modules and build outputs).
         :return: Size in bytes.
         """
+        if scandir is None:
+            total_size = 0
+            for dirpath, dirnames, filenames in os.walk(folder):
+                for file_name in filenames:
+                    file_path = os.path.join(dirpath, file_name)
+                    total_size += os.path.getsize(file_path)
+            return total_size
+
+        files_size, sub_folders = Folder.__scan(folder=folder, cache=cache)
+        if workers > 1 and len(sub_folders) > 1:
+            pool = ThreadPool(min(workers, len(sub_folders)))
+            try:
+                sizes = pool.map(lambda sub_folder: Folder.__get_tree_size(sub_folder, cache), sub_folders)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            sizes = [Folder.__get_tree_size(sub_folder, cache) for sub_folder in sub_folders]
+        return files_size + sum(sizes)
+
+    @staticmethod
+    def __get_tree_size(folder, cache):
         total_size = 0
-        for dirpath, dirnames, filenames in os.walk(folder):
-            for file_name in filenames:
-                file_path = os.path.join(dirpath, file_name)
-                total_size += os.path.getsize(file_path)
+        folders = [folder]
+        while folders:
+            files_size, sub_folders = Folder.__scan(folder=folders.pop(), cache=cache)
+            total_size += files_size
+            folders.extend(sub_folders)
         return total_size
 
+    @staticmethod
+    def __scan(folder, cache):
+        """
+        Get size of files in folder (not recursive) and list of sub-folders.
+        Symlinks to files are followed and symlinks to folders are skipped (same as `os.walk` + `os.path.getsize`).
+        """
+        mtime = None
+        if cache:
+            try:
+                mtime = os.stat(folder).st_mtime
+            except OSError:
+                return 0, []
+            cached = Folder.SIZE_CACHE.get(folder)
+            if cached is not None and cached[0] == mtime:
+                return cached[1], cached[2]
+        files_size = 0
+        sub_folders = []
+        try:
+            entries = list(scandir(folder))
+        except OSError:
+            return 0, []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    sub_folders.append(entry.path)
+                elif entry.is_file():
+                    files_size += entry.stat().st_size
+            except OSError:
+                Log.debug('Failed to get size of ' + entry.path)
+        if cache:
+            Folder.SIZE_CACHE[folder] = (mtime, files_size, sub_folders)
+        return files_size, sub_folders
+
 
 # noinspection PyBroadException,PyArgumentList, PyUnresolvedReferences
 class File(object):
@@ -122,7 +367,23 @@ class File(object):
             raise IOError("{0} not found!".format(path))
 
     @staticmethod
-    def write(path, text):
+    def write(path, text, atomic=False):
+        """
+        Write text to file.
+        :param path: File path.
+        :param text: Text.
+        :param atomic: If True write text to temp file and rename it to path (watchers see single change of the file).
+        """
+        if atomic:
+            temp_path = File.__get_temp_path(path)
+            File.write(path=temp_path, text=text)
+            if File.exists(path):
+                shutil.copymode(path, temp_path)
+                if Settings.HOST_OS == OSType.WINDOWS:
+                    os.remove(path)
+            os.rename(temp_path, path)
+            return
+        File.unshare(path)
         if Settings.PYTHON_VERSION < 3:
             with open(path, 'w+') as text_file:
                 text_file.write(text)
@@ -132,6 +393,7 @@ class File(object):
 
     @staticmethod
     def append(path, text):
+        File.unshare(path)
         if Settings.PYTHON_VERSION < 3:
             with open(path, 'a') as text_file:
                 text_file.write(text)
@@ -159,39 +421,179 @@ class File(object):
         else:
             Log.debug('Skip replace. Text "{0}" do not exists in {1}.'.format(old_string, path))
 
+    @staticmethod
+    def replace_all(edits, fail_safe=False, backup_files=False):
+        """
+        Apply many replacements (in one read and one atomic write per file).
+        :param edits: List of (path, old string, new string) tuples, edits of same file are applied in order.
+        :param fail_safe: If False assert each old string exists (in content after previous edits of the file).
+        :param backup_files: If True backup files before they are modified.
+        :return: List of modified files.
+        """
+        files = []
+        file_edits = {}
+        for path, old_string, new_string in edits:
+            if path not in file_edits:
+                files.append(path)
+                file_edits[path] = []
+            file_edits[path].append((old_string, new_string))
+        modified = []
+        for path in files:
+            content = File.read(path=path)
+            new_content = content
+            for old_string, new_string in file_edits[path]:
+                old_text_exists = old_string in new_content
+                if not fail_safe:
+                    assert old_text_exists, 'Can not find "{0}" in {1}'.format(old_string, path)
+                if old_text_exists:
+                    new_content = new_content.replace(old_string, new_string)
+                    Log.debug('Replace "{0}" with "{1}" in {2}'.format(old_string, new_string, path))
+                else:
+                    Log.debug('Skip replace. Text "{0}" do not exists in {1}.'.format(old_string, path))
+            if new_content != content:
+                if backup_files:
+                    File.__back_up_files(path)
+                File.write(path=path, text=new_content, atomic=True)
+                modified.append(path)
+                Log.info('Replace content of {0} ({1} edits).'.format(path, len(file_edits[path])))
+        return modified
+
     @staticmethod
     def exists(path):
         return os.path.isfile(path)
 
+    @staticmethod
+    def __get_temp_path(path):
+        """
+        Get path for temp file that can be renamed to path (temp files are created in `Settings.TEST_OUT_TEMP`
+        if it is on the same file system, so watchers of the folder do not see them).
+        """
+        folder = os.path.dirname(os.path.abspath(path))
+        if Folder.exists(Settings.TEST_OUT_TEMP) and os.stat(Settings.TEST_OUT_TEMP).st_dev == os.stat(folder).st_dev:
+            folder = Settings.TEST_OUT_TEMP
+        return os.path.join(folder, '.{0}.{1}.tmp'.format(os.path.basename(path), uuid.uuid4().hex))
+
+    @staticmethod
+    def is_shared(path):
+        """
+        Check if file shares content with other files (hard link, for example file in folder cloned by `Folder.clone`).
+        """
+        return os.path.isfile(path) and os.stat(path).st_nlink > 1
+
+    @staticmethod
+    def unshare(path):
+        """
+        Replace hard linked file with its own copy, so changes of the file do not write through to other links.
+        """
+        if File.is_shared(path):
+            Log.debug('Break hard link of ' + path)
+            temp_path = path + '.unshare'
+            shutil.copy2(path, temp_path)
+            os.rename(temp_path, path)
+
+    @staticmethod
+    def reflink(source, target):
+        """
+        Clone file with reflink (copy-on-write), supported on Linux (FICLONE) and macOS (clonefile).
+        :return: True if file is cloned, False if reflinks are not supported (target is not created).
+        """
+        if Settings.HOST_OS == OSType.OSX:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            if not hasattr(libc, 'clonefile'):
+                return False
+            return libc.clonefile(source.encode('utf-8'), target.encode('utf-8'), 0) == 0
+        if fcntl is None:
+            return False
+        with open(source, 'rb') as source_file:
+            with open(target, 'wb') as target_file:
+                try:
+                    fcntl.ioctl(target_file.fileno(), FICLONE, source_file.fileno())
+                    return True
+                except (IOError, OSError):
+                    pass
+        os.remove(target)
+        return False
+
+    @staticmethod
+    def get_hash(path):
+        """
+        Get sha1 of file content.
+        """
+        sha1 = hashlib.sha1()
+        with open(path, 'rb') as file_to_read:
+            for chunk in iter(lambda: file_to_read.read(1024 * 1024), b''):
+                sha1.update(chunk)
+        return sha1.hexdigest()
+
     @staticmethod
     def __back_up_files(backup_file, source_file=None):
-        # create temp folder if missing
-        if not Folder.exists(Settings.BACKUP_FOLDER):
-            Folder.create(Settings.BACKUP_FOLDER)
-        # if delete or replace method is used
-        if source_file is None:
-            source_file = backup_file
-        source_name = source_file.split("/")[-1:][0]
-        # backup file if from the template
+        """
+        Snapshot file before it is modified (see `File.restore_files`).
+        Content is stored in `Settings.BACKUP_FOLDER` by its hash (files with same content are stored once).
+        Files that do not exist are recorded too, so they are deleted on restore.
+        :param backup_file: File that will be modified (or folder, if file is copied to folder).
+        :param source_file: Source file (if file is copied).
+        """
+        if source_file is not None and Folder.exists(backup_file):
+            # if copy to folder is used add file name
+            backup_file = os.path.join(backup_file, os.path.basename(source_file))
+        if backup_file in TestContext.BACKUP_FILES:
+            # Keep the first snapshot, so restore returns file to its state before the test.
+            return
+        file_hash = None
         if File.exists(backup_file):
-            source_name = backup_file.split("/")[-1:][0]
-            # change file name if exists in backup_folder
-            if File.exists(os.path.join(Settings.BACKUP_FOLDER, source_name)):
-                source_name = source_name + "1"
-            shutil.copy(backup_file, os.path.join(Settings.BACKUP_FOLDER, source_name))
-        else:
-            if Folder.exists(backup_file):
-                # if copy to folder is used add file name
-                backup_file = (os.path.join(backup_file, source_name))
-            else:
-                # if file name is used for new file
-                source_name = backup_file.split("/")[-1:][0]
-        TestContext.BACKUP_FILES[backup_file] = source_name
+            file_hash = File.get_hash(backup_file)
+            blob = os.path.join(Settings.BACKUP_FOLDER, file_hash)
+            if not File.exists(blob):
+                Folder.create(Settings.BACKUP_FOLDER)
+                if not File.reflink(backup_file, blob):
+                    shutil.copy2(backup_file, blob)
+        TestContext.BACKUP_FILES[backup_file] = file_hash
+
+    @staticmethod
+    def restore_files():
+        """
+        Restore files modified by methods called with `backup_files=True`.
+        Only files with content different than the snapshot are rewritten, files created after snapshot are deleted.
+        :return: List of restored (or deleted) files.
+        """
+        restored = []
+        linked_blobs = set()
+        for path, file_hash in TestContext.BACKUP_FILES.items():
+            if file_hash is None:
+                if File.exists(path):
+                    File.delete(path)
+                    restored.append(path)
+            elif not File.exists(path) or File.get_hash(path) != file_hash:
+                blob = os.path.join(Settings.BACKUP_FOLDER, file_hash)
+                Folder.create(os.path.dirname(path))
+                temp_path = path + '.restore'
+                # Blobs are deleted after restore, so hard link to blob is not shared (each blob is linked only once).
+                linked = False
+                if file_hash not in linked_blobs:
+                    try:
+                        os.link(blob, temp_path)
+                        linked = True
+                        linked_blobs.add(file_hash)
+                    except (AttributeError, OSError):
+                        pass
+                if not linked:
+                    shutil.copy2(blob, temp_path)
+                if Settings.HOST_OS == OSType.WINDOWS and File.exists(path):
+                    os.remove(path)
+                os.rename(temp_path, path)
+                restored.append(path)
+                Log.debug('Restore {0}'.format(path))
+        TestContext.BACKUP_FILES.clear()
+        Folder.clean(Settings.BACKUP_FOLDER)
+        return restored
 
     @staticmethod
     def copy(source, target, backup_files=False):
         if backup_files:
             File.__back_up_files(target, source)
+        # Do not write through hard link to other files (for example file in folder cloned by `Folder.clone`)
+        File.unshare(os.path.join(target, os.path.basename(source)) if os.path.isdir(target) else target)
         shutil.copy(source, target)
         Log.info('Copy {0} to {1}'.format(os.path.abspath(source), os.path.abspath(target)))
 
@@ -213,60 +615,55 @@ class File(object):
             raise IOError('Error: %s file not found' % path)
 
     @staticmethod
-    def find(base_path, file_name, exact_match=False, match_index=0):
+    def find(base_path, file_name, exact_match=False, match_index=0, excludes=None, index=False):
         """
         Find file in path.
         :param base_path: Base path.
         :param file_name: File/folder name.
         :param exact_match: If True it will match exact file/folder name
-        :param match_index: Index of match (all matches are sorted by path len, 0 will return closest to root)
+        :param match_index: Index of match (all matches are sorted by depth and path len, 0 will return closest to root)
+        :param excludes: List of folder patterns to skip, for example ['node_modules', 'platforms/*/build'].
+        :param index: If True use persistent index of base path (only for trees that are rarely modified).
         :return: Path to file.
         """
-        matches = []
-        for root, dirs, files in os.walk(base_path, followlinks=True):
-            for current_file in files:
-                if exact_match:
-                    if file_name == current_file:
-                        matches.append(os.path.join(root, current_file))
-                else:
-                    if file_name in current_file:
-                        matches.append(os.path.join(root, current_file))
-        matches.sort(key=lambda s: len(s))
+        def match(name):
+            if exact_match:
+                return name == file_name
+            return file_name in name
+
+        max_results = match_index + 1 if match_index >= 0 else None
+        matches = FileSearch.find(base_path=base_path, match=match, excludes=excludes, followlinks=True,
+                                  max_results=max_results, index=index)
         return matches[match_index]
 
     @staticmethod
-    def pattern_exists(directory, pattern):
+    def pattern_exists(directory, pattern, excludes=None):
         """
         Check if file pattern exist at location.
         :param directory: Base directory.
         :param pattern: File pattern, for example: '*.aar' or '*.android.js'.
+        :param excludes: List of folder patterns to skip, for example ['node_modules'].
         :return: True if exists, False if does not exist.
         """
-        found = False
-        for root, dirs, files in os.walk(directory):
-            for basename in files:
-                if fnmatch.fnmatch(basename, pattern):
-                    filename = os.path.join(root, basename)
-                    Log.info(pattern + " exists: " + filename)
-                    found = True
-        return found
+        matches = FileSearch.find(base_path=directory, match=lambda name: fnmatch.fnmatch(name, pattern),
+                                  excludes=excludes, max_results=1)
+        if matches:
+            Log.info(pattern + " exists: " + matches[0])
+        return bool(matches)
 
     @staticmethod
-    def find_by_extension(folder, extension):
+    def find_by_extension(folder, extension, excludes=None):
         """
         Find by file extension recursively.
         :param folder: Base folder where search is done.
         :param extension: File extension.
-        :return: List of found files.
+        :param excludes: List of folder patterns to skip, for example ['node_modules'].
+        :return: List of found files (closest to the root first).
         """
-        matches = []
         if '.' not in extension:
             extension = '.' + extension
-        for root, dirs, files in os.walk(folder):
-            for f in files:
-                if f.endswith(extension):
-                    Log.debug('File with {0} extension found: {1}'.format(extension, os.path.abspath(f)))
-                    matches.append(os.path.join(root, f))
+        matches = FileSearch.find(base_path=folder, match=lambda name: name.endswith(extension), excludes=excludes)
+        Log.debug('Files with {0} extension found: {1}'.format(extension, matches))
         return matches
 
     @staticmethod
@@ -18,16 +18,21 @@ def get_repo_url(repo_url, ssh_clone=False):
 
 class Git(object):
     @staticmethod
-    def clone(repo_url, local_folder, branch='master'):
+    def clone(repo_url, local_folder, branch='master', reference=None):
         """Clone GitHub repo to local folder.
         :param repo_url: HTTPs url of the repo.
         :param branch: Branch.
         :param local_folder: Local folder to clone the repo.
+        :param reference: Local mirror of the repo (objects available in mirror are not downloaded).
         """
         if Folder.exists(folder=local_folder):
             Folder.clean(folder=local_folder)
         repo_url = get_repo_url(repo_url=repo_url, ssh_clone=Settings.SSH_CLONE)
-        command = 'git clone --depth 1 {0} -b {1} "{2}"'.format(repo_url, branch, str(local_folder))
+        if reference is not None and Folder.exists(reference):
+            command = 'git clone --reference "{0}" {1} -b {2} "{3}"'.format(reference, repo_url, branch,
+                                                                            str(local_folder))
+        else:
+            command = 'git clone --depth 1 {0} -b {1} "{2}"'.format(repo_url, branch, str(local_folder))
         Log.info(command)
         result = run(cmd=command)
         assert "fatal" not in result.output, "Failed to clone: " + repo_url
@@ -42,3 +47,47 @@ class Git(object):
         Log.info(commands)
         for command in commands:
             run(cmd=command, cwd=local_folder)
+
+    @staticmethod
+    def get_remote_commit(repo_url, branch='master'):
+        """
+        Get sha of the last commit in remote branch.
+        :return: Commit sha or None if it can not be resolved (for example there is no network).
+        """
+        repo_url = get_repo_url(repo_url=repo_url, ssh_clone=Settings.SSH_CLONE)
+        result = run(cmd='git ls-remote {0} refs/heads/{1}'.format(repo_url, branch), timeout=60)
+        if result.exit_code != 0 or not result.output.strip():
+            return None
+        return result.output.split()[0]
+
+    @staticmethod
+    def update_mirror(repo_url, mirror):
+        """
+        Create or update local mirror of the repo (bare repo with all branches).
+        :param repo_url: HTTPs url of the repo.
+        :param mirror: Local folder of the mirror.
+        :return: True if mirror is up to date.
+        """
+        repo_url = get_repo_url(repo_url=repo_url, ssh_clone=Settings.SSH_CLONE)
+        if Folder.exists(mirror):
+            command = 'git --git-dir="{0}" remote update --prune'.format(mirror)
+        else:
+            command = 'git clone --mirror {0} "{1}"'.format(repo_url, mirror)
+        Log.info(command)
+        result = run(cmd=command, timeout=600)
+        return result.exit_code == 0
+
+    @staticmethod
+    def rev_parse(repo, rev):
+        """
+        Get sha of object in local repo.
+        :param repo: Path to repo (git dir of bare repo).
+        :param rev: Revision, for example `master` or `master:packages/template-hello-world`.
+        :return: Object sha or None if object does not exist.
+        """
+        if not Folder.exists(repo):
+            return None
+        result = run(cmd='git --git-dir="{0}" rev-parse --verify --quiet "{1}"'.format(repo, rev))
+        if result.exit_code != 0:
+            return None
+        return result.output.strip()
@@ -1,9 +1,11 @@
 """
 A wrapper around Gradle.
 """
-
+# pylint: disable=broad-except
 import os
 
+import psutil
+
 from core.enums.os_type import OSType
 from core.log.log import Log
 from core.settings import Settings
@@ -12,6 +14,15 @@ from core.utils.run import run
 
 
 class Gradle(object):
+    # Main class of Gradle daemon process.
+    DAEMON_MAIN = 'org.gradle.launcher.daemon.bootstrap.GradleDaemon'
+
+    # Max number of daemons kept alive (oldest daemons are kept, because they are warmed up).
+    MAX_DAEMONS = 1
+
+    # Daemons that use more memory (in MB) are killed.
+    MAX_DAEMON_MEMORY = 3072
+
     @staticmethod
     def kill():
         Log.info("Kill gradle processes.")
@@ -20,6 +31,71 @@ class Gradle(object):
         else:
             command = "ps -ef  | grep '.gradle/wrapper' | grep -v grep | awk '{ print $2 }' | xargs kill -9"
             run(cmd=command)
+        # Daemons started without wrapper (for example by gradle installed globally)
+        for proc in Gradle.get_daemons():
+            try:
+                proc.kill()
+            except psutil.NoSuchProcess:
+                continue
+
+    @staticmethod
+    def reset():
+        """
+        Prepare Gradle for next test.
+        If `Settings.GRADLE_REUSE_DAEMON` is True only stuck daemons are killed (healthy daemon is reused),
+        otherwise all gradle processes are killed (so each build starts cold daemon).
+        """
+        if Settings.GRADLE_REUSE_DAEMON:
+            Gradle.kill_stuck()
+            daemons = Gradle.get_daemons()
+            if daemons:
+                Log.info('Reuse gradle daemon(s): {0}'.format(', '.join(str(proc.pid) for proc in daemons)))
+        else:
+            Gradle.kill()
+
+    @staticmethod
+    def get_daemons():
+        """
+        Get running Gradle daemons.
+        :return: List of psutil.Process objects (sorted by create time, oldest first).
+        """
+        daemons = []
+        for proc in psutil.process_iter():
+            try:
+                if Gradle.DAEMON_MAIN in ' '.join(proc.cmdline()):
+                    daemons.append((proc.create_time(), proc))
+            except Exception:
+                continue
+        return [proc for _, proc in sorted(daemons, key=lambda item: item[0])]
+
+    @staticmethod
+    def kill_stuck():
+        """
+        Kill Gradle daemons that should not be reused:
+        - stopped or zombie daemons.
+        - daemons that use more than `MAX_DAEMON_MEMORY` MB of memory.
+        - daemons above `MAX_DAEMONS` (newest are killed).
+        :return: List of killed pids.
+        """
+        killed = []
+        healthy = 0
+        for proc in Gradle.get_daemons():
+            reason = Gradle.__get_stuck_reason(proc)
+            if reason is None and healthy >= Gradle.MAX_DAEMONS:
+                reason = 'more than {0} daemon(s) running'.format(Gradle.MAX_DAEMONS)
+            if reason is None:
+                healthy += 1
+                continue
+            Log.info('Kill gradle daemon {0} ({1}).'.format(proc.pid, reason))
+            try:
+                proc.kill()
+                proc.wait(timeout=10)
+                killed.append(proc.pid)
+            except psutil.NoSuchProcess:
+                continue
+            except Exception as error:
+                Log.info('Failed to kill gradle daemon {0}: {1}'.format(proc.pid, error))
+        return killed
 
     @staticmethod
     def cache_clean():
@@ -28,3 +104,16 @@ class Gradle(object):
             run(cmd="rmdir /s /q {USERPROFILE}\\.gradle".format(**os.environ))
         else:
             run(cmd="rm -rf ~/.gradle")
+
+    @staticmethod
+    def __get_stuck_reason(proc):
+        try:
+            status = proc.status()
+            if status in [psutil.STATUS_STOPPED, psutil.STATUS_ZOMBIE]:
+                return 'status is {0}'.format(status)
+            memory = proc.memory_info().rss / (1024 * 1024)
+            if memory > Gradle.MAX_DAEMON_MEMORY:
+                return 'uses {0:.0f} MB of memory'.format(memory)
+        except psutil.NoSuchProcess:
+            return None
+        return None
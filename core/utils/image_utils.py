@@ -10,12 +10,14 @@ Notes: OpenCV color order is:
 import os
 import string
 
-import cv2
-import numpy
-import pytesseract
-from PIL import Image
-
 from core.settings import Settings
+from core.utils.lazy_import import LazyModule
+
+# Heavy modules are imported on first use (so tests that do not check images do not load them)
+cv2 = LazyModule('cv2')
+numpy = LazyModule('numpy')
+pytesseract = LazyModule('pytesseract')
+Image = LazyModule('PIL.Image')
 
 
 class ImageUtils(object):
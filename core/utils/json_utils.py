@@ -8,6 +8,8 @@ from errno import ENOENT
 
 
 class JsonUtils(object):
+    # Parsed json files {path: ((mtime, size), data)}
+    CACHE = {}
 
     @staticmethod
     def __replace_value(json_data, k, v):
@@ -38,6 +40,46 @@ class JsonUtils(object):
             data = json.load(json_file)
         return data
 
+    @staticmethod
+    def read_cached(file_path):
+        """
+        Read content of json file (parsed content is reused until mtime or size of the file are changed).
+        Notice: Returned object is shared between callers, so do not modify it (use `read` instead).
+        :param file_path: Path to file.
+        :return: Content of file as json object.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            raise IOError(ENOENT, 'File not found.', file_path)
+        path = os.path.abspath(file_path)
+        cached = JsonUtils.CACHE.get(path)
+        if cached is not None and cached[0] == (stat.st_mtime, stat.st_size):
+            return cached[1]
+        data = JsonUtils.read(file_path)
+        JsonUtils.CACHE[path] = ((stat.st_mtime, stat.st_size), data)
+        return data
+
+    @staticmethod
+    def invalidate(file_path):
+        """
+        Remove file from cache of `read_cached` (call it after file is modified).
+        """
+        JsonUtils.CACHE.pop(os.path.abspath(file_path), None)
+
+    @staticmethod
+    def write(file_path, data, indent=2):
+        """
+        Write json object to file.
+        :param file_path: File path.
+        :param data: Json object.
+        :param indent: Indent.
+        """
+        with open(file_path, 'w') as json_file:
+            json.dump(data, json_file, indent=indent)
+            json_file.write('\n')
+        JsonUtils.invalidate(file_path)
+
     @staticmethod
     def replace(file_path, key, value):
         """
@@ -52,3 +94,4 @@ class JsonUtils(object):
             json_file.seek(0)
             json.dump(data, json_file, indent=4)
             json_file.truncate()
+        JsonUtils.invalidate(file_path)
@@ -0,0 +1,51 @@
+"""
+Lazy import of heavy modules (for example cv2, numpy or selenium).
+
+Usage:
+    cv2 = LazyModule('cv2')
+    cv2.imread(path)  # cv2 is imported here
+"""
+import importlib
+import threading
+
+
+class LazyModule(object):
+    """
+    Proxy of module that is imported on first access to any of its attributes.
+    """
+
+    __lock = threading.Lock()
+
+    def __init__(self, name):
+        """
+        :param name: Full name of the module, for example `PIL.Image`.
+        """
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def __getattr__(self, item):
+        return getattr(self.load(), item)
+
+    def __setattr__(self, key, value):
+        setattr(self.load(), key, value)
+
+    def __repr__(self):
+        state = 'loaded' if self.is_loaded() else 'not loaded'
+        return '<lazy module {0} ({1})>'.format(self.__dict__['_name'], state)
+
+    def is_loaded(self):
+        return self.__dict__['_module'] is not None
+
+    def load(self):
+        """
+        Import module (if not imported yet).
+        :return: Module object.
+        """
+        module = self.__dict__['_module']
+        if module is None:
+            with LazyModule.__lock:
+                module = self.__dict__['_module']
+                if module is None:
+                    module = importlib.import_module(self.__dict__['_name'])
+                    self.__dict__['_module'] = module
+        return module
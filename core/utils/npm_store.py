@@ -0,0 +1,214 @@
+"""
+Local store of npm packages and registry stand-in that serves packages from the store.
+
+Registry works as caching proxy of `Settings.NPM_REGISTRY`:
+- package metadata is saved in the store and reused for `NpmStore.MAX_AGE` seconds
+  (saved metadata is also used when upstream registry is not available).
+- tarballs are saved in the store by their sha1 (`dist.shasum`), so each package version is downloaded only once
+  and installs work without network once all packages of the app are in the store.
+
+Registry is used by all npm processes (including npm started by {N} CLI) via `npm_config_registry` env. variable.
+"""
+# pylint: disable=import-error
+# pylint: disable=no-name-in-module
+# pylint: disable=broad-except
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+
+from core.log.log import Log
+from core.settings import Settings
+from core.utils.file_utils import File, Folder
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.error import HTTPError
+    from urllib.parse import quote, unquote
+    from urllib.request import Request, urlopen
+except ImportError:
+    # Python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urllib import quote, unquote
+    from urllib2 import HTTPError, Request, urlopen
+
+
+class NpmStore(object):
+    # Seconds for which saved package metadata is used without request to upstream registry.
+    MAX_AGE = 600
+
+    # Timeout for requests to upstream registry.
+    TIMEOUT = 30
+
+    __server = None
+    __registry = None
+    __lock = threading.Lock()
+
+    @staticmethod
+    def start():
+        """
+        Start local registry (if not started) and use it for all npm commands.
+        :return: Url of local registry.
+        """
+        with NpmStore.__lock:
+            if NpmStore.__server is None:
+                server = StoreServer(('127.0.0.1', 0), StoreRequestHandler)
+                thread = threading.Thread(target=server.serve_forever)
+                thread.daemon = True
+                thread.start()
+                NpmStore.__server = server
+                NpmStore.__registry = os.environ.get('npm_config_registry')
+                os.environ['npm_config_registry'] = NpmStore.get_url()
+                Log.info('Local npm registry started at {0} (store: {1}).'.format(NpmStore.get_url(),
+                                                                                  Settings.NPM_STORE))
+        return NpmStore.get_url()
+
+    @staticmethod
+    def stop():
+        """
+        Stop local registry (npm commands use upstream registry again).
+        """
+        with NpmStore.__lock:
+            if NpmStore.__server is not None:
+                NpmStore.__server.shutdown()
+                NpmStore.__server.server_close()
+                NpmStore.__server = None
+                if NpmStore.__registry is None:
+                    os.environ.pop('npm_config_registry', None)
+                else:
+                    os.environ['npm_config_registry'] = NpmStore.__registry
+                Log.info('Local npm registry stopped.')
+
+    @staticmethod
+    def get_url():
+        """
+        Get url of local registry (None if registry is not started).
+        """
+        if NpmStore.__server is None:
+            return None
+        return 'http://127.0.0.1:{0}'.format(NpmStore.__server.server_address[1])
+
+    @staticmethod
+    def get_packument(name, fetch=True):
+        """
+        Get metadata of package (as returned by upstream registry).
+        :param name: Package name.
+        :param fetch: If False only saved metadata is used.
+        :return: Metadata as dict or None if package is not found.
+        """
+        packument_file = os.path.join(Settings.NPM_STORE, 'packuments', quote(name, safe='@') + '.json')
+        saved = File.exists(packument_file)
+        if fetch and (not saved or time.time() - os.path.getmtime(packument_file) > NpmStore.MAX_AGE):
+            url = '{0}/{1}'.format(Settings.NPM_REGISTRY.rstrip('/'), name.replace('/', '%2f'))
+            try:
+                response = urlopen(Request(url, headers={'Accept': 'application/json'}), timeout=NpmStore.TIMEOUT)
+                text = response.read().decode('utf-8')
+                packument = json.loads(text)
+                Folder.create(os.path.dirname(packument_file))
+                File.write(path=packument_file, text=text, atomic=True)
+                return packument
+            except HTTPError as error:
+                if error.code == 404:
+                    return None
+                Log.debug('Failed to get {0} from registry: {1}'.format(name, error))
+            except Exception as error:
+                Log.debug('Failed to get {0} from registry: {1}'.format(name, error))
+        if saved:
+            return json.loads(File.read(packument_file))
+        return None
+
+    @staticmethod
+    def get_tarball(name, file_name):
+        """
+        Get tarball of package version (tarball is downloaded and saved in the store if missing).
+        :param name: Package name.
+        :param file_name: File name of tarball, for example `tns-core-modules-6.0.0.tgz`.
+        :return: Path to tarball in the store or None if tarball is not found.
+        """
+        dist = NpmStore.__get_dist(NpmStore.get_packument(name=name, fetch=False), file_name)
+        if dist is None:
+            dist = NpmStore.__get_dist(NpmStore.get_packument(name=name), file_name)
+        if dist is None:
+            return None
+        tarball = os.path.join(Settings.NPM_STORE, 'tarballs', dist['shasum'] + '.tgz')
+        if File.exists(tarball):
+            return tarball
+        Log.debug('Download ' + dist['tarball'])
+        content = urlopen(dist['tarball'], timeout=NpmStore.TIMEOUT).read()
+        assert hashlib.sha1(content).hexdigest() == dist['shasum'], 'Invalid shasum of ' + dist['tarball']
+        Folder.create(os.path.dirname(tarball))
+        temp_path = '{0}.{1}.tmp'.format(tarball, uuid.uuid4().hex)
+        with open(temp_path, 'wb') as tarball_file:
+            tarball_file.write(content)
+        os.rename(temp_path, tarball)
+        return tarball
+
+    @staticmethod
+    def get_local_packument(packument, url):
+        """
+        Get copy of package metadata where tarballs are served by local registry.
+        """
+        packument = json.loads(json.dumps(packument))
+        for version in packument.get('versions', {}).values():
+            dist = version.get('dist', {})
+            if 'tarball' in dist:
+                dist['tarball'] = '{0}/{1}/-/{2}'.format(url, version['name'], dist['tarball'].split('/')[-1])
+        return packument
+
+    @staticmethod
+    def __get_dist(packument, file_name):
+        if packument is None:
+            return None
+        for version in packument.get('versions', {}).values():
+            dist = version.get('dist', {})
+            if dist.get('tarball', '').split('/')[-1] == file_name and 'shasum' in dist:
+                return dist
+        return None
+
+
+class StoreServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class StoreRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serve package metadata (`GET /<name>`) and tarballs (`GET /<name>/-/<file name>`) from `NpmStore`.
+    """
+
+    def do_GET(self):
+        path = unquote(self.path.split('?')[0]).lstrip('/')
+        try:
+            if '/-/' in path:
+                name, file_name = path.split('/-/', 1)
+                tarball = NpmStore.get_tarball(name=name, file_name=file_name)
+                if tarball is None:
+                    self.send_error(404)
+                    return
+                with open(tarball, 'rb') as tarball_file:
+                    body = tarball_file.read()
+                content_type = 'application/octet-stream'
+            else:
+                packument = NpmStore.get_packument(name=path)
+                if packument is None:
+                    self.send_error(404)
+                    return
+                url = 'http://{0}:{1}'.format(*self.server.server_address[:2])
+                body = json.dumps(NpmStore.get_local_packument(packument, url)).encode('utf-8')
+                content_type = 'application/json'
+        except Exception as error:
+            Log.debug('Local npm registry failed to serve {0}: {1}'.format(path, error))
+            self.send_error(502)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # pylint: disable=redefined-builtin
+        Log.debug('Local npm registry: ' + format % args)
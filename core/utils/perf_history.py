@@ -0,0 +1,277 @@
+"""
+Persistent history of performance results.
+
+Results are stored in append-only JSONL file (one result per line) defined by `Settings.PERF_HISTORY`.
+Each result is keyed by template, platform, metric, versions of packages under test and host fingerprint.
+Results may also be tagged with measurement conditions: when the way a metric is measured changes, new results get new
+conditions and are not compared with results measured the old way.
+"""
+import hashlib
+import json
+import math
+import os
+import time
+from datetime import datetime
+from platform import machine, node
+
+import psutil
+
+from core.log.log import Log
+from core.settings import Settings
+from core.utils.file_utils import File, Folder
+
+
+class ChangePointInfo(object):
+    def __init__(self, index, before, after):
+        self.index = index
+        self.before = before
+        self.after = after
+        self.change = (after - before) / before if before else 0
+
+
+class PerfHistory(object):
+    @staticmethod
+    def get_host_info():
+        """
+        Get info about current host (results from different hosts are not comparable).
+        :return: dict with host info.
+        """
+        return {'name': node(),
+                'os': str(Settings.HOST_OS),
+                'arch': machine(),
+                'cpu_count': psutil.cpu_count(),
+                'memory_gb': int(round(psutil.virtual_memory().total / float(1024 ** 3)))}
+
+    @staticmethod
+    def get_host_fingerprint():
+        """
+        Get short fingerprint of current host.
+        :return: Fingerprint as string.
+        """
+        host_info = json.dumps(PerfHistory.get_host_info(), sort_keys=True)
+        return hashlib.sha1(host_info.encode('utf-8')).hexdigest()[:12]
+
+    @staticmethod
+    def get_versions():
+        """
+        Get versions of packages under test.
+        :return: dict with package versions (as specified in `Settings.Packages`).
+        """
+        return {'cli': Settings.Packages.NS_CLI,
+                'android': Settings.Packages.ANDROID,
+                'ios': Settings.Packages.IOS,
+                'modules': Settings.Packages.MODULES,
+                'angular': Settings.Packages.ANGULAR,
+                'webpack': Settings.Packages.WEBPACK,
+                'typescript': Settings.Packages.TYPESCRIPT}
+
+    @staticmethod
+    def record(template, platform, metric, value, conditions=None, history_file=Settings.PERF_HISTORY):
+        """
+        Append result to history file.
+        :param template: Template name (for example `hello-world-js`).
+        :param platform: Platform enum value or string.
+        :param metric: Metric name (for example `build_incremental`).
+        :param value: Measured value.
+        :param conditions: Measurement conditions (string, change it when the way metric is measured changes).
+        :param history_file: Path to history file.
+        :return: Recorded entry as dict.
+        """
+        entry = {'time': time.time(),
+                 'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                 'template': template,
+                 'platform': str(platform),
+                 'metric': metric,
+                 'value': value,
+                 'versions': PerfHistory.get_versions(),
+                 'host': PerfHistory.get_host_fingerprint(),
+                 'conditions': conditions}
+        previous = PerfHistory.get_entries(template=template, platform=platform, metric=metric,
+                                           history_file=history_file)
+        if previous and previous[-1].get('conditions') != conditions:
+            Log.info('Measurement conditions of {0} {1} {2} changed: {3} -> {4} (older results are not compared).'
+                     .format(template, str(platform), metric, previous[-1].get('conditions'), conditions))
+        Folder.create(os.path.dirname(history_file))
+        File.append(path=history_file, text=json.dumps(entry, sort_keys=True) + '\n')
+        Log.debug('Perf result recorded in {0}: {1}'.format(history_file, entry))
+        return entry
+
+    @staticmethod
+    def read(history_file=Settings.PERF_HISTORY):
+        """
+        Read all entries from history file.
+        :param history_file: Path to history file.
+        :return: List of entries (dict objects) ordered by time.
+        """
+        entries = []
+        if File.exists(history_file):
+            for line in File.read(history_file).splitlines():
+                line = line.strip()
+                if line:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        Log.debug('Skip broken line in {0}: {1}'.format(history_file, line))
+        entries.sort(key=lambda e: e['time'])
+        return entries
+
+    @staticmethod
+    def get_entries(template, platform, metric, host=None, conditions=False, history_file=Settings.PERF_HISTORY):
+        """
+        Get history entries for metric.
+        :param template: Template name.
+        :param platform: Platform enum value or string.
+        :param metric: Metric name.
+        :param host: Host fingerprint (by default fingerprint of current host, pass False to get all hosts).
+        :param conditions: Measurement conditions (by default all entries, `None` means entries without conditions).
+        :param history_file: Path to history file.
+        :return: List of entries ordered by time.
+        """
+        if host is None:
+            host = PerfHistory.get_host_fingerprint()
+        return [e for e in PerfHistory.read(history_file=history_file)
+                if e['template'] == template and e['platform'] == str(platform) and e['metric'] == metric
+                and (host is False or e['host'] == host)
+                and (conditions is False or e.get('conditions') == conditions)]
+
+    @staticmethod
+    def get_baseline(template, platform, metric, skip=0, window=10, conditions=None,
+                     history_file=Settings.PERF_HISTORY):
+        """
+        Get baseline value of metric (median of latest results on current host measured under the same conditions).
+        :param template: Template name.
+        :param platform: Platform enum value or string.
+        :param metric: Metric name.
+        :param skip: Number of latest results to skip (for example pass 1 if result of current run is already recorded).
+        :param window: Number of results used to calculate the baseline.
+        :param conditions: Measurement conditions.
+        :param history_file: Path to history file.
+        :return: Baseline value or None if there are no results in history.
+        """
+        entries = PerfHistory.get_entries(template=template, platform=platform, metric=metric,
+                                          conditions=conditions, history_file=history_file)
+        if skip:
+            entries = entries[:-skip]
+        values = sorted(e['value'] for e in entries[-window:])
+        if not values:
+            return None
+        middle = len(values) // 2
+        if len(values) % 2:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2.0
+
+    @staticmethod
+    def get_change_point(values, min_size=3, threshold=0.1, noise_factor=2.0):
+        """
+        Find most significant shift of mean value in list of values.
+        :param values: List of numbers (ordered by time).
+        :param min_size: Min number of values before and after change point.
+        :param threshold: Min relative change of the mean (0.1 means 10%).
+        :param noise_factor: Change should be bigger than `noise_factor` * standard deviation of the segments.
+        :return: ChangePointInfo object or None if there is no significant change.
+        """
+        count = len(values)
+        best = None
+        best_score = 0
+        for index in range(min_size, count - min_size + 1):
+            before = values[:index]
+            after = values[index:]
+            mean_before = PerfHistory.__mean(before)
+            mean_after = PerfHistory.__mean(after)
+            diff = abs(mean_after - mean_before)
+            noise = max(PerfHistory.__std(before), PerfHistory.__std(after))
+            if mean_before == 0 or diff / mean_before < threshold or diff <= noise_factor * noise:
+                continue
+            score = diff * math.sqrt(float(index * (count - index)) / count)
+            if score > best_score:
+                best_score = score
+                best = ChangePointInfo(index=index, before=mean_before, after=mean_after)
+        return best
+
+    @staticmethod
+    def get_trend(values):
+        """
+        Get relative trend of values (least squares fit).
+        :param values: List of numbers (ordered by time).
+        :return: Relative change over the whole list according to the fit (0.1 means values grow with 10%).
+        """
+        count = len(values)
+        if count < 2:
+            return 0
+        mean_x = (count - 1) / 2.0
+        mean_y = PerfHistory.__mean(values)
+        if mean_y == 0:
+            return 0
+        numerator = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+        denominator = sum((x - mean_x) ** 2 for x in range(count))
+        slope = numerator / denominator
+        return slope * (count - 1) / mean_y
+
+    @staticmethod
+    def check(template, platform, metric, threshold=0.1, window=20, conditions=None,
+              history_file=Settings.PERF_HISTORY):
+        """
+        Check history of metric for regressions (step changes and slow creep).
+        :param template: Template name.
+        :param platform: Platform enum value or string.
+        :param metric: Metric name.
+        :param threshold: Relative threshold (0.1 means 10%).
+        :param window: Number of latest results to analyze.
+        :param conditions: Measurement conditions.
+        :param history_file: Path to history file.
+        :return: List of regressions (as strings), empty list if everything is OK.
+        """
+        entries = PerfHistory.get_entries(template=template, platform=platform, metric=metric,
+                                          conditions=conditions, history_file=history_file)[-window:]
+        values = [e['value'] for e in entries]
+        name = '{0} {1} {2}'.format(template, str(platform), metric)
+        regressions = []
+        change_point = PerfHistory.get_change_point(values, threshold=threshold)
+        if change_point is not None and change_point.change > 0:
+            entry = entries[change_point.index]
+            regressions.append('{0}: {1:.2f} -> {2:.2f} (+{3:.0%}) since {4} ({5}).'.format(
+                name, change_point.before, change_point.after, change_point.change, entry['date'],
+                entry['versions'].get('cli')))
+        trend = PerfHistory.get_trend(values)
+        if len(values) >= 5 and trend > threshold:
+            regressions.append('{0}: grows with {1:.0%} over last {2} runs.'.format(name, trend, len(values)))
+        return regressions
+
+    @staticmethod
+    def get_report(history_file=Settings.PERF_HISTORY, window=20):
+        """
+        Get trend report for all metrics recorded on current host.
+        :param history_file: Path to history file.
+        :param window: Number of latest results to analyze.
+        :return: Report as string.
+        """
+        host = PerfHistory.get_host_fingerprint()
+        series = {}
+        for entry in PerfHistory.read(history_file=history_file):
+            if entry['host'] == host:
+                metric = entry['metric']
+                if entry.get('conditions'):
+                    metric = '{0} [{1}]'.format(metric, entry['conditions'])
+                key = (entry['template'], entry['platform'], metric)
+                series.setdefault(key, []).append(entry['value'])
+        lines = ['{0:<20} {1:<8} {2:<40} {3:>5} {4:>10} {5:>10} {6:>8}'.format(
+            'template', 'platform', 'metric', 'runs', 'last', 'mean', 'trend')]
+        for key in sorted(series.keys()):
+            values = series[key][-window:]
+            line = '{0:<20} {1:<8} {2:<40} {3:>5} {4:>10.2f} {5:>10.2f} {6:>+8.0%}'.format(
+                key[0], key[1], key[2], len(values), values[-1], PerfHistory.__mean(values),
+                PerfHistory.get_trend(values))
+            change_point = PerfHistory.get_change_point(values)
+            if change_point is not None:
+                line += ' (change {0:+.0%} at run {1})'.format(change_point.change, change_point.index)
+            lines.append(line)
+        return os.linesep.join(lines)
+
+    @staticmethod
+    def __mean(values):
+        return float(sum(values)) / len(values)
+
+    @staticmethod
+    def __std(values):
+        mean = PerfHistory.__mean(values)
+        return math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
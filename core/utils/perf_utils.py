@@ -28,3 +28,19 @@ class PerfUtils(object):
         for _ in range(0, retry_count):
             total_time = total_time + operation(*args, **kwargs).duration
         return total_time / retry_count
+
+    @staticmethod
+    def get_percentile(values, percentile):
+        """
+        Get percentile of values (linear interpolation between closest ranks).
+        :param values: List of numbers.
+        :param percentile: Percentile (0-100), for example 50 for median or 90 for p90.
+        :return: Value of the percentile or None if list of values is empty.
+        """
+        if not values:
+            return None
+        values = sorted(values)
+        rank = (len(values) - 1) * percentile / 100.0
+        low = int(rank)
+        high = min(low + 1, len(values) - 1)
+        return values[low] + (values[high] - values[low]) * (rank - low)
@@ -2,7 +2,6 @@
 # pylint: disable=broad-except
 import logging
 import os
-import time
 
 import psutil
 
@@ -10,6 +9,7 @@ from core.base_test.test_context import TestContext
 from core.enums.os_type import OSType
 from core.log.log import Log
 from core.settings import Settings
+from core.utils.wait import Wait
 
 
 # noinspection PyBroadException,PyUnusedLocal
@@ -69,17 +69,9 @@ class Process(object):
         :param timeout: Timeout in seconds.
         :return: True if running, false if not running.
         """
-        running = False
-        end_time = time.time() + timeout
-        while not running:
-            time.sleep(5)
-            running = Process.is_running_by_name(proc_name)
-            if running:
-                running = True
-                break
-            if (running is False) and (time.time() > end_time):
-                error = "{0} not running in {1} seconds.", proc_name, timeout
-                raise Exception(error)
+        running = Wait.until(lambda: Process.is_running_by_name(proc_name), timeout=timeout, period=1)
+        if not running:
+            raise Exception('{0} not running in {1} seconds.'.format(proc_name, timeout))
         return running
 
     @staticmethod
@@ -1,5 +1,6 @@
 class ProcessInfo(object):
-    def __init__(self, cmd=None, pid=None, exit_code=None, output='', log_file=None, complete=True, duration=None):
+    def __init__(self, cmd=None, pid=None, exit_code=None, output='', log_file=None, complete=True, duration=None,
+                 timeline=None):
         self.commandline = cmd
         self.pid = pid
         self.output = output
@@ -7,3 +8,4 @@ class ProcessInfo(object):
         self.log_file = log_file
         self.complete = complete
         self.duration = duration
+        self.timeline = timeline
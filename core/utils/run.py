@@ -4,6 +4,7 @@
 # pylint: disable=unused-variable
 import logging
 import os
+import threading
 import time
 from datetime import datetime
 
@@ -24,14 +25,41 @@ else:
     import subprocess
 
 
+def __read_timeline(stream, start, timeline):
+    """
+    Read lines of stream and record time (relative to `start`) when each line is received.
+    """
+    for line in iter(stream.readline, b''):
+        if Settings.PYTHON_VERSION < 3:
+            line = str(line.decode('utf8').encode('utf8'))
+        else:
+            line = line.decode('utf-8', 'ignore')
+        timeline.append((time.time() - start, line.rstrip()))
+    stream.close()
+
+
 def run(cmd, cwd=Settings.TEST_RUN_HOME, wait=True, timeout=600, fail_safe=False, register=True,
-        log_level=logging.DEBUG):
+        log_level=logging.DEBUG, timeline=False):
+    """
+    Execute command.
+    :param cmd: Command.
+    :param cwd: Working directory.
+    :param wait: If true wait until command is complete, otherwise redirect output to log file and return.
+    :param timeout: Timeout in seconds (respected only if wait=True).
+    :param fail_safe: If true do not raise exception on timeout.
+    :param register: If true register process in TestContext.
+    :param log_level: Log level.
+    :param timeline: If true record when each line of stdout is received (respected only if wait=True).
+    :return: ProcessInfo object (if timeline=True `timeline` is list of (seconds since start, line) tuples).
+    :rtype: core.utils.process_info.ProcessInfo
+    """
     # Init result values
     time_string = datetime.now().strftime('%Y_%m_%d_%H_%M_%S_%f')
     log_file = os.path.join(Settings.TEST_OUT_LOGS, 'command_{0}.txt'.format(time_string))
     complete = False
     duration = None
     output = ''
+    lines = None
 
     # Ensure logs folder exists
     dir_path = os.path.dirname(os.path.realpath(log_file))
@@ -51,21 +79,33 @@ def run(cmd, cwd=Settings.TEST_RUN_HOME, wait=True, timeout=600, fail_safe=False
     if wait:
         start = time.time()
         with open(log_file, mode='w') as log:
-            if Settings.HOST_OS == OSType.WINDOWS:
+            if Settings.HOST_OS == OSType.WINDOWS and not timeline:
                 process = subprocess.Popen(cmd, cwd=cwd, shell=True, stdout=log, stderr=log)
             else:
                 process = subprocess.Popen(cmd, cwd=cwd, shell=True, stdout=subprocess.PIPE, stderr=log)
 
+        # Read stdout line by line in separate thread (if timeline is required)
+        reader = None
+        if timeline:
+            lines = []
+            reader = threading.Thread(target=__read_timeline, args=(process.stdout, start, lines))
+            reader.daemon = True
+            reader.start()
+
         # Wait until command complete
         try:
             process.wait(timeout=timeout)
             complete = True
-            out, err = process.communicate()
-            if out is not None:
-                if Settings.PYTHON_VERSION < 3:
-                    output = str(out.decode('utf8').encode('utf8')).strip()
-                else:
-                    output = out.decode("utf-8").strip()
+            if reader is not None:
+                reader.join()
+                output = os.linesep.join([line for _, line in lines]).strip()
+            else:
+                out, err = process.communicate()
+                if out is not None:
+                    if Settings.PYTHON_VERSION < 3:
+                        output = str(out.decode('utf8').encode('utf8')).strip()
+                    else:
+                        output = out.decode("utf-8").strip()
         except subprocess.TimeoutExpired:
             process.kill()
             if fail_safe:
@@ -101,7 +141,7 @@ def run(cmd, cwd=Settings.TEST_RUN_HOME, wait=True, timeout=600, fail_safe=False
 
     # Construct result
     result = ProcessInfo(cmd=cmd, pid=pid, exit_code=exit_code, output=output, log_file=log_file, complete=complete,
-                         duration=duration)
+                         duration=duration, timeline=lines)
 
     # Register in TestContext
     if psutil.pid_exists(result.pid) and register:
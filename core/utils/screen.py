@@ -8,6 +8,7 @@ from core.settings import Settings
 from core.utils.file_utils import File
 from core.utils.image_utils import ImageUtils
 from core.utils.run import run
+from core.utils.wait import Wait
 
 
 class Screen(object):
@@ -66,7 +67,7 @@ class Screen(object):
                 break
             else:
                 Log.debug('"{0}" NOT found on screen.'.format(text))
-                time.sleep(5)
+                Wait.sleep(5)
         if not found:
             Log.info('Actual text: {0}{1}'.format(os.linesep, actual_text))
         return found
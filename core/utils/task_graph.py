@@ -0,0 +1,113 @@
+"""
+Run tasks with dependencies concurrently.
+"""
+# pylint: disable=broad-except
+import threading
+import time
+import traceback
+from multiprocessing.pool import ThreadPool
+
+from core.log.log import Log
+
+
+class TaskGraph(object):
+    """
+    Graph of tasks, each task is started as soon as all its dependencies are complete.
+
+    Usage:
+        graph = TaskGraph(workers=4)
+        graph.add('clone', clone)
+        graph.add('pack', pack, depends_on=['clone'])
+        graph.add('install', install)
+        graph.run()
+    """
+
+    def __init__(self, workers=4):
+        """
+        :param workers: Max number of tasks executed at the same time.
+        """
+        self.workers = workers
+        self.tasks = []
+        self.durations = {}
+
+    def add(self, name, func, depends_on=None):
+        """
+        Add task.
+        :param name: Unique name of the task.
+        :param func: Function without arguments.
+        :param depends_on: List of names of tasks that should be complete before this task starts
+                           (tasks should be added before tasks that depend on them, so graph has no cycles).
+        """
+        names = [task[0] for task in self.tasks]
+        assert name not in names, 'Task {0} already exists.'.format(name)
+        depends_on = depends_on or []
+        for dependency in depends_on:
+            assert dependency in names, 'Task {0} depends on unknown task {1}.'.format(name, dependency)
+        self.tasks.append((name, func, depends_on))
+
+    def run(self):
+        """
+        Run all tasks. Tasks that depend on failed tasks are skipped.
+        Exception of the first failed task is raised after all started tasks are complete.
+        :return: dict {task name: duration in seconds}.
+        """
+        pending = list(self.tasks)
+        results = {}
+        errors = []
+        running = [0]
+        condition = threading.Condition()
+        self.durations = {}
+
+        def execute(name, func):
+            start = time.time()
+            error = None
+            try:
+                func()
+            except Exception as exception:
+                Log.error('Task {0} failed: {1}'.format(name, traceback.format_exc()))
+                error = exception
+            with condition:
+                self.durations[name] = time.time() - start
+                results[name] = error is None
+                if error is not None:
+                    errors.append(error)
+                running[0] -= 1
+                condition.notify_all()
+
+        start_time = time.time()
+        pool = ThreadPool(self.workers)
+        try:
+            with condition:
+                while pending or running[0]:
+                    for task in list(pending):
+                        name, func, depends_on = task
+                        if [dependency for dependency in depends_on if results.get(dependency) is False]:
+                            Log.info('Skip task {0} (dependency failed).'.format(name))
+                            results[name] = False
+                            pending.remove(task)
+                        elif all(results.get(dependency) for dependency in depends_on):
+                            Log.info('Start task {0}.'.format(name))
+                            running[0] += 1
+                            pending.remove(task)
+                            pool.apply_async(execute, (name, func))
+                    if running[0]:
+                        condition.wait()
+        finally:
+            pool.close()
+            pool.join()
+        Log.info(self.get_report(total=time.time() - start_time))
+        if errors:
+            raise errors[0]
+        return self.durations
+
+    def get_report(self, total=None):
+        """
+        Get duration of tasks (in the order they were added).
+        """
+        lines = ['Tasks:']
+        for name, _, _ in self.tasks:
+            duration = self.durations.get(name)
+            lines.append('  {0:<30} {1}'.format(name, 'skipped' if duration is None else '{0:.1f}s'.format(duration)))
+        if total is not None:
+            lines.append('  {0:<30} {1:.1f}s'.format('total', total))
+        return '\n'.join(lines)
@@ -1,7 +1,15 @@
+import os
+import sys
+import threading
 import time
 
 
 class Wait(object):
+    # Time spent in fixed sleeps {reason: seconds} and in condition waits (seconds) since last `reset`.
+    SLEEPS = {}
+    WAITS = [0.0]
+    __lock = threading.Lock()
+
     @staticmethod
     def until(condition, timeout=60, period=1, *args, **kwargs):
         """
@@ -9,9 +17,52 @@ class Wait(object):
         :rtype: bool
         :returns: True if condition is satisfied before timeout, otherwise False.
         """
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            if condition(*args, **kwargs):
-                return True
-            time.sleep(period)
-        return False
+        start = time.time()
+        end_time = start + timeout
+        try:
+            while time.time() < end_time:
+                if condition(*args, **kwargs):
+                    return True
+                time.sleep(period)
+            return False
+        finally:
+            with Wait.__lock:
+                Wait.WAITS[0] += time.time() - start
+
+    @staticmethod
+    def sleep(seconds, reason=None):
+        """
+        Sleep fixed time (prefer `until` with real readiness signal, use it only for poll intervals).
+        Sleep time is recorded, see `get_report`.
+        :param seconds: Seconds.
+        :param reason: Reason shown in the report (default is caller, for example `adb.py:wait_until_boot`).
+        """
+        if reason is None:
+            # pylint: disable=protected-access
+            frame = sys._getframe(1)
+            reason = '{0}:{1}'.format(os.path.basename(frame.f_code.co_filename), frame.f_code.co_name)
+        time.sleep(seconds)
+        with Wait.__lock:
+            Wait.SLEEPS[reason] = Wait.SLEEPS.get(reason, 0) + seconds
+
+    @staticmethod
+    def reset():
+        """
+        Reset recorded sleep and wait time (called before each test).
+        """
+        with Wait.__lock:
+            Wait.SLEEPS = {}
+            Wait.WAITS = [0.0]
+
+    @staticmethod
+    def get_report():
+        """
+        Get time spent in fixed sleeps (by reason) and condition waits since last `reset`.
+        """
+        with Wait.__lock:
+            sleeps = sorted(Wait.SLEEPS.items(), key=lambda item: -item[1])
+            total = sum(Wait.SLEEPS.values())
+            lines = ['Sleep time: {0:.1f}s (condition waits: {1:.1f}s)'.format(total, Wait.WAITS[0])]
+        for reason, seconds in sleeps:
+            lines.append('  {0:<50} {1:.1f}s'.format(reason, seconds))
+        return '\n'.join(lines)
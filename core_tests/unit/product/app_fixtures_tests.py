@@ -0,0 +1,61 @@
+import os
+import unittest
+
+from core.settings import Settings
+from core.utils.file_utils import File, Folder
+from products.nativescript import app_fixtures
+from products.nativescript.app_fixtures import AppFixtures
+
+
+# noinspection PyMethodMayBeStatic
+class AppFixturesTests(unittest.TestCase):
+    folder = os.path.join(Settings.TEST_OUT_TEMP, 'app_fixtures')
+
+    def setUp(self):
+        self.fixtures_home = app_fixtures.FIXTURES_HOME
+        app_fixtures.FIXTURES_HOME = os.path.join(self.folder, 'fixtures')
+        Folder.clean(self.folder)
+
+    def tearDown(self):
+        app_fixtures.FIXTURES_HOME = self.fixtures_home
+        Folder.clean(self.folder)
+
+    def test_01_get_key(self):
+        template = os.path.join(self.folder, 'template.tgz')
+        Folder.create(self.folder)
+        File.write(path=template, text='template')
+        key = AppFixtures.get_key(app_name='TestApp', template=template)
+        assert key == AppFixtures.get_key(app_name='TestApp', template=template)
+        assert key != AppFixtures.get_key(app_name='TestApp2', template=template)
+        assert key != AppFixtures.get_key(app_name='TestApp', template=template, app_id='org.test.app')
+        File.write(path=template, text='changed template')
+        assert key != AppFixtures.get_key(app_name='TestApp', template=template)
+        assert AppFixtures.get_key(app_name='TestApp', template=self.folder) is None
+
+    def test_02_save_and_restore(self):
+        app_path = os.path.join(self.folder, 'TestApp')
+        Folder.create(os.path.join(app_path, 'node_modules', 'tns-core-modules'))
+        File.write(path=os.path.join(app_path, 'package.json'), text='{}')
+        File.write(path=os.path.join(app_path, 'node_modules', 'tns-core-modules', 'index.js'), text='modules')
+        assert AppFixtures.restore(key='key', app_path=app_path) is None
+
+        AppFixtures.save(key='key', app_path=app_path, output='Project TestApp was successfully created.')
+        Folder.clean(app_path)
+        output = AppFixtures.restore(key='key', app_path=app_path)
+        assert output == 'Project TestApp was successfully created.'
+        assert File.read(os.path.join(app_path, 'package.json')) == '{}'
+        assert File.read(os.path.join(app_path, 'node_modules', 'tns-core-modules', 'index.js')) == 'modules'
+
+        # Files of the fixture are not hard linked (tools may write in node_modules in place)
+        assert os.stat(os.path.join(app_path, 'node_modules', 'tns-core-modules', 'index.js')).st_nlink == 1
+
+        # Changes in the app do not change the fixture
+        File.replace(path=os.path.join(app_path, 'node_modules', 'tns-core-modules', 'index.js'),
+                     old_string='modules', new_string='changed')
+        Folder.clean(app_path)
+        AppFixtures.restore(key='key', app_path=app_path)
+        assert File.read(os.path.join(app_path, 'node_modules', 'tns-core-modules', 'index.js')) == 'modules'
+
+
+if __name__ == '__main__':
+    unittest.main()
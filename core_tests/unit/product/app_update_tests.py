@@ -0,0 +1,86 @@
+import os
+import unittest
+
+from core.settings import Settings
+from core.utils.file_utils import Folder
+from core.utils.json_utils import JsonUtils
+from products.nativescript.app import App
+
+
+# noinspection PyMethodMayBeStatic
+class AppUpdateTests(unittest.TestCase):
+    folder = os.path.join(Settings.TEST_OUT_TEMP, 'app_update')
+    package_json = os.path.join(folder, 'package.json')
+    data = {'name': 'TestApp',
+            'nativescript': {'id': 'org.nativescript.TestApp'},
+            'dependencies': {'tns-core-modules': '~6.0.0', 'nativescript-angular': '~8.0.0', 'rxjs': '~6.3.0'},
+            'devDependencies': {'nativescript-dev-webpack': '~1.0.0', 'nativescript-dev-typescript': '~0.10.0'}}
+
+    def setUp(self):
+        self.packages = (Settings.Packages.MODULES, Settings.Packages.ANGULAR, Settings.Packages.TYPESCRIPT,
+                         Settings.Packages.WEBPACK)
+        Settings.Packages.MODULES = 'tns-core-modules@next'
+        Settings.Packages.ANGULAR = 'nativescript-angular@8.2.1'
+        Settings.Packages.TYPESCRIPT = 'nativescript-dev-typescript@next'
+        Settings.Packages.WEBPACK = os.path.join(self.folder, 'nativescript-dev-webpack-1.3.0.tgz')
+        Folder.clean(self.folder)
+        Folder.create(self.folder)
+        JsonUtils.write(self.package_json, self.data)
+
+    def tearDown(self):
+        (Settings.Packages.MODULES, Settings.Packages.ANGULAR, Settings.Packages.TYPESCRIPT,
+         Settings.Packages.WEBPACK) = self.packages
+        Folder.clean(self.folder)
+
+    def test_01_get_update_plan(self):
+        plan = App.get_update_plan(data=self.data)
+        assert plan == [('tns-core-modules', 'tns-core-modules@next', False),
+                        ('nativescript-angular', 'nativescript-angular@8.2.1', False),
+                        ('nativescript-dev-webpack', Settings.Packages.WEBPACK, True)]
+
+        plan = App.get_update_plan(data=self.data, modules=False, angular=False, typescript=True, web_pack=False)
+        assert plan == [('nativescript-dev-typescript', 'nativescript-dev-typescript@next', True)]
+
+        assert App.get_update_plan(data={'dependencies': {'rxjs': '~6.3.0'}}) == []
+
+    def test_02_resolve_version(self):
+        def get_version(spec):
+            versions = {'tns-core-modules@next': '6.1.0-next-2019-08-01-123456-01\n',
+                        'tns-core-modules@~6.0.0': "tns-core-modules@6.0.0 '6.0.0'\ntns-core-modules@6.0.1 '6.0.1'\n"}
+            return versions.get(spec, '')
+
+        tgz = os.path.join('sut', 'tns-core-modules.tgz')
+        assert App.resolve_version('tns-core-modules', tgz, get_version) == 'file:' + os.path.abspath(tgz)
+        assert App.resolve_version('tns-core-modules', 'tns-core-modules@6.0.2', get_version) == '6.0.2'
+        assert App.resolve_version('tns-core-modules', 'tns-core-modules@next',
+                                   get_version) == '6.1.0-next-2019-08-01-123456-01'
+        assert App.resolve_version('tns-core-modules', 'tns-core-modules@~6.0.0', get_version) == '6.0.1'
+        # Specs that are not `<package>@<tag>` are saved as they are (for example git urls)
+        git_spec = 'git+https://github.com/NativeScript/NativeScript.git'
+        assert App.resolve_version('tns-core-modules', git_spec, get_version) == git_spec
+        self.assertRaises(AssertionError, App.resolve_version, 'tns-core-modules', 'tns-core-modules@rc',
+                          get_version)
+
+    def test_03_write_update_plan(self):
+        plan = App.get_update_plan(data=self.data, typescript=True)
+        data = App.write_update_plan(package_json=self.package_json, plan=plan,
+                                     get_version=lambda spec: '0.11.0-next\n')
+        assert data == JsonUtils.read(self.package_json)
+        assert data['dependencies'] == {'tns-core-modules': '0.11.0-next', 'nativescript-angular': '8.2.1',
+                                        'rxjs': '~6.3.0'}
+        assert data['devDependencies'] == {'nativescript-dev-webpack': 'file:' + Settings.Packages.WEBPACK,
+                                           'nativescript-dev-typescript': '0.11.0-next'}
+        assert data['nativescript'] == self.data['nativescript'], 'Other content of package.json should be kept.'
+
+    def test_04_update_report(self):
+        steps = [('npm install', 12.5, ['npm uninstall rxjs + npm install rxjs']),
+                 ('update-ns-webpack', 1.5, [])]
+        report = App.get_update_report(steps=steps).splitlines()
+        assert report[0] == 'Updated packages in 14.0 sec:'
+        assert report[1].startswith('  npm install')
+        assert report[1].endswith('12.5 sec (replaces: npm uninstall rxjs + npm install rxjs)')
+        assert report[2].startswith('  update-ns-webpack') and report[2].endswith('1.5 sec')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from products.nativescript.tns_phases import TnsPhases
+
+
+# noinspection PyMethodMayBeStatic
+class TnsPhasesTests(unittest.TestCase):
+    BUILD_ANDROID = [
+        (0.5, 'Preparing project...'),
+        (1.0, 'Running webpack for android...'),
+        (9.0, 'Webpack compilation complete.'),
+        (10.0, 'Project successfully prepared (android)'),
+        (10.5, 'Building project...'),
+        (11.0, 'Gradle build...'),
+        (12.0, '> Task :app:compileDebugJavaWithJavac'),
+        (40.0, 'BUILD SUCCESSFUL in 29s'),
+        (41.0, 'Project successfully built.'),
+    ]
+
+    def test_01_get_phases(self):
+        phases = TnsPhases.get_phases(self.BUILD_ANDROID)
+        assert phases == {TnsPhases.WEBPACK: 8.0, TnsPhases.COPY: 1.0, TnsPhases.GRADLE: 29.0}
+
+    def test_02_get_phases_of_incomplete_log(self):
+        phases = TnsPhases.get_phases(self.BUILD_ANDROID[:7])
+        assert phases[TnsPhases.GRADLE] == 1.0
+        assert TnsPhases.get_phases([]) == {}
+        assert TnsPhases.get_phases(None) == {}
+
+    def test_03_get_phases_of_skipped_prepare(self):
+        phases = TnsPhases.get_phases([(0.2, 'Preparing project...'), (0.3, 'Skipping prepare.')])
+        assert phases == {TnsPhases.COPY: 0.1}
+
+    def test_10_compare(self):
+        baseline = {TnsPhases.WEBPACK: 8.0, TnsPhases.COPY: 1.0, TnsPhases.GRADLE: 20.0}
+        phases = {TnsPhases.WEBPACK: 8.5, TnsPhases.COPY: 1.9, TnsPhases.GRADLE: 29.0, TnsPhases.XCODE: 10}
+        regressions = TnsPhases.compare(phases=phases, baseline=baseline)
+        assert len(regressions) == 1
+        assert regressions[0].startswith('gradle: 29.00s, expected 20.00s')
+
+
+if __name__ == '__main__':
+    unittest.main()
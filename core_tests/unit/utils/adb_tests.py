@@ -0,0 +1,30 @@
+import unittest
+
+from core.utils.device.adb import Adb
+
+
+# noinspection PyMethodMayBeStatic
+class AdbTests(unittest.TestCase):
+
+    def test_01_parse_start_times(self):
+        output = 'Starting: Intent { cmp=org.nativescript.TestApp/com.tns.NativeScriptActivity }\n' \
+                 'Status: ok\n' \
+                 'LaunchState: COLD\n' \
+                 'Activity: org.nativescript.TestApp/com.tns.NativeScriptActivity\n' \
+                 'ThisTime: 1523\n' \
+                 'TotalTime: 1523\n' \
+                 'WaitTime: 1547\n' \
+                 'Complete'
+        assert Adb.parse_start_times(output) == {'ThisTime': 1523, 'TotalTime': 1523, 'WaitTime': 1547}
+        assert Adb.parse_start_times('Error: Activity not started') == {}
+
+    def test_02_parse_displayed_times(self):
+        logcat = 'I/ActivityManager( 1519): Displayed org.nativescript.TestApp/com.tns.NativeScriptActivity: ' \
+                 '+1s234ms\n' \
+                 'I/ActivityManager( 1519): Displayed com.android.launcher3/.Launcher: +500ms\n' \
+                 'I/ActivityTaskManager: Displayed org.nativescript.TestApp/com.tns.NativeScriptActivity: +987ms'
+        assert Adb.parse_displayed_times(logcat, 'org.nativescript.TestApp') == [1234, 987]
+
+
+if __name__ == '__main__':
+    unittest.main()
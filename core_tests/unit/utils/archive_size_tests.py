@@ -0,0 +1,82 @@
+import os
+import unittest
+import zipfile
+
+from core.settings import Settings
+from core.utils.archive_size import ArchiveSize
+from core.utils.file_utils import File, Folder
+
+
+# noinspection PyMethodMayBeStatic
+class ArchiveSizeTests(unittest.TestCase):
+    folder = os.path.join(Settings.TEST_OUT_TEMP, 'archive_size_tests')
+    apk = os.path.join(folder, 'app.apk')
+
+    def setUp(self):
+        Folder.clean(self.folder)
+        Folder.create(self.folder)
+        Helpers.create_zip(self.apk, {'AndroidManifest.xml': 'a' * 100,
+                                      'classes.dex': 'b' * 300,
+                                      'lib/x86/libNativeScript.so': 'c' * 1000,
+                                      'lib/arm64-v8a/libNativeScript.so': 'd' * 2000,
+                                      'assets/app/bundle.js': 'e' * 500,
+                                      'assets/app/vendor.js': 'f' * 700,
+                                      'assets/snapshots/x86/snapshot.blob': 'g' * 400,
+                                      'res/drawable/icon.png': 'h' * 50})
+
+    def tearDown(self):
+        Folder.clean(self.folder)
+
+    def test_01_get_entries(self):
+        entries = ArchiveSize.get_entries(self.apk)
+        assert len(entries) == 8
+        assert entries['classes.dex']['uncompressed'] == 300
+        assert entries['classes.dex']['compressed'] < 300
+        assert ArchiveSize.get_size(entries, 'lib') == 3000
+        assert ArchiveSize.get_size(entries, 'assets/app/') == 1200
+        assert ArchiveSize.get_size(entries, 'assets/snapshots', compressed=True) < 400
+
+    def test_02_get_sizes(self):
+        sizes = ArchiveSize.get_sizes(ArchiveSize.get_entries(self.apk))
+        assert sorted(sizes.keys()) == ['AndroidManifest.xml', 'assets/app', 'assets/snapshots', 'classes.dex',
+                                        'lib/arm64-v8a', 'lib/x86', 'res']
+        assert sizes['assets/app']['uncompressed'] == 1200
+        assert sizes['assets/app']['count'] == 2
+        assert ArchiveSize.get_prefix('Payload/TestApp.app/app/bundle.js') == 'Payload/TestApp.app/app'
+        assert ArchiveSize.get_prefix('lib/libfoo.so') == 'lib'
+
+    def test_03_diff_with_baseline(self):
+        manifest = os.path.join(self.folder, 'baseline', 'app.json')
+        ArchiveSize.save_manifest(ArchiveSize.get_entries(self.apk), manifest)
+        Helpers.create_zip(self.apk, {'AndroidManifest.xml': 'a' * 100,
+                                      'classes.dex': 'b' * 300,
+                                      'lib/x86/libNativeScript.so': 'c' * 1000,
+                                      'lib/arm64-v8a/libNativeScript.so': 'd' * 2000,
+                                      'assets/app/bundle.js': 'e' * 500,
+                                      'assets/app/vendor.js': 'f' * 700 + 'new code',
+                                      'assets/app/new.js': 'i' * 10,
+                                      'res/drawable/icon.png': 'h' * 50})
+        baseline = ArchiveSize.load_manifest(manifest)
+        entries = ArchiveSize.get_entries(self.apk)
+        changes = ArchiveSize.diff(entries=entries, baseline=baseline, compressed=False)
+        assert changes == [('assets/app/new.js', None, 10), ('assets/app/vendor.js', 700, 708),
+                           ('assets/snapshots/x86/snapshot.blob', 400, None)]
+        report = ArchiveSize.get_diff_report(entries=entries, baseline=baseline, compressed=False)
+        assert '3 files changed, -382 bytes' in report
+        assert '+ assets/app/new.js (10 bytes)' in report
+        assert ArchiveSize.diff(entries=entries, baseline=entries) == []
+        assert ArchiveSize.load_manifest(os.path.join(self.folder, 'missing.json')) is None
+
+
+class Helpers(object):
+    @staticmethod
+    def create_zip(path, files):
+        File.delete(path)
+        zip_file = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+        zip_file.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
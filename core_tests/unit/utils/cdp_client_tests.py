@@ -0,0 +1,211 @@
+# pylint: disable=import-error
+import base64
+import hashlib
+import json
+import re
+import struct
+import threading
+import unittest
+
+from core.utils.chrome.cdp_client import CdpClient, CdpError, WS_GUID
+
+try:
+    from socketserver import StreamRequestHandler, TCPServer, ThreadingMixIn
+except ImportError:
+    # Python 2
+    from SocketServer import StreamRequestHandler, TCPServer, ThreadingMixIn
+
+BIG_VALUE = 'x' * 70000
+
+
+class CdpStandIn(ThreadingMixIn, TCPServer):
+    """
+    Local websocket server that answers CDP commands like {N} debug backend (only what tests need).
+    """
+    daemon_threads = True
+
+    def __init__(self):
+        TCPServer.__init__(self, ('127.0.0.1', 0), CdpRequestHandler)
+        self.commands = []
+        self.port = self.server_address[1]
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self.thread.join()
+
+
+class CdpRequestHandler(StreamRequestHandler):
+    def handle(self):
+        lines = []
+        while True:
+            line = self.rfile.readline().decode('latin-1').strip()
+            if not line:
+                break
+            lines.append(line)
+        key = [line.split(':', 1)[1].strip() for line in lines if line.lower().startswith('sec-websocket-key')][0]
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode('ascii')).digest()).decode('ascii')
+        self.request.sendall(('HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n'
+                              'Sec-WebSocket-Accept: ' + accept + '\r\n\r\n').encode('ascii'))
+        # Ping before first message (client should answer with pong and ignore it)
+        self.request.sendall(b'\x89\x04ping')
+        while True:
+            frame = self.read_frame()
+            if frame is None:
+                break
+            opcode, payload = frame
+            if opcode == 0x8:
+                self.request.sendall(b'\x88\x02' + payload[:2])
+                break
+            if opcode == 0x1:
+                self.answer(json.loads(payload.decode('utf-8')))
+
+    def answer(self, message):
+        method, params = message['method'], message['params']
+        self.server.commands.append((method, params))
+        events = []
+        result = {}
+        if method == 'Runtime.enable':
+            events.append(('Runtime.consoleAPICalled', {'type': 'log', 'args': [{'type': 'string',
+                                                                                 'value': 'Test Debug!'}]}))
+        elif method == 'Runtime.evaluate':
+            if params['expression'] == '1024+1024':
+                result = {'result': {'type': 'number', 'value': 2048}}
+            elif params['expression'] == 'big':
+                result = {'result': {'type': 'string', 'value': BIG_VALUE}}
+            else:
+                result = {'result': {'type': 'object'},
+                          'exceptionDetails': {'exception': {'description': 'ReferenceError: not defined'}}}
+        elif method == 'Debugger.setBreakpointByUrl':
+            result = {'breakpointId': '1:16:0:main-view-model', 'locations': []}
+            events.append(('Debugger.paused', {'reason': 'other', 'hitBreakpoints': [result['breakpointId']],
+                                               'callFrames': [{'callFrameId': 'frame-1'}]}))
+        elif method == 'Debugger.evaluateOnCallFrame':
+            result = {'result': {'type': 'object', 'className': 'Observable', 'description': 'Observable'}}
+        elif method == 'Debugger.resume':
+            events.append(('Debugger.resumed', {}))
+        elif method == 'Network.enable':
+            events.append(('Network.requestWillBeSent', {'request': {'url': 'https://httpbin.org/get'}}))
+            events.append(('Network.responseReceived', {'response': {'url': 'https://httpbin.org/get',
+                                                                     'status': 200}}))
+        elif method == 'DOM.getDocument':
+            result = {'root': {'nodeId': 1, 'nodeName': 'Frame', 'children': [
+                {'nodeId': 2, 'nodeName': 'Label', 'attributes': ['text', 'Tap the button']}]}}
+        elif method == 'Unknown.method':
+            self.send({'id': message['id'], 'error': {'code': -32601, 'message': 'Method not found'}})
+            return
+        self.send({'id': message['id'], 'result': result})
+        for event_method, event_params in events:
+            self.send({'method': event_method, 'params': event_params})
+
+    def send(self, message):
+        # Server frames are not masked, long messages are fragmented to test continuation frames
+        payload = json.dumps(message).encode('utf-8')
+        chunks = [payload[i:i + 50000] for i in range(0, len(payload), 50000)]
+        for index, chunk in enumerate(chunks):
+            opcode = 0x1 if index == 0 else 0x0
+            fin = 0x80 if index == len(chunks) - 1 else 0x0
+            if len(chunk) < 126:
+                header = struct.pack('!BB', fin | opcode, len(chunk))
+            elif len(chunk) < 65536:
+                header = struct.pack('!BBH', fin | opcode, 126, len(chunk))
+            else:
+                header = struct.pack('!BBQ', fin | opcode, 127, len(chunk))
+            self.request.sendall(header + chunk)
+
+    def read_frame(self):
+        """
+        Read client frame.
+        :return: (opcode, payload) tuple or None if connection is closed.
+        """
+        data = self.rfile.read(2)
+        if len(data) < 2:
+            return None
+        first, second = bytearray(data)
+        assert second & 0x80, 'Client frames should be masked.'
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack('!H', self.rfile.read(2))[0]
+        elif length == 127:
+            length = struct.unpack('!Q', self.rfile.read(8))[0]
+        mask = bytearray(self.rfile.read(4))
+        payload = bytearray(self.rfile.read(length))
+        return first & 0x0F, bytes(bytearray(b ^ mask[i % 4] for i, b in enumerate(payload)))
+
+
+# noinspection PyMethodMayBeStatic
+class CdpClientTests(unittest.TestCase):
+    stand_in = None
+    url = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.stand_in = CdpStandIn()
+        cls.url = 'ws://localhost:{0}'.format(cls.stand_in.port)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.stand_in.stop()
+
+    def test_01_get_url(self):
+        log = 'To start debugging, open the following URL in Chrome:\n' \
+              'chrome-devtools://devtools/bundled/inspector.html?experiments=true&ws=localhost:40000\n'
+        assert CdpClient.get_url(log) == 'ws://localhost:40000'
+        assert CdpClient.get_url('...inspector.html?ws=127.0.0.1:9229/abc-123') == 'ws://127.0.0.1:9229/abc-123'
+        assert CdpClient.get_url('Successfully synced application') is None
+
+    def test_10_runtime(self):
+        with CdpClient(url=self.url, timeout=5) as client:
+            client.enable(['Runtime'])
+            assert client.evaluate('1024+1024') == 2048
+            assert client.evaluate('big') == BIG_VALUE
+            client.wait_for_console_message('Test Debug!')
+            assert client.get_console_messages() == ['Test Debug!']
+            with self.assertRaises(CdpError) as context:
+                client.evaluate('missing')
+            assert 'ReferenceError' in str(context.exception)
+            with self.assertRaises(CdpError) as context:
+                client.send('Unknown.method')
+            assert 'Method not found' in str(context.exception)
+
+    def test_20_debugger(self):
+        with CdpClient(url=self.url, timeout=5) as client:
+            client.enable(['Debugger'])
+            breakpoint_id = client.set_breakpoint(file_name='main-view-model.js', line=17)
+            paused = client.wait_for_paused()
+            assert paused['hitBreakpoints'] == [breakpoint_id]
+            assert client.evaluate_on_call_frame('viewModel') == 'Observable'
+            client.resume()
+            client.wait_for_event('Debugger.resumed')
+            assert client.paused is None
+        method, params = [command for command in self.stand_in.commands if 'setBreakpoint' in command[0]][-1]
+        assert params['lineNumber'] == 16, 'Line should be 0-based in CDP.'
+        assert CdpClientTests.matches(params['urlRegex'], 'file:///app/main-view-model.js')
+        assert not CdpClientTests.matches(params['urlRegex'], 'file:///app/main-view-model.json')
+        assert method == 'Debugger.setBreakpointByUrl'
+
+    def test_30_network_and_dom(self):
+        with CdpClient(url=self.url, timeout=5) as client:
+            client.enable(['Network', 'DOM'])
+            assert client.wait_for_response('httpbin.org')['status'] == 200
+            assert client.get_requests() == ['https://httpbin.org/get']
+            assert len(client.get_events('Network')) == 2
+            nodes = client.find_nodes('Tap the button')
+            assert [node['nodeId'] for node in nodes] == [2]
+
+    def test_40_timeout(self):
+        with CdpClient(url=self.url, timeout=0.5) as client:
+            with self.assertRaises(CdpError) as context:
+                client.wait_for_event('Debugger.paused')
+            assert 'Timeout' in str(context.exception)
+
+    @staticmethod
+    def matches(regex, url):
+        return re.match(regex, url) is not None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import time
+import unittest
+
+from core.settings import Settings
+from core.utils.chrome.chrome import Chrome
+from core.utils.chrome.chrome_pool import ChromePool
+from core.utils.file_utils import File, Folder
+from core.utils.json_utils import JsonUtils
+
+
+class FakeDriver(object):
+    def __init__(self):
+        self.wait = None
+
+    def implicitly_wait(self, seconds):
+        self.wait = seconds
+
+
+class FakeChrome(object):
+    """
+    Duck type of Chrome object (no browser is started).
+    """
+
+    def __init__(self, alive=True, reset_error=None):
+        self.driver = FakeDriver()
+        self.implicitly_wait = 20
+        self.alive = alive
+        self.reset_error = reset_error
+        self.reset_count = 0
+        self.killed = False
+        self.force = None
+
+    def is_alive(self):
+        return self.alive and not self.killed
+
+    def reset(self):
+        if self.reset_error is not None:
+            raise self.reset_error
+        self.reset_count += 1
+
+    def kill(self, force=False):
+        self.killed = True
+        self.force = force
+
+
+# noinspection PyMethodMayBeStatic
+class ChromePoolTests(unittest.TestCase):
+    reuse = None
+    driver_cache = None
+    cache = os.path.join(Settings.TEST_OUT_TEMP, 'chrome_pool_tests', 'chromedriver.json')
+    driver = os.path.join(Settings.TEST_OUT_TEMP, 'chrome_pool_tests', 'chromedriver')
+
+    def setUp(self):
+        self.reuse = Settings.CHROME_REUSE_SESSION
+        self.driver_cache = Chrome.DRIVER_CACHE
+        Settings.CHROME_REUSE_SESSION = True
+        Chrome.DRIVER_CACHE = self.cache
+        ChromePool.IDLE = []
+        ChromePool.BUSY = []
+        Folder.clean(os.path.dirname(self.cache))
+        Folder.create(os.path.dirname(self.cache))
+        File.write(path=self.driver, text='fake driver')
+
+    def tearDown(self):
+        Settings.CHROME_REUSE_SESSION = self.reuse
+        Chrome.DRIVER_CACHE = self.driver_cache
+        ChromePool.IDLE = []
+        ChromePool.BUSY = []
+        Folder.clean(os.path.dirname(self.cache))
+
+    def test_01_reuse_session(self):
+        chrome = FakeChrome()
+        ChromePool.BUSY.append(chrome)
+        ChromePool.release(chrome)
+        ChromePool.release(chrome)
+        ChromePool.release(None)
+        assert ChromePool.IDLE == [chrome]
+        assert chrome.reset_count == 1, 'Session should be reset once.'
+
+        assert ChromePool.acquire(implicitly_wait=5) is chrome
+        assert ChromePool.BUSY == [chrome]
+        assert chrome.driver.wait == 5
+        assert not chrome.killed
+
+    def test_02_kill_session_if_reuse_disabled(self):
+        Settings.CHROME_REUSE_SESSION = False
+        chrome = FakeChrome()
+        ChromePool.BUSY.append(chrome)
+        ChromePool.release(chrome)
+        assert chrome.killed
+        assert chrome.force is False, 'Only browser of the session should be killed.'
+        assert ChromePool.IDLE == []
+
+    def test_03_kill_broken_sessions(self):
+        broken = FakeChrome(reset_error=Exception('tab crashed'))
+        dead = FakeChrome(alive=False)
+        ChromePool.BUSY.extend([broken, dead])
+        ChromePool.release(broken)
+        ChromePool.release(dead)
+        assert broken.killed and dead.killed
+        assert ChromePool.IDLE == [] and ChromePool.BUSY == []
+
+    def test_04_kill_idle_sessions(self):
+        idle = FakeChrome()
+        busy = FakeChrome()
+        ChromePool.IDLE.append(idle)
+        ChromePool.BUSY.append(busy)
+        ChromePool.kill()
+        assert idle.killed
+        assert not busy.killed
+        assert ChromePool.IDLE == []
+
+    def test_10_cached_driver_path(self):
+        JsonUtils.write(self.cache, {'path': self.driver, 'time': time.time()})
+        assert Chrome.get_cached_driver_path() == self.driver
+        assert Chrome.get_driver_path() == self.driver
+
+    def test_11_expired_driver_path(self):
+        JsonUtils.write(self.cache, {'path': self.driver, 'time': time.time() - Chrome.DRIVER_CACHE_MAX_AGE - 1})
+        assert Chrome.get_cached_driver_path() is None
+        JsonUtils.write(self.cache, {'path': self.driver + '_missing', 'time': time.time()})
+        assert Chrome.get_cached_driver_path() is None
+        File.write(path=self.cache, text='{invalid')
+        assert Chrome.get_cached_driver_path() is None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import unittest
+
+from core.settings import Settings
+from core.utils.file_search import FileSearch
+from core.utils.file_utils import File, Folder
+
+
+# noinspection PyMethodMayBeStatic
+class FileSearchTests(unittest.TestCase):
+    folder = os.path.join(Settings.TEST_OUT_TEMP, 'file_search_tests')
+
+    def setUp(self):
+        Folder.clean(self.folder)
+        for path in ['a_very_long_folder_name/tool',
+                     'x/y/tool',
+                     'x/y/z/tool.exe',
+                     'node_modules/pkg/tool',
+                     'platforms/android/build/outputs/app.aar',
+                     'platforms/android/app/libs/lib.aar',
+                     'build-tools/29.0.2/aapt',
+                     'build-tools/28.0.3/aapt']:
+            Helpers.create_file(os.path.join(self.folder, path))
+
+    def tearDown(self):
+        Folder.clean(self.folder)
+        File.delete(FileSearch.get_index_file(self.folder))
+
+    def test_01_find_closest_to_root(self):
+        matches = FileSearch.find(self.folder, match=lambda name: name == 'tool', max_results=1)
+        assert matches == [os.path.join(self.folder, 'a_very_long_folder_name', 'tool')]
+        matches = FileSearch.find(self.folder, match=lambda name: 'tool' in name)
+        assert len(matches) == 4
+        assert matches[-1] == os.path.join(self.folder, 'x', 'y', 'z', 'tool.exe')
+
+    def test_02_find_with_excludes(self):
+        matches = FileSearch.find(self.folder, match=lambda name: name == 'tool', excludes=['node_modules'])
+        assert os.path.join(self.folder, 'node_modules', 'pkg', 'tool') not in matches
+        assert len(matches) == 2
+        matches = FileSearch.find(self.folder, match=lambda name: name.endswith('.aar'),
+                                  excludes=['platforms/*/build'])
+        assert matches == [os.path.join(self.folder, 'platforms', 'android', 'app', 'libs', 'lib.aar')]
+
+    def test_03_find_with_index(self):
+        aapt = os.path.join(self.folder, 'build-tools', '28.0.3', 'aapt')
+        index_file = FileSearch.get_index_file(self.folder)
+        File.delete(index_file)
+        assert FileSearch.find(self.folder, match=lambda name: name == 'aapt', max_results=1, index=True)[0] == aapt
+        assert File.exists(index_file)
+        assert FileSearch.find(self.folder, match=lambda name: name == 'aapt', max_results=1, index=True)[0] == aapt
+
+        # Index is rebuilt when file is deleted
+        File.delete(aapt)
+        matches = FileSearch.find(self.folder, match=lambda name: name == 'aapt', max_results=1, index=True)
+        assert matches == [os.path.join(self.folder, 'build-tools', '29.0.2', 'aapt')]
+
+        # Index is rebuilt when top level folders change
+        Helpers.create_file(os.path.join(self.folder, 'aapt'))
+        matches = FileSearch.find(self.folder, match=lambda name: name == 'aapt', index=True)
+        assert matches[0] == os.path.join(self.folder, 'aapt')
+
+    def test_10_file_helpers(self):
+        assert File.find(self.folder, 'tool', exact_match=True) == \
+            os.path.join(self.folder, 'a_very_long_folder_name', 'tool')
+        assert File.find(self.folder, 'tool', match_index=-1) == os.path.join(self.folder, 'x', 'y', 'z', 'tool.exe')
+        assert File.pattern_exists(self.folder, '*.aar')
+        assert not File.pattern_exists(self.folder, '*.aar', excludes=['platforms'])
+        assert len(File.find_by_extension(self.folder, 'aar')) == 2
+
+
+class Helpers(object):
+    @staticmethod
+    def create_file(path):
+        Folder.create(os.path.dirname(path))
+        File.write(path=path, text='test')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -60,16 +60,16 @@ class FileUtilsTests(unittest.TestCase):
         content = File.read(path=new_scss)
         assert 'red;' in content, 'Failed to replace string.'
         assert len(content.splitlines()) == 15, 'Unexpected lines count.'
-        assert File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not backup!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(0) == new_scss, "File path is not correct!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(1) == file_name, "File name not correct!"
+        assert File.exists(os.path.join(Settings.BACKUP_FOLDER, TestContext.BACKUP_FILES[new_scss])), "File not backup!"
+        assert new_scss in TestContext.BACKUP_FILES, "File path is not correct!"
+        assert TestContext.BACKUP_FILES[new_scss] == File.get_hash(old_scss), "File hash not correct!"
 
         # Revert
         TnsTest.restore_files()
         content = File.read(path=new_scss)
         assert 'red;' not in content, 'Failed to replace string.'
         assert len(content.splitlines()) == 14, 'Unexpected lines count.'
-        assert not File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not deleted!"
+        assert not Folder.exists(Settings.BACKUP_FOLDER), "Backup not deleted!"
         assert not TestContext.BACKUP_FILES, "File object not deleted!"
 
         File.delete(path=new_scss)
@@ -89,15 +89,15 @@ class FileUtilsTests(unittest.TestCase):
 
         # Replace
         File.delete(path=new_scss, backup_files=True)
-        assert File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not backup!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(0) == new_scss, "File path is not correct!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(1) == file_name, "File name not correct!"
+        assert File.exists(os.path.join(Settings.BACKUP_FOLDER, TestContext.BACKUP_FILES[new_scss])), "File not backup!"
+        assert new_scss in TestContext.BACKUP_FILES, "File path is not correct!"
+        assert TestContext.BACKUP_FILES[new_scss] == File.get_hash(old_scss), "File hash not correct!"
 
         # Revert
         TnsTest.restore_files()
         content = File.read(path=new_scss)
         assert len(content.splitlines()) == 14, 'Unexpected lines count.'
-        assert not File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not deleted!"
+        assert not Folder.exists(Settings.BACKUP_FOLDER), "Backup not deleted!"
         assert not TestContext.BACKUP_FILES, "File object not deleted!"
 
         File.delete(path=new_scss)
@@ -117,14 +117,14 @@ class FileUtilsTests(unittest.TestCase):
         File.copy(source=old_scss, target=folder_name, backup_files=True)
         assert File.exists(new_scss)
         assert len(File.read(path=new_scss).splitlines()) == 14, 'Unexpected lines count.'
-        assert not File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File should not be backup!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(0) == new_scss, "File path is not correct!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(1) == file_name, "File name not correct!"
+        assert not Folder.exists(Settings.BACKUP_FOLDER), "File should not be backup!"
+        assert new_scss in TestContext.BACKUP_FILES, "File path is not correct!"
+        assert TestContext.BACKUP_FILES[new_scss] is None, "New file should not be backup!"
 
         # Revert
         TnsTest.restore_files()
         assert not File.exists(new_scss)
-        assert not File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not deleted!"
+        assert not Folder.exists(Settings.BACKUP_FOLDER), "Backup not deleted!"
         assert not TestContext.BACKUP_FILES, "File object not deleted!"
 
     def test_06_copy_to_not_existing_file_with_restore(self):
@@ -142,14 +142,14 @@ class FileUtilsTests(unittest.TestCase):
         File.copy(source=old_scss, target=new_scss, backup_files=True)
         assert File.exists(new_scss)
         assert len(File.read(path=new_scss).splitlines()) == 14, 'Unexpected lines count.'
-        assert not File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not backup!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(0) == new_scss, "File path is not correct!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(1) == file_name, "File name not correct!"
+        assert not Folder.exists(Settings.BACKUP_FOLDER), "File should not be backup!"
+        assert new_scss in TestContext.BACKUP_FILES, "File path is not correct!"
+        assert TestContext.BACKUP_FILES[new_scss] is None, "New file should not be backup!"
 
         # Revert
         TnsTest.restore_files()
         assert not File.exists(new_scss)
-        assert not File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not deleted!"
+        assert not Folder.exists(Settings.BACKUP_FOLDER), "Backup not deleted!"
         assert not TestContext.BACKUP_FILES, "File object not deleted!"
 
     def test_07_copy_to_existing_file_with_restore(self):
@@ -182,9 +182,9 @@ class FileUtilsTests(unittest.TestCase):
         assert 'red;' not in content, 'Failed to copy file!'
         assert len(content.splitlines()) == 14, 'Unexpected lines count.'
         assert File.exists(new_scss)
-        assert File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not backup!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(0) == new_scss, "File path is not correct!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(1) == file_name, "File name not correct!"
+        assert File.exists(os.path.join(Settings.BACKUP_FOLDER, TestContext.BACKUP_FILES[new_scss])), "File not backup!"
+        assert new_scss in TestContext.BACKUP_FILES, "File path is not correct!"
+        assert TestContext.BACKUP_FILES[new_scss] != File.get_hash(new_scss), "File hash not correct!"
 
         # Revert
         TnsTest.restore_files()
@@ -192,7 +192,7 @@ class FileUtilsTests(unittest.TestCase):
         content = File.read(path=new_scss)
         assert 'red;' in content, 'Failed to replace string.'
         assert len(content.splitlines()) == 15, 'Unexpected lines count.'
-        assert not File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not deleted!"
+        assert not Folder.exists(Settings.BACKUP_FOLDER), "Backup not deleted!"
         assert not TestContext.BACKUP_FILES, "File object not deleted!"
 
         File.delete(path=new_scss)
@@ -252,18 +252,18 @@ class FileUtilsTests(unittest.TestCase):
         assert 'red;' in content, 'Failed to copy file!'
         assert len(content.splitlines()) == 15, 'Unexpected lines count.'
         assert File.exists(new_scss_new3)
-        assert File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not backup!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(0) == new_scss_new3, "File path is not correct!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(1) == file_name, "File name not correct!"
+        backup = os.path.join(Settings.BACKUP_FOLDER, TestContext.BACKUP_FILES[new_scss_new3])
+        assert File.exists(backup), "File not backup!"
+        assert new_scss_new3 in TestContext.BACKUP_FILES, "File path is not correct!"
 
         File.copy(source=new_scss_new2, target=new_scss_new4, backup_files=True)
         content = File.read(path=new_scss_new4)
         assert 'pink;' in content, 'Failed to copy file!'
         assert len(content.splitlines()) == 15, 'Unexpected lines count.'
         assert File.exists(new_scss_new3)
-        assert File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not backup!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(0) == new_scss_new4, "File path is not correct!"
-        assert TestContext.BACKUP_FILES.items()[0].__getitem__(1) == (file_name + "1"), "File name not correct!"
+        backup = os.path.join(Settings.BACKUP_FOLDER, TestContext.BACKUP_FILES[new_scss_new4])
+        assert File.exists(backup), "File not backup!"
+        assert new_scss_new4 in TestContext.BACKUP_FILES, "File path is not correct!"
 
         # Revert
         TnsTest.restore_files()
@@ -271,13 +271,13 @@ class FileUtilsTests(unittest.TestCase):
         content = File.read(path=new_scss_new3)
         assert 'red;' not in content, 'Failed to replace string.'
         assert len(content.splitlines()) == 14, 'Unexpected lines count.'
-        assert not File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not deleted!"
+        assert not Folder.exists(Settings.BACKUP_FOLDER), "Backup not deleted!"
         assert not TestContext.BACKUP_FILES, "File object not deleted!"
         assert File.exists(new_scss_new4)
         content = File.read(path=new_scss_new4)
         assert 'pink;' not in content, 'Failed to replace string.'
         assert len(content.splitlines()) == 14, 'Unexpected lines count.'
-        assert not File.exists(os.path.join(Settings.BACKUP_FOLDER, file_name)), "File not deleted!"
+        assert not Folder.exists(Settings.BACKUP_FOLDER), "Backup not deleted!"
         assert not TestContext.BACKUP_FILES, "File object not deleted!"
 
         Folder.clean(folder_name_new1)
@@ -285,6 +285,147 @@ class FileUtilsTests(unittest.TestCase):
         Folder.clean(folder_name_new3)
         Folder.clean(folder_name_new4)
 
+    def test_09_restore_only_changed_files(self):
+        TestContext.BACKUP_FILES.clear()
+        Folder.clean(Settings.BACKUP_FOLDER)
+        folder = os.path.join(Settings.TEST_OUT_TEMP, 'restore')
+        Folder.clean(folder)
+        Folder.create(folder)
+        changed = os.path.join(folder, 'changed.txt')
+        not_changed = os.path.join(folder, 'not_changed.txt')
+        created = os.path.join(folder, 'created.txt')
+        File.write(path=changed, text='text')
+        File.write(path=not_changed, text='text')
+        File.copy(source=changed, target=created, backup_files=True)
+        File.replace(path=changed, old_string='text', new_string='new text', backup_files=True)
+        File.replace(path=changed, old_string='new text', new_string='newer text', backup_files=True)
+        File.replace(path=not_changed, old_string='text', new_string='new text', backup_files=True)
+        File.replace(path=not_changed, old_string='new text', new_string='text')
+
+        restored = File.restore_files()
+        assert sorted(restored) == sorted([changed, created]), 'Unexpected files restored: {0}'.format(restored)
+        assert File.read(changed) == 'text'
+        assert File.read(not_changed) == 'text'
+        assert not File.exists(created)
+        assert not File.is_shared(changed)
+        Folder.clean(folder)
+
+    def test_10_replace_all(self):
+        folder = os.path.join(Settings.TEST_OUT_TEMP, 'replace_all')
+        Folder.clean(folder)
+        Folder.create(folder)
+        js_file = os.path.join(folder, 'app.js')
+        css_file = os.path.join(folder, 'app.css')
+        File.write(path=js_file, text='taps left')
+        File.write(path=css_file, text='font-size: 18')
+        js_inode = os.stat(js_file).st_ino
+
+        edits = [(js_file, 'taps', 'clicks'), (css_file, 'font-size: 18', 'font-size: 50'), (js_file, 'left', 'right')]
+        assert File.replace_all(edits=edits) == [js_file, css_file]
+        assert File.read(js_file) == 'clicks right'
+        assert File.read(css_file) == 'font-size: 50'
+        assert os.stat(js_file).st_ino != js_inode, 'File should be replaced by rename.'
+        assert sorted(os.listdir(folder)) == ['app.css', 'app.js'], 'Temp files should not be left in folder.'
+
+        # Files without changes are not written
+        assert File.replace_all(edits=[(js_file, 'taps', 'clicks')], fail_safe=True) == []
+        self.assertRaises(AssertionError, File.replace_all, [(js_file, 'taps', 'clicks')])
+        Folder.clean(folder)
+
+    def test_11_backup_same_content_stored_once(self):
+        TestContext.BACKUP_FILES.clear()
+        Folder.clean(Settings.BACKUP_FOLDER)
+        folder = os.path.join(Settings.TEST_OUT_TEMP, 'backup_store')
+        Folder.clean(folder)
+        Folder.create(folder)
+        original = os.path.join(folder, 'original.txt')
+        first = os.path.join(folder, 'first.txt')
+        second = os.path.join(folder, 'second.txt')
+        for path in [original, first, second]:
+            File.write(path=path, text='text')
+
+        File.replace(path=first, old_string='text', new_string='first', backup_files=True)
+        File.copy(source=first, target=second, backup_files=True)
+        assert TestContext.BACKUP_FILES[first] == File.get_hash(original), "File hash not correct!"
+        assert TestContext.BACKUP_FILES[second] == TestContext.BACKUP_FILES[first], "File hash not correct!"
+        assert os.listdir(Settings.BACKUP_FOLDER) == [TestContext.BACKUP_FILES[first]], "Same content stored twice!"
+
+        File.restore_files()
+        assert File.read(first) == 'text'
+        assert File.read(second) == 'text'
+        assert not Folder.exists(Settings.BACKUP_FOLDER), "Backup not deleted!"
+        Folder.clean(folder)
+
+    def test_20_get_folder_size(self):
+        folder = os.path.join(Settings.TEST_OUT_TEMP, 'folder_size')
+        Folder.clean(folder)
+        for index in range(4):
+            Folder.create(os.path.join(folder, 'sub{0}'.format(index), 'nested'))
+            File.write(path=os.path.join(folder, 'sub{0}'.format(index), 'nested', 'file.txt'), text='a' * 100)
+        File.write(path=os.path.join(folder, 'file.txt'), text='b' * 50)
+        os.symlink(os.path.join(folder, 'sub0'), os.path.join(folder, 'link_to_sub0'))
+        expected = 450
+        assert Folder.get_size(folder) == expected
+        assert Folder.get_size(folder, workers=4) == expected
+        assert Folder.get_size(os.path.join(folder, 'not_existing')) == 0
+
+        # Cache is invalidated when files are added or removed
+        assert Folder.get_size(folder, workers=4, cache=True) == expected
+        assert Folder.get_size(folder, cache=True) == expected
+        File.write(path=os.path.join(folder, 'sub1', 'nested', 'new.txt'), text='c' * 10)
+        assert Folder.get_size(folder, cache=True) == expected + 10
+        File.delete(path=os.path.join(folder, 'sub2', 'nested', 'file.txt'))
+        assert Folder.get_size(folder, cache=True) == expected + 10 - 100
+        Folder.clean(folder)
+
+    def test_21_clone_folder(self):
+        source = os.path.join(Settings.TEST_OUT_TEMP, 'clone_source')
+        target = os.path.join(Settings.TEST_OUT_TEMP, 'clone_target')
+        Folder.clean(source)
+        Folder.create(os.path.join(source, 'app'))
+        Folder.create(os.path.join(source, 'node_modules', 'module', 'lib'))
+        File.write(path=os.path.join(source, 'app', 'app.js'), text='app')
+        File.write(path=os.path.join(source, 'node_modules', 'module', 'lib', 'index.js'), text='module')
+        os.symlink(os.path.join('..', 'node_modules', 'module'), os.path.join(source, 'app', 'link_to_module'))
+
+        result = Folder.clone(source=source, target=target, workers=2)
+        assert sum(result.values()) == 2
+        assert File.read(os.path.join(target, 'app', 'app.js')) == 'app'
+        assert File.read(os.path.join(target, 'node_modules', 'module', 'lib', 'index.js')) == 'module'
+        link = os.path.join(target, 'app', 'link_to_module')
+        assert os.readlink(link) == os.path.join('..', 'node_modules', 'module')
+        assert not File.is_shared(os.path.join(target, 'app', 'app.js'))
+        if result['reflink'] == 0:
+            assert File.is_shared(os.path.join(target, 'node_modules', 'module', 'lib', 'index.js'))
+
+        # Edits never write through to the source folder
+        module_file = os.path.join(target, 'node_modules', 'module', 'lib', 'index.js')
+        File.replace(path=module_file, old_string='module', new_string='changed')
+        assert not File.is_shared(module_file)
+        assert File.read(module_file) == 'changed'
+        assert File.read(os.path.join(source, 'node_modules', 'module', 'lib', 'index.js')) == 'module'
+
+        Folder.copy(source=source, target=target, clone=True)
+        assert File.read(module_file) == 'module'
+        File.copy(source=os.path.join(source, 'app', 'app.js'), target=module_file)
+        assert File.read(module_file) == 'app'
+        assert File.read(os.path.join(source, 'node_modules', 'module', 'lib', 'index.js')) == 'module'
+
+        # Nothing is hard linked if there are no shared folders
+        Folder.copy(source=source, target=target, clone=True, shared=[])
+        assert not File.is_shared(module_file)
+        Folder.clean(source)
+        Folder.clean(target)
+
+    def test_22_clean_in_background(self):
+        folder = os.path.join(Settings.TEST_OUT_TEMP, 'clean_in_background')
+        Folder.create(os.path.join(folder, 'node_modules', 'module'))
+        File.write(path=os.path.join(folder, 'node_modules', 'module', 'index.js'), text='module')
+        Folder.clean(folder, background=True)
+        assert not Folder.exists(folder)
+        Folder.flush()
+        assert not [name for name in os.listdir(Settings.TRASH_HOME) if name.startswith('clean_in_background')]
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import time
+import unittest
+
+from core.base_test.fixtures import Fixtures
+from core.enums.fixture_type import FixtureType
+from core.enums.os_type import OSType
+from core.settings import Settings
+from core.utils.gradle import Gradle
+
+
+# noinspection PyMethodMayBeStatic
+@unittest.skipIf(Settings.HOST_OS is OSType.WINDOWS, 'Fake gradle daemon is not supported on Windows.')
+class FixturesTests(unittest.TestCase):
+    def setUp(self):
+        self.durations = dict(Fixtures.DURATIONS)
+        self.daemon = None
+
+    def tearDown(self):
+        if self.daemon is not None and self.daemon.poll() is None:
+            self.daemon.kill()
+            self.daemon.wait()
+        Fixtures.DURATIONS = self.durations
+
+    def test_01_clean_gradle(self):
+        # Process with the same main class in command line as real Gradle daemon
+        cmd = [sys.executable, '-c', 'import time; time.sleep(60)', Gradle.DAEMON_MAIN]
+        self.daemon = subprocess.Popen(cmd)
+        time.sleep(0.1)
+
+        actions = Fixtures.setup(fixtures=[FixtureType.CLEAN_GRADLE])
+        assert actions[str(FixtureType.CLEAN_GRADLE)] == '1 daemon(s) running'
+        self.daemon.wait()
+        assert Gradle.get_daemons() == []
+
+        # Nothing to fix on second run
+        actions = Fixtures.setup(fixtures=[FixtureType.CLEAN_GRADLE])
+        assert actions == {'tns': None, str(FixtureType.CLEAN_GRADLE): None}
+        assert str(FixtureType.CLEAN_GRADLE) in Fixtures.get_report()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import unittest
+
+from core.settings import Settings
+from core.utils.file_utils import File, Folder
+from core.utils.git import Git
+from core.utils.run import run
+
+
+# noinspection PyMethodMayBeStatic
+class GitTests(unittest.TestCase):
+    repo = os.path.join(Settings.TEST_OUT_TEMP, 'git', 'repo')
+    mirror = os.path.join(Settings.TEST_OUT_TEMP, 'git', 'mirror.git')
+    clone = os.path.join(Settings.TEST_OUT_TEMP, 'git', 'clone')
+
+    def setUp(self):
+        Folder.clean(os.path.join(Settings.TEST_OUT_TEMP, 'git'))
+        Folder.create(os.path.join(self.repo, 'packages', 'template'))
+        run(cmd='git init', cwd=self.repo)
+        run(cmd='git checkout -b master', cwd=self.repo)
+        self.commit('first')
+
+    def tearDown(self):
+        Folder.clean(os.path.join(Settings.TEST_OUT_TEMP, 'git'))
+
+    def commit(self, text):
+        File.write(path=os.path.join(self.repo, 'packages', 'template', 'package.json'), text=text)
+        run(cmd='git add -A', cwd=self.repo)
+        run(cmd='git -c user.name=test -c user.email=test@test.com commit -m "{0}"'.format(text), cwd=self.repo)
+
+    def test_01_mirror(self):
+        commit = Git.get_remote_commit(repo_url=self.repo, branch='master')
+        assert commit == run(cmd='git rev-parse HEAD', cwd=self.repo).output.strip()
+        assert Git.get_remote_commit(repo_url=self.repo, branch='not-existing') is None
+        assert Git.rev_parse(repo=self.mirror, rev='master') is None
+
+        assert Git.update_mirror(repo_url=self.repo, mirror=self.mirror)
+        assert Git.rev_parse(repo=self.mirror, rev='master') == commit
+        tree = Git.rev_parse(repo=self.mirror, rev='master:packages/template')
+        assert tree is not None
+        assert Git.rev_parse(repo=self.mirror, rev='master:packages/not-existing') is None
+
+        self.commit('second')
+        assert Git.get_remote_commit(repo_url=self.repo, branch='master') != commit
+        assert Git.update_mirror(repo_url=self.repo, mirror=self.mirror)
+        assert Git.rev_parse(repo=self.mirror, rev='master:packages/template') != tree
+
+        Git.clone(repo_url=self.repo, local_folder=self.clone, reference=self.mirror)
+        assert File.read(os.path.join(self.clone, 'packages', 'template', 'package.json')) == 'second'
+
+
+if __name__ == '__main__':
+    unittest.main()
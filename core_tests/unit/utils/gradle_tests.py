@@ -0,0 +1,49 @@
+import os
+import signal
+import subprocess
+import sys
+import time
+import unittest
+
+from core.enums.os_type import OSType
+from core.settings import Settings
+from core.utils.gradle import Gradle
+
+
+# noinspection PyMethodMayBeStatic
+@unittest.skipIf(Settings.HOST_OS is OSType.WINDOWS, 'Fake daemons are stopped with SIGSTOP.')
+class GradleTests(unittest.TestCase):
+    def setUp(self):
+        self.processes = []
+
+    def tearDown(self):
+        for proc in self.processes:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+
+    def start_fake_daemon(self):
+        # Process with the same main class in command line as real Gradle daemon
+        cmd = [sys.executable, '-c', 'import time; time.sleep(60)', Gradle.DAEMON_MAIN]
+        proc = subprocess.Popen(cmd)
+        self.processes.append(proc)
+        time.sleep(0.1)
+        return proc
+
+    def test_01_kill_stuck(self):
+        healthy = self.start_fake_daemon()
+        stopped = self.start_fake_daemon()
+        extra = self.start_fake_daemon()
+        os.kill(stopped.pid, signal.SIGSTOP)
+        assert [proc.pid for proc in Gradle.get_daemons()] == [healthy.pid, stopped.pid, extra.pid]
+
+        killed = Gradle.kill_stuck()
+        assert sorted(killed) == sorted([stopped.pid, extra.pid])
+        assert [proc.pid for proc in Gradle.get_daemons()] == [healthy.pid]
+
+        # Healthy daemon is reused
+        assert Gradle.kill_stuck() == []
+
+
+if __name__ == '__main__':
+    unittest.main()
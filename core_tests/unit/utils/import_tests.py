@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from core.settings import Settings
+from core.utils.lazy_import import LazyModule
+
+# Time budget (in seconds) for import of base test class (without device or browser tests).
+IMPORT_BUDGET = 1.0
+
+# Modules that should be imported only when images are checked or browser is started.
+HEAVY_MODULES = ['cv2', 'numpy', 'pytesseract', 'PIL', 'selenium', 'webdriver_manager']
+
+SCRIPT = """
+import json, sys, time
+start = time.time()
+import core.base_test.tns_test
+duration = time.time() - start
+print(json.dumps({'duration': duration, 'modules': [m for m in sys.modules if m.split('.')[0] in %r]}))
+""" % HEAVY_MODULES
+
+
+# noinspection PyMethodMayBeStatic
+class ImportTests(unittest.TestCase):
+    def test_01_lazy_module(self):
+        module = LazyModule('fractions')
+        assert not module.is_loaded()
+        assert str(module.Fraction(1, 2)) == '1/2'
+        assert module.is_loaded()
+
+    def test_02_import_budget(self):
+        # ANDROID_HOME is not required for tests that do not use Android devices.
+        env = dict(os.environ)
+        env.pop('ANDROID_HOME', None)
+        output = subprocess.check_output([sys.executable, '-c', SCRIPT], cwd=Settings.TEST_RUN_HOME, env=env)
+        result = json.loads(output.decode('utf-8').strip().splitlines()[-1])
+        assert result['modules'] == [], 'Heavy modules imported: {0}'.format(result['modules'])
+        assert result['duration'] < IMPORT_BUDGET, 'Import took {0:.2f} sec.'.format(result['duration'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import unittest
+
+from core.settings import Settings
+from core.utils.file_utils import File, Folder
+from core.utils.json_utils import JsonUtils
+
+
+# noinspection PyMethodMayBeStatic
+class JsonUtilsTests(unittest.TestCase):
+    folder = os.path.join(Settings.TEST_OUT_TEMP, 'json_utils_tests')
+    json_file = os.path.join(folder, 'package.json')
+
+    def setUp(self):
+        Folder.clean(self.folder)
+        Folder.create(self.folder)
+        JsonUtils.write(file_path=self.json_file, data={'name': 'app', 'version': '1.0.0'})
+
+    def tearDown(self):
+        Folder.clean(self.folder)
+
+    def test_01_read_cached(self):
+        data = JsonUtils.read_cached(self.json_file)
+        assert data['name'] == 'app'
+        assert JsonUtils.read_cached(self.json_file) is data, 'Parsed content of not modified file should be reused.'
+
+    def test_02_read_cached_after_modification(self):
+        data = JsonUtils.read_cached(self.json_file)
+
+        JsonUtils.replace(file_path=self.json_file, key='version', value='2.0.0')
+        data = JsonUtils.read_cached(self.json_file)
+        assert data['version'] == '2.0.0'
+
+        JsonUtils.write(file_path=self.json_file, data={'name': 'app', 'version': '3.0.0'})
+        assert JsonUtils.read_cached(self.json_file)['version'] == '3.0.0'
+
+        # Files modified without JsonUtils are detected by size and mtime.
+        File.write(path=self.json_file, text='{"name": "app", "version": "4.0.0", "private": true}')
+        assert JsonUtils.read_cached(self.json_file)['version'] == '4.0.0'
+        assert JsonUtils.read_cached(self.json_file) is not data
+
+    def test_03_read_cached_missing_file(self):
+        self.assertRaises(IOError, JsonUtils.read_cached, os.path.join(self.folder, 'missing.json'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import time
+import unittest
+
+from core.utils.device.adb import Adb
+from core.utils.device.memory_sampler import MemorySampler
+from core.utils.file_utils import File
+
+
+# noinspection PyMethodMayBeStatic
+class MemorySamplerTests(unittest.TestCase):
+    current_folder = os.path.dirname(os.path.realpath(__file__))
+    meminfo = File.read(os.path.join(current_folder, 'resources', 'meminfo.txt'))
+    proc_status = File.read(os.path.join(current_folder, 'resources', 'proc_status.txt'))
+
+    def test_01_parse_meminfo(self):
+        info = Adb.parse_meminfo(self.meminfo)
+        assert info == {'pid': 4321, 'pss': 41523, 'java_heap': 6104, 'native_heap': 21300}
+
+    def test_02_parse_meminfo_without_app_summary(self):
+        output = self.meminfo.split(' App Summary')[0]
+        info = Adb.parse_meminfo(output)
+        assert info == {'pid': 4321, 'pss': 41523, 'java_heap': 4456, 'native_heap': 21345}
+
+    def test_03_parse_meminfo_app_not_running(self):
+        assert Adb.parse_meminfo('No process found for: org.nativescript.TestApp') == {}
+
+    def test_04_parse_proc_status(self):
+        assert Adb.parse_proc_status(self.proc_status) == {'vm_rss': 87654, 'vm_hwm': 98765, 'threads': 27}
+
+    def test_10_sampler(self):
+        base = Adb.parse_meminfo(self.meminfo)
+        values = iter([30000, 50000, 40000])
+
+        def read():
+            info = dict(base)
+            info['pss'] = next(values, 40000)
+            return info
+
+        with MemorySampler(read=read, interval=0.05) as sampler:
+            while len(sampler.samples) < 3:
+                time.sleep(0.01)
+        summary = sampler.get_summary()
+        assert 'pid' not in summary
+        assert summary['pss']['peak'] == 50000
+        assert 30000 < summary['pss']['mean'] < 50000
+        assert summary['native_heap'] == {'peak': 21300, 'mean': 21300}
+        series = sampler.get_series('pss')
+        assert [value for _, value in series[:3]] == [30000, 50000, 40000]
+        assert series == sorted(series)
+
+    def test_11_sampler_app_not_running(self):
+        with MemorySampler(read=lambda: {}, interval=0.05) as sampler:
+            pass
+        assert sampler.samples == []
+        assert sampler.get_summary() == {}
+
+
+if __name__ == '__main__':
+    unittest.main()
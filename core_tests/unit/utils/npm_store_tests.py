@@ -0,0 +1,105 @@
+# pylint: disable=import-error
+# pylint: disable=no-name-in-module
+import hashlib
+import json
+import os
+import threading
+import unittest
+
+from core.settings import Settings
+from core.utils.file_utils import Folder
+from core.utils.npm_store import NpmStore, StoreServer
+
+try:
+    from http.server import BaseHTTPRequestHandler
+    from urllib.request import urlopen
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler
+    from urllib2 import urlopen
+
+TARBALL = b'fake tarball content'
+
+
+class UpstreamHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        UpstreamHandler.requests.append(self.path)
+        url = 'http://{0}:{1}'.format(*self.server.server_address[:2])
+        if self.path == '/fake-package':
+            dist = {'tarball': url + '/fake-package/-/fake-package-1.0.0.tgz',
+                    'shasum': hashlib.sha1(TARBALL).hexdigest()}
+            body = json.dumps({'name': 'fake-package', 'dist-tags': {'latest': '1.0.0'},
+                               'versions': {'1.0.0': {'name': 'fake-package', 'version': '1.0.0', 'dist': dist}}})
+            body = body.encode('utf-8')
+        elif self.path == '/fake-package/-/fake-package-1.0.0.tgz':
+            body = TARBALL
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # pylint: disable=redefined-builtin
+        pass
+
+
+# noinspection PyMethodMayBeStatic
+class NpmStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.settings = (Settings.NPM_STORE, Settings.NPM_REGISTRY, NpmStore.MAX_AGE)
+        Settings.NPM_STORE = os.path.join(Settings.TEST_OUT_TEMP, 'npm_store')
+        Folder.clean(Settings.NPM_STORE)
+        self.upstream = StoreServer(('127.0.0.1', 0), UpstreamHandler)
+        thread = threading.Thread(target=self.upstream.serve_forever)
+        thread.daemon = True
+        thread.start()
+        Settings.NPM_REGISTRY = 'http://127.0.0.1:{0}'.format(self.upstream.server_address[1])
+        UpstreamHandler.requests = []
+
+    def tearDown(self):
+        NpmStore.stop()
+        self.stop_upstream()
+        Folder.clean(Settings.NPM_STORE)
+        Settings.NPM_STORE, Settings.NPM_REGISTRY, NpmStore.MAX_AGE = self.settings
+
+    def stop_upstream(self):
+        if self.upstream is not None:
+            self.upstream.shutdown()
+            self.upstream.server_close()
+            self.upstream = None
+
+    def test_01_serve_from_store(self):
+        url = NpmStore.start()
+        assert os.environ['npm_config_registry'] == url
+        packument = json.loads(urlopen(url + '/fake-package').read().decode('utf-8'))
+        tarball_url = packument['versions']['1.0.0']['dist']['tarball']
+        assert tarball_url == url + '/fake-package/-/fake-package-1.0.0.tgz'
+        assert urlopen(tarball_url).read() == TARBALL
+
+        # Saved metadata and tarballs are used without requests to upstream registry
+        requests = len(UpstreamHandler.requests)
+        urlopen(url + '/fake-package').read()
+        assert urlopen(tarball_url).read() == TARBALL
+        assert len(UpstreamHandler.requests) == requests
+
+        NpmStore.stop()
+        assert os.environ.get('npm_config_registry') != url
+
+    def test_02_serve_without_network(self):
+        url = NpmStore.start()
+        tarball_url = url + '/fake-package/-/fake-package-1.0.0.tgz'
+        assert urlopen(tarball_url).read() == TARBALL
+        self.stop_upstream()
+        NpmStore.MAX_AGE = 0
+        packument = json.loads(urlopen(url + '/fake-package').read().decode('utf-8'))
+        assert packument['dist-tags']['latest'] == '1.0.0'
+        assert urlopen(tarball_url).read() == TARBALL
+        self.assertRaises(Exception, urlopen, url + '/not-existing-package')
+
+
+if __name__ == '__main__':
+    unittest.main()
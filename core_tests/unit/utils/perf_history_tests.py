@@ -0,0 +1,97 @@
+import os
+import unittest
+
+from core.enums.platform_type import Platform
+from core.settings import Settings
+from core.utils.file_utils import File
+from core.utils.perf_history import PerfHistory
+
+
+# noinspection PyMethodMayBeStatic
+class PerfHistoryTests(unittest.TestCase):
+    history_file = os.path.join(Settings.TEST_OUT_HOME, 'perf_history_tests.jsonl')
+
+    def setUp(self):
+        File.delete(self.history_file)
+
+    def tearDown(self):
+        File.delete(self.history_file)
+
+    def test_01_record_and_read(self):
+        for value in [10, 11, 12]:
+            PerfHistory.record(template='hello-world-js', platform=Platform.ANDROID, metric='build_initial',
+                               value=value, history_file=self.history_file)
+        PerfHistory.record(template='hello-world-js', platform=Platform.IOS, metric='build_initial',
+                           value=20, history_file=self.history_file)
+        entries = PerfHistory.get_entries(template='hello-world-js', platform=Platform.ANDROID,
+                                          metric='build_initial', history_file=self.history_file)
+        assert [e['value'] for e in entries] == [10, 11, 12]
+        assert entries[0]['host'] == PerfHistory.get_host_fingerprint()
+        assert entries[0]['versions']['cli'] == Settings.Packages.NS_CLI
+        assert entries[0]['platform'] == 'android'
+
+    def test_02_broken_lines_are_skipped(self):
+        PerfHistory.record(template='hello-world-js', platform=Platform.ANDROID, metric='build_initial',
+                           value=10, history_file=self.history_file)
+        File.append(self.history_file, '{"broken":\n')
+        assert len(PerfHistory.read(history_file=self.history_file)) == 1
+
+    def test_03_baseline(self):
+        assert PerfHistory.get_baseline(template='hello-world-js', platform=Platform.ANDROID, metric='build_initial',
+                                        history_file=self.history_file) is None
+        for value in [10, 14, 11, 12, 30]:
+            PerfHistory.record(template='hello-world-js', platform=Platform.ANDROID, metric='build_initial',
+                               value=value, history_file=self.history_file)
+        assert PerfHistory.get_baseline(template='hello-world-js', platform=Platform.ANDROID, metric='build_initial',
+                                        history_file=self.history_file) == 12
+        assert PerfHistory.get_baseline(template='hello-world-js', platform=Platform.ANDROID, metric='build_initial',
+                                        skip=1, history_file=self.history_file) == 11.5
+
+    def test_04_conditions(self):
+        for value in [10, 11, 12]:
+            PerfHistory.record(template='hello-world-js', platform=Platform.ANDROID, metric='build_initial',
+                               value=value, history_file=self.history_file)
+        for value in [20, 21]:
+            PerfHistory.record(template='hello-world-js', platform=Platform.ANDROID, metric='build_initial',
+                               value=value, conditions='clean-cache', history_file=self.history_file)
+        entries = PerfHistory.get_entries(template='hello-world-js', platform=Platform.ANDROID,
+                                          metric='build_initial', history_file=self.history_file)
+        assert len(entries) == 5
+        assert PerfHistory.get_baseline(template='hello-world-js', platform=Platform.ANDROID, metric='build_initial',
+                                        history_file=self.history_file) == 11
+        assert PerfHistory.get_baseline(template='hello-world-js', platform=Platform.ANDROID, metric='build_initial',
+                                        conditions='clean-cache', history_file=self.history_file) == 20.5
+        assert PerfHistory.check(template='hello-world-js', platform=Platform.ANDROID, metric='build_initial',
+                                 conditions='clean-cache', history_file=self.history_file) == []
+        assert 'build_initial [clean-cache]' in PerfHistory.get_report(history_file=self.history_file)
+
+    def test_10_change_point(self):
+        values = [10.1, 9.9, 10.0, 10.2, 9.8, 12.1, 12.0, 11.9, 12.2]
+        change_point = PerfHistory.get_change_point(values)
+        assert change_point is not None, 'Step change not detected.'
+        assert change_point.index == 5
+        assert 0.15 < change_point.change < 0.25
+
+    def test_11_no_change_point_in_noise(self):
+        values = [10.1, 9.9, 10.0, 10.2, 9.8, 10.1, 10.0, 9.9, 10.2]
+        assert PerfHistory.get_change_point(values) is None
+
+    def test_20_trend(self):
+        values = [10.0, 10.3, 10.5, 10.8, 11.0, 11.3, 11.5, 11.9]
+        assert PerfHistory.get_trend(values) > 0.1
+        assert abs(PerfHistory.get_trend([10.0] * 8)) < 0.001
+        assert PerfHistory.get_trend([10.0]) == 0
+
+    def test_30_check(self):
+        for value in [10.0, 10.3, 10.5, 10.8, 11.0, 11.3, 11.5, 11.9]:
+            PerfHistory.record(template='hello-world-js', platform=Platform.ANDROID, metric='prepare_initial',
+                               value=value, history_file=self.history_file)
+        regressions = PerfHistory.check(template='hello-world-js', platform=Platform.ANDROID,
+                                        metric='prepare_initial', history_file=self.history_file)
+        assert [r for r in regressions if 'grows with 17%' in r], 'Slow creep not detected.'
+        report = PerfHistory.get_report(history_file=self.history_file)
+        assert 'prepare_initial' in report
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+
+from core.utils.perf_utils import PerfUtils
+
+
+# noinspection PyMethodMayBeStatic
+class PerfUtilsTests(unittest.TestCase):
+
+    def test_01_is_value_in_range(self):
+        assert PerfUtils.is_value_in_range(actual=11, expected=10, tolerance=0.2)
+        assert not PerfUtils.is_value_in_range(actual=13, expected=10, tolerance=0.2)
+
+    def test_02_get_percentile(self):
+        values = [5, 1, 4, 2, 3]
+        assert PerfUtils.get_percentile(values, 50) == 3
+        assert PerfUtils.get_percentile(values, 0) == 1
+        assert PerfUtils.get_percentile(values, 100) == 5
+        assert abs(PerfUtils.get_percentile(values, 90) - 4.6) < 0.001
+        assert PerfUtils.get_percentile([7], 90) == 7
+        assert PerfUtils.get_percentile([], 90) is None
+
+
+if __name__ == '__main__':
+    unittest.main()
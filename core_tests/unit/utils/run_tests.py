@@ -46,6 +46,14 @@ class RunTests(unittest.TestCase):
         assert result.duration < 1, 'Process duration took too much time.'
         assert result.output == '2', 'Output should be 2.'
 
+    @unittest.skipIf(Settings.HOST_OS == OSType.WINDOWS, 'Skip on Windows.')
+    def test_04_run_command_with_timeline(self):
+        result = run(cmd='echo first && sleep 1 && echo second', wait=True, timeout=5, timeline=True)
+        assert result.exit_code == 0, 'Wrong exit code of successful command.'
+        assert [line for _, line in result.timeline] == ['first', 'second']
+        assert result.timeline[1][0] - result.timeline[0][0] >= 0.9, 'Time of lines is not recorded correctly.'
+        assert result.output == 'first' + os.linesep + 'second', 'Output should contain all lines.'
+
     def test_10_run_command_with_wait_true_that_exceed_timeout(self):
         # noinspection PyBroadException
         # pylint: disable=broad-except
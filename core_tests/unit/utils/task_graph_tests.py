@@ -0,0 +1,53 @@
+import threading
+import time
+import unittest
+
+from core.utils.task_graph import TaskGraph
+
+
+# noinspection PyMethodMayBeStatic
+class TaskGraphTests(unittest.TestCase):
+    def test_01_run_independent_tasks_in_parallel(self):
+        order = []
+        lock = threading.Lock()
+
+        def task(name, duration):
+            def func():
+                time.sleep(duration)
+                with lock:
+                    order.append(name)
+            return func
+
+        graph = TaskGraph(workers=4)
+        graph.add('cleanup', task('cleanup', 0))
+        graph.add('clone', task('clone', 0.1), depends_on=['cleanup'])
+        graph.add('pack', task('pack', 0.1), depends_on=['clone'])
+        graph.add('install', task('install', 0.3), depends_on=['cleanup'])
+        start = time.time()
+        durations = graph.run()
+        assert time.time() - start < 0.5, 'Independent tasks should run in parallel.'
+        assert order == ['cleanup', 'clone', 'pack', 'install']
+        assert sorted(durations.keys()) == ['cleanup', 'clone', 'install', 'pack']
+        assert 'install' in graph.get_report()
+
+    def test_02_skip_tasks_when_dependency_fails(self):
+        executed = []
+
+        def fail():
+            raise IOError('Failed to clone.')
+
+        graph = TaskGraph(workers=2)
+        graph.add('clone', fail)
+        graph.add('pack', lambda: executed.append('pack'), depends_on=['clone'])
+        graph.add('install', lambda: executed.append('install'))
+        self.assertRaises(IOError, graph.run)
+        assert executed == ['install']
+        assert 'skipped' in graph.get_report()
+
+    def test_03_unknown_dependency(self):
+        graph = TaskGraph()
+        self.assertRaises(AssertionError, graph.add, 'pack', lambda: None, ['clone'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,6 +23,20 @@ class WaitTests(unittest.TestCase):
         ls_time = PerfUtils.get_average_time(lambda: run(cmd='ifconfig'), retry_count=5)
         assert 0.003 <= ls_time <= 0.03, "Command not executed in acceptable time. Actual value: " + str(ls_time)
 
+    def test_30_report(self):
+        Wait.reset()
+        Wait.sleep(0.1)
+        Wait.sleep(0.2, reason='animation')
+        Wait.until(lambda: False, timeout=0.3, period=0.1)
+        assert Wait.SLEEPS == {'wait_tests.py:test_30_report': 0.1, 'animation': 0.2}
+        assert Wait.WAITS[0] >= 0.3
+        report = Wait.get_report()
+        assert report.startswith('Sleep time: 0.3s (condition waits: ')
+        assert report.splitlines()[1].strip().startswith('animation')
+
+        Wait.reset()
+        assert 'Sleep time: 0.0s' in Wait.get_report()
+
     @staticmethod
     def seconds_are_odd():
         millis = int(round(time.time() * 1000))
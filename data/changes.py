@@ -1,5 +1,7 @@
 import os
+import time
 
+from core.log.log import Log
 from core.settings import Settings
 from core.utils.file_utils import File
 from data.const import Colors
@@ -28,6 +30,52 @@ class Sync(object):
         path = os.path.join(Settings.TEST_RUN_HOME, app_name, change_set.file_path)
         File.replace(path=path, old_string=change_set.new_value, new_string=change_set.old_value, fail_safe=fail_safe)
 
+    @staticmethod
+    def replace_all(app_name, change_sets, fail_safe=False):
+        """
+        Apply many changes at once (each modified file is written only once and atomically).
+        :return: List of modified files.
+        """
+        edits = [(Sync.__get_path(app_name, change_set), change_set.old_value, change_set.new_value)
+                 for change_set in change_sets]
+        return File.replace_all(edits=edits, fail_safe=fail_safe)
+
+    @staticmethod
+    def revert_all(app_name, change_sets, fail_safe=False):
+        """
+        Revert many changes at once (changes are reverted in reverse order).
+        :return: List of modified files.
+        """
+        edits = [(Sync.__get_path(app_name, change_set), change_set.new_value, change_set.old_value)
+                 for change_set in reversed(change_sets)]
+        return File.replace_all(edits=edits, fail_safe=fail_safe)
+
+    @staticmethod
+    def burst(app_name, change_sets, count, interval=0):
+        """
+        Apply and revert changes in a burst (for tests of file watchers).
+        :param app_name: App name.
+        :param change_sets: List of changes (applied together, see `replace_all`).
+        :param count: Number of writes (changes are applied on odd and reverted on even writes).
+        :param interval: Seconds between writes.
+        :return: List of times of the writes (result of `time.time()` after each write).
+        """
+        times = []
+        for index in range(count):
+            if index > 0 and interval > 0:
+                time.sleep(interval)
+            if index % 2 == 0:
+                Sync.replace_all(app_name=app_name, change_sets=change_sets)
+            else:
+                Sync.revert_all(app_name=app_name, change_sets=change_sets)
+            times.append(time.time())
+        Log.info('Burst of {0} writes in {1:.2f} sec.'.format(count, times[-1] - times[0] if times else 0))
+        return times
+
+    @staticmethod
+    def __get_path(app_name, change_set):
+        return os.path.join(Settings.TEST_RUN_HOME, app_name, change_set.file_path)
+
 
 class Changes(object):
     class JSHelloWord(object):
@@ -1,36 +1,30 @@
 import logging
 import os
+import re
+import time
 
+from core.log.log import Log
 from core.settings import Settings
-from core.utils.file_utils import Folder
+from core.utils.file_utils import File, Folder
 from core.utils.json_utils import JsonUtils
 from core.utils.npm import Npm
 from core.utils.run import run
+from products.nativescript.project_metadata import ProjectMetadata
 
 
 class App(object):
 
     @staticmethod
     def get_package_json(app_name):
-        return JsonUtils.read(os.path.join(Settings.TEST_RUN_HOME, app_name, 'package.json'))
+        return ProjectMetadata.get_package_json(app_name=app_name)
 
     @staticmethod
     def is_dev_dependency(app_name, dependency):
-        json = App.get_package_json(app_name=app_name)
-        dev_deps = json.get('devDependencies')
-        if dev_deps is not None:
-            if dev_deps.get(dependency) is not None:
-                return True
-        return False
+        return ProjectMetadata.is_dev_dependency(app_name=app_name, dependency=dependency)
 
     @staticmethod
     def is_dependency(app_name, dependency):
-        json = App.get_package_json(app_name=app_name)
-        dev_deps = json.get('dependencies')
-        if dev_deps is not None:
-            if dev_deps.get(dependency) is not None:
-                return True
-        return False
+        return ProjectMetadata.is_dependency(app_name=app_name, dependency=dependency)
 
     @staticmethod
     def install_dependency(app_name, dependency, version='latest'):
@@ -46,38 +40,141 @@ class App(object):
 
     @staticmethod
     def update(app_name, modules=True, angular=True, typescript=False, web_pack=True, vue=True):
+        """
+        Update {N} packages of the app to versions specified in `Settings.Packages`.
+        All packages are updated with single package.json rewrite and single `npm install`
+        (one more `npm install` is executed if update scripts of angular or webpack change package.json).
+        Measured time of each step and steps replaced by batched update are logged.
+        """
         app_path = os.path.join(Settings.TEST_RUN_HOME, app_name)
         modules_path = os.path.join(app_path, 'node_modules')
-        if modules and App.is_dependency(app_name=app_name, dependency='tns-core-modules'):
-            Npm.uninstall(package='tns-core-modules', option='--save', folder=app_path)
-            Npm.install(package=Settings.Packages.MODULES, option='--save --save-exact', folder=app_path)
-        if angular and App.is_dependency(app_name=app_name, dependency='nativescript-angular'):
-            Npm.uninstall(package='nativescript-angular', option='--save', folder=app_path)
-            Npm.install(package=Settings.Packages.ANGULAR, option='--save --save-exact', folder=app_path)
+        package_json = os.path.join(app_path, 'package.json')
+        plan = App.get_update_plan(data=JsonUtils.read(package_json), modules=modules, angular=angular,
+                                   typescript=typescript, web_pack=web_pack, vue=vue)
+        if not plan:
+            return
+        packages = [package for package, _, _ in plan]
+
+        # Steps: (name, duration, replaced steps of previous implementation)
+        steps = []
+        start = time.time()
+        App.write_update_plan(package_json=package_json, plan=plan)
+        steps.append(('resolve versions and write package.json', time.time() - start, []))
+
+        start = time.time()
+        if 'nativescript-dev-webpack' in packages:
+            Folder.clean(os.path.join(app_path, 'hooks'))
+        Npm.install(folder=app_path)
+        replaced = ['npm uninstall {0} + npm install {0}'.format(package) for package in packages]
+        if 'nativescript-dev-webpack' in packages:
+            replaced.append('clean node_modules + npm install')
+        steps.append(('npm install', time.time() - start, replaced))
+
+        package_json_content = File.read(package_json)
+        if 'nativescript-angular' in packages:
+            start = time.time()
             update_script = os.path.join(modules_path, '.bin', 'update-app-ng-deps')
             result = run(cmd=update_script, log_level=logging.INFO)
             assert 'Angular dependencies updated' in result.output, 'Angular dependencies not updated.'
-            Npm.install(folder=app_path)
-        if typescript and App.is_dev_dependency(app_name=app_name, dependency='nativescript-dev-typescript'):
-            Npm.uninstall(package='nativescript-dev-typescript', option='--save-dev', folder=app_path)
-            Npm.install(package=Settings.Packages.TYPESCRIPT, option='--save-dev --save-exact', folder=app_path)
+            steps.append(('update-app-ng-deps', time.time() - start, []))
+        if 'nativescript-dev-typescript' in packages:
+            start = time.time()
             update_script = os.path.join(modules_path, 'nativescript-dev-typescript', 'bin', 'ns-upgrade-tsconfig')
             result = run(cmd=update_script, log_level=logging.INFO)
             assert "Adding 'es6' lib to tsconfig.json..." in result.output
             assert "Adding 'dom' lib to tsconfig.json..." in result.output
             assert 'Adding tns-core-modules path mappings lib' in result.output
-        if web_pack and App.is_dev_dependency(app_name=app_name, dependency='nativescript-dev-webpack'):
-            Npm.uninstall(package='nativescript-dev-webpack', option='--save-dev', folder=app_path)
-            Npm.install(package=Settings.Packages.WEBPACK, option='--save-dev --save-exact', folder=app_path)
-            Folder.clean(os.path.join(app_name, 'hooks'))
-            Folder.clean(os.path.join(app_name, 'node_modules'))
-            Npm.install(folder=app_path)
+            steps.append(('ns-upgrade-tsconfig', time.time() - start, []))
+        if 'nativescript-dev-webpack' in packages:
+            start = time.time()
             path_script = '"' + os.path.join(modules_path, '.bin', 'update-ns-webpack') + '"'
             update_script = path_script + ' --deps --configs'
             result = run(cmd=update_script, log_level=logging.INFO)
             assert 'Updating dev dependencies...' in result.output, 'Webpack dependencies not updated.'
             assert 'Updating configuration files...' in result.output, 'Webpack configs not updated.'
+            steps.append(('update-ns-webpack', time.time() - start, []))
+        replaced = []
+        if 'nativescript-angular' in packages:
+            replaced.append('npm install (after update-app-ng-deps)')
+        if File.read(package_json) != package_json_content:
+            start = time.time()
+            Npm.install(folder=app_path)
+            steps.append(('npm install (package.json changed by update scripts)', time.time() - start, replaced))
+        elif replaced:
+            steps.append(('skip npm install (package.json not changed by update scripts)', 0, replaced))
+
+        Log.info(App.get_update_report(steps=steps))
 
-        if vue and App.is_dependency(app_name=app_name, dependency='nativescript-vue'):
-            Npm.uninstall(package='nativescript-vue', option='--save', folder=app_path)
-            Npm.install(package='nativescript-vue@next', option='--save --save-exact', folder=app_path)
+    @staticmethod
+    def get_update_plan(data, modules=True, angular=True, typescript=False, web_pack=True, vue=True):
+        """
+        Get packages that should be updated.
+        :param data: Content of package.json.
+        :return: List of (package, spec, is dev dependency) tuples.
+        """
+        dependencies = data.get('dependencies', {})
+        dev_dependencies = data.get('devDependencies', {})
+        plan = []
+        if modules and 'tns-core-modules' in dependencies:
+            plan.append(('tns-core-modules', Settings.Packages.MODULES, False))
+        if angular and 'nativescript-angular' in dependencies:
+            plan.append(('nativescript-angular', Settings.Packages.ANGULAR, False))
+        if typescript and 'nativescript-dev-typescript' in dev_dependencies:
+            plan.append(('nativescript-dev-typescript', Settings.Packages.TYPESCRIPT, True))
+        if web_pack and 'nativescript-dev-webpack' in dev_dependencies:
+            plan.append(('nativescript-dev-webpack', Settings.Packages.WEBPACK, True))
+        if vue and 'nativescript-vue' in dependencies:
+            plan.append(('nativescript-vue', 'nativescript-vue@next', False))
+        return plan
+
+    @staticmethod
+    def write_update_plan(package_json, plan, get_version=None):
+        """
+        Set versions of planned packages in package.json (file is written once).
+        :param package_json: Path to package.json.
+        :param plan: Plan (see `get_update_plan`).
+        :param get_version: Function that returns output of `npm show <spec> version` (default is `Npm.get_version`).
+        :return: Content of updated package.json.
+        """
+        data = JsonUtils.read(package_json)
+        for package, spec, dev in plan:
+            version = App.resolve_version(package=package, spec=spec, get_version=get_version)
+            data.setdefault('devDependencies' if dev else 'dependencies', {})[package] = version
+            Log.info('Update {0} to {1}.'.format(package, version))
+        JsonUtils.write(file_path=package_json, data=data)
+        return data
+
+    @staticmethod
+    def resolve_version(package, spec, get_version=None):
+        """
+        Get version that should be saved in package.json (same as `npm install <spec> --save-exact`).
+        :param package: Package name.
+        :param spec: Package spec, for example `tns-core-modules@next`, `tns-core-modules@6.0.0` or path to tgz.
+        :param get_version: Function that returns output of `npm show <spec> version` (default is `Npm.get_version`).
+        """
+        if '.tgz' in spec:
+            return 'file:' + os.path.abspath(spec)
+        name, _, tag = spec.rpartition('@')
+        if name != package or not tag:
+            return spec
+        if re.match(r'^\d+\.\d+\.\d+', tag):
+            return tag
+        output = (get_version or Npm.get_version)(spec)
+        assert output and output.strip(), 'Failed to resolve version of ' + spec
+        # If tag or range matches more versions npm prints `<package>@<version> '<version>'` for each of them.
+        return output.strip().splitlines()[-1].split()[-1].strip("'")
+
+    @staticmethod
+    def get_update_report(steps):
+        """
+        Get report of update.
+        :param steps: List of (name, measured duration, steps of previous implementation replaced by this step).
+        """
+        total = sum(duration for _, duration, _ in steps)
+        lines = ['Updated packages in {0:.1f} sec:'.format(total)]
+        for name, duration, replaced in steps:
+            line = '  {0:<60} {1:>6.1f} sec'.format(name, duration)
+            if replaced:
+                line += ' (replaces: {0})'.format(', '.join(replaced))
+            lines.append(line)
+        return '\n'.join(lines)
@@ -0,0 +1,70 @@
+"""
+Cache of created and updated {N} apps (used by `Tns.create`).
+
+Apps are cached only for the current test run (fixtures are stored in TEST_OUT_HOME, which is cleaned by prepare),
+because packages like `tns-core-modules@next` resolve to different versions in different runs.
+
+Fixtures are cloned without hard links (files are reflinked or copied), because npm, webpack and gradle may modify
+files in node_modules of the app in place, which would corrupt the fixture for next tests.
+"""
+import hashlib
+import json
+import os
+import uuid
+
+from core.log.log import Log
+from core.settings import Settings
+from core.utils.file_utils import File, Folder
+
+FIXTURES_HOME = os.path.join(Settings.TEST_OUT_HOME, 'fixtures')
+
+
+class AppFixtures(object):
+    @staticmethod
+    def get_key(app_name, template, app_id=None, force=False, default=False, log_trace=False):
+        """
+        Get key of app fixture.
+        :return: Key as string or None if app can not be cached (template is local folder).
+        """
+        if template is not None and os.path.isdir(template):
+            return None
+        template_key = File.get_hash(template) if template is not None and File.exists(template) else template
+        packages = [Settings.Packages.NS_CLI, Settings.Packages.MODULES, Settings.Packages.ANGULAR,
+                    Settings.Packages.TYPESCRIPT, Settings.Packages.WEBPACK]
+        key = json.dumps([app_name, template_key, packages, app_id, force, default, log_trace])
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def restore(key, app_path):
+        """
+        Clone cached app to app path.
+        :return: Output of `tns create` (or None if app is not in the cache).
+        """
+        fixture = os.path.join(FIXTURES_HOME, key)
+        if not Folder.exists(fixture):
+            return None
+        Log.info('Create {0} from cached app {1}.'.format(app_path, key))
+        Folder.clean(app_path)
+        Folder.clone(source=os.path.join(fixture, 'app'), target=app_path, shared=[])
+        return File.read(os.path.join(fixture, 'output.txt'))
+
+    @staticmethod
+    def save(key, app_path, output):
+        """
+        Save app in the cache.
+        :param key: Key of the fixture.
+        :param app_path: Path to created (and updated) app.
+        :param output: Output of `tns create`.
+        """
+        fixture = os.path.join(FIXTURES_HOME, key)
+        if Folder.exists(fixture):
+            return
+        # Fixture is saved in temp folder and renamed, so other processes never see incomplete fixture.
+        temp_fixture = '{0}.{1}.tmp'.format(fixture, uuid.uuid4().hex)
+        Folder.clone(source=app_path, target=os.path.join(temp_fixture, 'app'), shared=[])
+        File.write(path=os.path.join(temp_fixture, 'output.txt'), text=output)
+        try:
+            os.rename(temp_fixture, fixture)
+        except OSError:
+            # Fixture saved by another process
+            Folder.clean(temp_fixture)
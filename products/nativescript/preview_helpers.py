@@ -1,6 +1,5 @@
 import os
 import re
-import time
 
 from products.nativescript.tns import Tns
 from products.nativescript.tns_logs import TnsLogs
@@ -136,7 +135,7 @@ class Preview(object):
         if device.type == DeviceType.SIM:
             if click_open_alert is True:
                 if SimAuto.find(device_info=device, text="Open"):
-                    time.sleep(5)
+                    SimAuto.wait_for_stable_position(device_info=device, text="Open", timeout=5)
                     device.click("Open")
 
         # Verify logs
@@ -0,0 +1,78 @@
+"""
+Read metadata of {N} projects (package.json, tsconfig.json and nsconfig.json).
+
+Parsed files are cached (see `JsonUtils.read_cached`), so objects returned by this class should not be modified.
+"""
+import os
+
+from core.settings import Settings
+from core.utils.json_utils import JsonUtils
+from products.nativescript.tns_paths import TnsPaths
+
+
+class ProjectMetadata(object):
+    @staticmethod
+    def get_package_json(app_name, path=Settings.TEST_RUN_HOME):
+        return JsonUtils.read_cached(os.path.join(TnsPaths.get_app_path(app_name=app_name, path=path), 'package.json'))
+
+    @staticmethod
+    def get_tsconfig(app_name, path=Settings.TEST_RUN_HOME):
+        """
+        Get tsconfig.json (None if app has no tsconfig.json).
+        """
+        return ProjectMetadata.__read_optional(app_name, path, 'tsconfig.json')
+
+    @staticmethod
+    def get_nsconfig(app_name, path=Settings.TEST_RUN_HOME):
+        """
+        Get nsconfig.json (None if app has no nsconfig.json).
+        """
+        return ProjectMetadata.__read_optional(app_name, path, 'nsconfig.json')
+
+    @staticmethod
+    def get_dependencies(app_name, path=Settings.TEST_RUN_HOME):
+        """
+        :return: dict {package: version} of dependencies.
+        """
+        return ProjectMetadata.get_package_json(app_name=app_name, path=path).get('dependencies') or {}
+
+    @staticmethod
+    def get_dev_dependencies(app_name, path=Settings.TEST_RUN_HOME):
+        """
+        :return: dict {package: version} of devDependencies.
+        """
+        return ProjectMetadata.get_package_json(app_name=app_name, path=path).get('devDependencies') or {}
+
+    @staticmethod
+    def is_dependency(app_name, dependency, path=Settings.TEST_RUN_HOME):
+        return dependency in ProjectMetadata.get_dependencies(app_name=app_name, path=path)
+
+    @staticmethod
+    def is_dev_dependency(app_name, dependency, path=Settings.TEST_RUN_HOME):
+        return dependency in ProjectMetadata.get_dev_dependencies(app_name=app_name, path=path)
+
+    @staticmethod
+    def get_app_id(app_name, path=Settings.TEST_RUN_HOME):
+        """
+        Get app id from `nativescript.id` of package.json (None if not specified).
+        """
+        return (ProjectMetadata.get_package_json(app_name=app_name, path=path).get('nativescript') or {}).get('id')
+
+    @staticmethod
+    def get_platform_version(app_name, platform, path=Settings.TEST_RUN_HOME):
+        """
+        Get version of runtime added to the app (for example `nativescript.tns-android.version` of package.json).
+        :param app_name: App name.
+        :param platform: Platform enum value.
+        :param path: Folder where app is located.
+        :return: Version as string or None if platform is not added.
+        """
+        nativescript = ProjectMetadata.get_package_json(app_name=app_name, path=path).get('nativescript') or {}
+        return (nativescript.get('tns-' + str(platform)) or {}).get('version')
+
+    @staticmethod
+    def __read_optional(app_name, path, file_name):
+        file_path = os.path.join(TnsPaths.get_app_path(app_name=app_name, path=path), file_name)
+        if not os.path.isfile(file_path):
+            return None
+        return JsonUtils.read_cached(file_path)
@@ -2,7 +2,7 @@
 # pylint: disable=too-many-branches
 import logging
 import os
-from time import sleep
+import time
 
 from core.base_test.test_context import TestContext
 from core.enums.os_type import OSType
@@ -12,9 +12,12 @@ from core.settings import Settings
 from core.utils.file_utils import Folder, File
 from core.utils.npm import Npm
 from core.utils.process import Process
+from core.utils.process_info import ProcessInfo
 from core.utils.run import run
-from core.utils.json_utils import JsonUtils
+from core.utils.wait import Wait
 from products.nativescript.app import App
+from products.nativescript.app_fixtures import AppFixtures
+from products.nativescript.project_metadata import ProjectMetadata
 from products.nativescript.tns_assert import TnsAssert
 from products.nativescript.tns_logs import TnsLogs
 from products.nativescript.tns_paths import TnsPaths
@@ -26,7 +29,7 @@ class Tns(object):
                      device=None, release=False, for_device=False, provision=None, bundle=True,
                      hmr=True, aot=False, uglify=False, source_map=False, snapshot=False, log_trace=False,
                      just_launch=False, sync_all_files=False, clean=False,
-                     options=None, wait=True, timeout=600):
+                     options=None, wait=True, timeout=600, timeline=False):
         """
         Execute tns command.
         :param command: Tns command.
@@ -51,6 +54,7 @@ class Tns(object):
         :param options: Pass additional options as string.
         :param wait: If true it will wait until command is complete.
         :param timeout: Timeout for CLI command (respected only if wait=True).
+        :param timeline: If true record time of each line of the output (respected only if wait=True).
         :return: ProcessInfo object.
         :rtype: core.utils.process_info.ProcessInfo
         """
@@ -98,12 +102,12 @@ class Tns(object):
         if options:
             cmd += ' ' + options
 
-        result = run(cmd=cmd, cwd=cwd, wait=wait, log_level=logging.INFO, timeout=timeout)
+        result = run(cmd=cmd, cwd=cwd, wait=wait, log_level=logging.INFO, timeout=timeout, timeline=timeline)
 
         # Retry in case of connectivity issues
         if result.output is not None and 'Bad Gateway' in result.output:
             Log.info('"Bad Gateway" issue detected! Will retry the command ...')
-            result = run(cmd=cmd, cwd=cwd, wait=wait, log_level=logging.INFO, timeout=timeout)
+            result = run(cmd=cmd, cwd=cwd, wait=wait, log_level=logging.INFO, timeout=timeout, timeline=timeline)
 
         return result
 
@@ -115,7 +119,8 @@ class Tns(object):
                force_clean=True,
                log_trace=False,
                verify=True,
-               app_data=None):
+               app_data=None,
+               cache=False):
         """
         Create {N} application.
         :param app_name: Application name (TestApp by default).
@@ -129,11 +134,31 @@ class Tns(object):
         :param log_trace: If True runs tns command with '--log trace'.
         :param verify: If True assert app is created properly.
         :param app_data: AppInfo object with expected data (used to verify app is created properly).
+        :param cache: If True app created and updated with same template and packages is reused in the test run
+                      (used only when `update` and `force_clean` are True and `path` is not specified).
+                      Notice: Duration of the result is the time to restore the app from the cache.
         """
 
         # Cleanup app folder
         if force_clean:
-            Folder.clean(TnsPaths.get_app_path(app_name=app_name))
+            Folder.clean(TnsPaths.get_app_path(app_name=app_name), background=True)
+
+        # Create app from cache
+        fixture_key = None
+        if cache and update and force_clean and path is None:
+            fixture_key = AppFixtures.get_key(app_name=app_name, template=template, app_id=app_id, force=force,
+                                              default=default, log_trace=log_trace)
+        output = None
+        start = time.time()
+        if fixture_key is not None:
+            output = AppFixtures.restore(key=fixture_key, app_path=TnsPaths.get_app_path(app_name=app_name))
+        if output is not None:
+            result = ProcessInfo(output=output, exit_code=0, duration=time.time() - start)
+            TestContext.TEST_APP_NAME = app_name
+            if verify is not False:
+                TnsAssert.created(app_name=app_name, output=result.output, app_data=app_data,
+                                  path=Settings.TEST_RUN_HOME)
+            return result
 
         # Create app
         normalized_app_name = app_name
@@ -168,6 +193,10 @@ class Tns(object):
                 path = Settings.TEST_RUN_HOME
             TnsAssert.created(app_name=app_name, output=result.output, app_data=app_data, path=path)
 
+        # Save app in cache (app is saved only if it is verified)
+        if fixture_key is not None and verify is not False:
+            AppFixtures.save(key=fixture_key, app_path=TnsPaths.get_app_path(app_name=app_name), output=result.output)
+
         return result
 
     @staticmethod
@@ -231,9 +260,7 @@ class Tns(object):
             if platform is Platform.IOS:
                 assert Folder.exists(TnsPaths.get_platforms_ios_folder(app_name))
             assert "Platform {0} successfully added".format(platform_string) in result.output
-            package_json = os.path.join(TnsPaths.get_app_path(app_name), 'package.json')
-            json = JsonUtils.read(package_json)
-            assert json['nativescript']['tns-' + platform_string]['version'] is not None
+            assert ProjectMetadata.get_platform_version(app_name=app_name, platform=platform) is not None
 
     @staticmethod
     def platform_list(app_name):
@@ -297,10 +324,10 @@ class Tns(object):
 
     @staticmethod
     def prepare(app_name, platform, release=False, provision=Settings.IOS.PROVISIONING, for_device=False, bundle=True,
-                log_trace=False, verify=True):
+                log_trace=False, verify=True, timeline=False):
         result = Tns.exec_command(command='prepare', path=app_name, platform=platform, release=release,
                                   provision=provision, for_device=for_device, bundle=bundle, wait=True,
-                                  log_trace=log_trace)
+                                  log_trace=log_trace, timeline=timeline)
         if verify:
             assert result.exit_code == 0, 'Prepare failed with non zero exit code.'
         return result
@@ -318,10 +345,10 @@ class Tns(object):
 
     @staticmethod
     def build(app_name, platform, release=False, provision=Settings.IOS.PROVISIONING, for_device=False, bundle=True,
-              aot=False, uglify=False, snapshot=False, log_trace=False, verify=True, app_data=None):
+              aot=False, uglify=False, snapshot=False, log_trace=False, verify=True, app_data=None, timeline=False):
         result = Tns.exec_command(command='build', path=app_name, platform=platform, release=release,
                                   provision=provision, for_device=for_device, bundle=bundle, aot=aot, uglify=uglify,
-                                  snapshot=snapshot, wait=True, log_trace=log_trace)
+                                  snapshot=snapshot, wait=True, log_trace=log_trace, timeline=timeline)
         if verify:
             # Verify output
             assert result.exit_code == 0, 'Build failed with non zero exit code.'
@@ -382,7 +409,9 @@ class Tns(object):
                 assert result.exit_code == 0, 'tns run failed with non zero exit code.'
                 assert 'successfully synced' in result.output.lower()
             else:
-                sleep(10)
+                # Wait until CLI starts (log file contains more than the command header).
+                header = File.read(result.log_file)
+                Wait.until(lambda: File.read(result.log_file) != header, timeout=10, period=0.5)
         return result
 
     @staticmethod
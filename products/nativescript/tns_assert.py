@@ -7,9 +7,9 @@ from core.enums.platform_type import Platform
 from core.settings import Settings
 from core.utils.file_utils import File
 from core.utils.file_utils import Folder
-from core.utils.json_utils import JsonUtils
 from core.utils.perf_utils import PerfUtils
 from products.nativescript.app import App
+from products.nativescript.project_metadata import ProjectMetadata
 from products.nativescript.tns_paths import TnsPaths
 
 
@@ -71,7 +71,7 @@ class TnsAssert(object):
 
             # Assert size
             if app_data.size is not None:
-                app_size = Folder.get_size(app_path)
+                app_size = Folder.get_size(app_path, workers=4)
                 assert PerfUtils.is_value_in_range(actual=app_size, expected=app_data.size.init,
                                                    tolerance=0.25), 'Actual project size is not expected!'
 
@@ -86,18 +86,16 @@ class TnsAssert(object):
         else:
             assert Folder.exists(TnsPaths.get_platforms_ios_folder(app_name))
         # Verify package.json
-        app_path = os.path.join(Settings.TEST_RUN_HOME, app_name)
-        package_json = os.path.join(app_path, 'package.json')
-        json = JsonUtils.read(package_json)
+        platform_version = ProjectMetadata.get_platform_version(app_name=app_name, platform=platform)
         if version is not None:
             if 'next' in version:
-                assert json['nativescript']['tns-' + platform_string]['version'] is not None
+                assert platform_version is not None
             if 'rc' in version:
-                assert 'rc' in json['nativescript']['tns-' + platform_string]['version']
+                assert 'rc' in platform_version
             else:
-                assert version in json['nativescript']['tns-' + platform_string]['version']
+                assert version in platform_version
         else:
-            assert json['nativescript']['tns-' + platform_string]['version'] is not None, \
+            assert platform_version is not None, \
                 'tns-' + platform_string + ' not available in package.json of the app.'
 
     @staticmethod
@@ -142,10 +140,7 @@ class TnsAssert(object):
         # Verify output
         assert 'Platform {0} successfully removed'.format(platform_string) in output
         # Verify package.json
-        app_path = TnsPaths.get_app_path(app_name)
-        package_json = os.path.join(app_path, 'package.json')
-        json = JsonUtils.read(package_json)
-        assert not 'tns-' + platform_string in json
+        assert not 'tns-' + platform_string in ProjectMetadata.get_package_json(app_name=app_name)
         if platform == Platform.ANDROID:
             assert not Folder.exists(TnsPaths.get_platforms_android_folder(app_name))
         else:
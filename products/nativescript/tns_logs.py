@@ -6,6 +6,7 @@ from core.enums.platform_type import Platform
 from core.log.log import Log
 from core.settings import Settings
 from core.utils.file_utils import File
+from core.utils.wait import Wait
 from products.nativescript.run_type import RunType
 from products.nativescript.tns_paths import TnsPaths
 
@@ -302,7 +303,7 @@ class TnsLogs(object):
                 break
             else:
                 Log.debug("'{0}' NOT found. Wait...".format(not_found_list))
-                time.sleep(check_interval)
+                Wait.sleep(check_interval)
             if 'BUILD FAILED' in log:
                 Log.error('BUILD FAILED. No need to wait more time!')
                 break
@@ -0,0 +1,86 @@
+"""
+Split duration of tns commands into phases.
+
+Phases are detected by messages in the output of the CLI (commands should be executed with `--log trace`).
+"""
+
+
+class TnsPhases(object):
+    WEBPACK = 'webpack'
+    COPY = 'copy'
+    GRADLE = 'gradle'
+    XCODE = 'xcode'
+    TRANSFER = 'transfer'
+
+    # Phase definitions: (name, start messages, end messages, restart phase if start message is found again)
+    PHASES = [
+        (WEBPACK, ['Running webpack', 'Starting initial webpack compilation',
+                   'Starting incremental webpack compilation', 'webpack.config.js'],
+         ['Webpack compilation complete', 'Webpack build done'], False),
+        (COPY, ['Preparing project...', 'Webpack compilation complete', 'Webpack build done'],
+         ['Project successfully prepared', 'Skipping prepare.'], True),
+        (GRADLE, ['Gradle build...', 'gradlew'],
+         ['BUILD SUCCESSFUL', 'BUILD FAILED', 'Project successfully built.'], False),
+        (XCODE, ['Xcode build...', 'xcodebuild'],
+         ['** BUILD SUCCEEDED **', '** ARCHIVE SUCCEEDED **', '** BUILD FAILED **', 'Project successfully built.'],
+         False),
+        (TRANSFER, ['Transferring', 'Start sync changes'],
+         ['Successfully transferred', 'Successfully synced application'], False),
+    ]
+
+    @staticmethod
+    def get_phases(timeline):
+        """
+        Get duration of each phase.
+        :param timeline: List of (seconds since start, line) tuples (`ProcessInfo.timeline`).
+        :return: dict {phase: duration in seconds}, phases not found in the log are not included.
+        """
+        if not timeline:
+            return {}
+        last = timeline[-1][0]
+        phases = {}
+        for name, start_messages, end_messages, restart in TnsPhases.PHASES:
+            duration = 0
+            found = False
+            start = None
+            for offset, line in timeline:
+                if start is not None and TnsPhases.__contains(line, end_messages):
+                    duration += offset - start
+                    start = None
+                elif TnsPhases.__contains(line, start_messages) and (start is None or restart):
+                    start = offset
+                    found = True
+            if start is not None:
+                # Phase is not complete (command failed or timed out), so count time until the end of the log.
+                duration += last - start
+            if found:
+                phases[name] = round(duration, 3)
+        return phases
+
+    @staticmethod
+    def compare(phases, baseline, tolerance=0.2, min_diff=1.0):
+        """
+        Compare phases with baseline.
+        :param phases: dict {phase: duration}.
+        :param baseline: dict {phase: duration}.
+        :param tolerance: Allowed relative difference (0.2 means 20%).
+        :param min_diff: Differences smaller than `min_diff` seconds are ignored.
+        :return: List of regressions (as strings), empty list if everything is OK.
+        """
+        regressions = []
+        for name in sorted(phases.keys()):
+            actual = phases[name]
+            expected = baseline.get(name)
+            if expected is None:
+                continue
+            diff = actual - expected
+            if diff > min_diff and diff > expected * tolerance:
+                regressions.append('{0}: {1:.2f}s, expected {2:.2f}s (+{3:.2f}s).'.format(name, actual, expected, diff))
+        return regressions
+
+    @staticmethod
+    def __contains(line, messages):
+        for message in messages:
+            if message in line:
+                return True
+        return False
@@ -9,17 +9,25 @@ from core.utils.file_utils import File, Folder
 from core.utils.git import Git
 from core.utils.gradle import Gradle
 from core.utils.npm import Npm
+from core.utils.npm_store import NpmStore
+from core.utils.task_graph import TaskGraph
 from data.templates import Template
 from products.nativescript.preview_helpers import Preview
 from products.nativescript.tns import Tns
 
+TEMPLATES = [Template.HELLO_WORLD_JS, Template.HELLO_WORLD_TS, Template.HELLO_WORLD_NG, Template.MASTER_DETAIL_NG,
+             Template.VUE_BLANK, Template.MASTER_DETAIL_VUE, Template.TAB_NAVIGATION_JS]
+
+# Keys of template packages in the cache {template name: sha of template folder}
+TEMPLATE_KEYS = {}
+
 
 def __cleanup():
     """
     Wipe TEST_OUT_HOME.
     """
-    Folder.clean(os.path.join(Settings.TEST_RUN_HOME, 'node_modules'))
-    Folder.clean(Settings.TEST_OUT_HOME)
+    Folder.clean(os.path.join(Settings.TEST_RUN_HOME, 'node_modules'), background=True)
+    Folder.clean(Settings.TEST_OUT_HOME, background=True)
     Folder.create(Settings.TEST_OUT_LOGS)
     Folder.create(Settings.TEST_OUT_IMAGES)
     Folder.create(Settings.TEST_OUT_TEMP)
@@ -31,28 +39,63 @@ def __cleanup():
     Adb.restart()
     Tns.kill()
     Gradle.kill()
-    Gradle.cache_clean()
+    if not Settings.GRADLE_REUSE_DAEMON:
+        Gradle.cache_clean()
 
 
-def __get_templates(branch=Settings.Packages.TEMPLATES_BRANCH):
+def __clone_templates(branch=Settings.Packages.TEMPLATES_BRANCH):
     """
-    Clone hello-world templates and pack them as local npm packages.
+    Clone hello-world templates (clone is skipped if packages of all templates are found in the cache).
+    Local mirror of the templates repo is updated only when remote branch has new commits.
     :param branch: Branch of https://github.com/NativeScript/nativescript-app-templates
     """
-    local_folder = os.path.join(Settings.TEST_SUT_HOME, 'templates')
-    Git.clone(repo_url=Template.REPO, branch=branch, local_folder=local_folder)
+    mirror = os.path.join(Settings.CACHE_HOME, 'git', 'nativescript-app-templates.git')
+    commit = Git.get_remote_commit(repo_url=Template.REPO, branch=branch)
+    if commit is None or commit != Git.rev_parse(repo=mirror, rev=branch):
+        if not Git.update_mirror(repo_url=Template.REPO, mirror=mirror):
+            Log.info('Failed to update mirror of templates repo.')
+
+    # Template packages are cached by sha of template folder, so they are re-packed only if template is changed.
+    for app in TEMPLATES:
+        TEMPLATE_KEYS[app.name] = Git.rev_parse(repo=mirror, rev='{0}:packages/{1}'.format(branch, app.name))
+    cached_files = [__get_cached_template(app) for app in TEMPLATES]
+    if all(cached_file is not None and File.exists(cached_file) for cached_file in cached_files):
+        Log.info('Packages of all templates found in cache (commit {0}).'.format(commit))
+        return
+    Git.clone(repo_url=Template.REPO, branch=branch, local_folder=os.path.join(Settings.TEST_SUT_HOME, 'templates'),
+              reference=mirror)
+
+
+def __get_cached_template(app):
+    """
+    Get path to cached package of template (None if template is not in the mirror).
+    """
+    key = TEMPLATE_KEYS.get(app.name)
+    if key is None:
+        return None
+    return os.path.join(Settings.CACHE_HOME, 'templates', app.name, key + '.tgz')
+
 
-    apps = [Template.HELLO_WORLD_JS, Template.HELLO_WORLD_TS, Template.HELLO_WORLD_NG, Template.MASTER_DETAIL_NG,
-            Template.VUE_BLANK, Template.MASTER_DETAIL_VUE, Template.TAB_NAVIGATION_JS]
-    for app in apps:
-        template_name = app.name
-        template_folder = os.path.join(local_folder, 'packages', template_name)
-        out_file = os.path.join(Settings.TEST_SUT_HOME, template_name + '.tgz')
+def __pack_template(app):
+    """
+    Pack cloned template as local npm package (or use package from the cache).
+    """
+    template_name = app.name
+    template_folder = os.path.join(Settings.TEST_SUT_HOME, 'templates', 'packages', template_name)
+    out_file = os.path.join(Settings.TEST_SUT_HOME, template_name + '.tgz')
+    cached_file = __get_cached_template(app)
+    if cached_file is not None and File.exists(cached_file):
+        Log.info('Use cached package of {0}.'.format(template_name))
+        File.copy(source=cached_file, target=out_file)
+    else:
         Npm.pack(folder=template_folder, output_file=out_file)
-        if File.exists(out_file):
-            app.path = out_file
-        else:
-            raise IOError("Failed to clone and pack template: " + template_name)
+        if cached_file is not None and File.exists(out_file):
+            Folder.create(os.path.dirname(cached_file))
+            File.copy(source=out_file, target=cached_file)
+    if File.exists(out_file):
+        app.path = out_file
+    else:
+        raise IOError("Failed to clone and pack template: " + template_name)
 
 
 def __get_runtimes():
@@ -120,16 +163,28 @@ def __install_schematics():
 
 
 def prepare(clone_templates=True, install_ng_cli=False, get_preivew_packages=False):
+    """
+    Prepare test run (steps that do not depend on each other are executed in parallel).
+    """
     Log.info('================== Prepare Test Run ==================')
-    __cleanup()
-    __install_ns_cli()
-    __get_runtimes()
+    graph = TaskGraph(workers=4)
+    graph.add('cleanup', __cleanup)
+    npm_ready = ['cleanup']
+    if Settings.NPM_STORE_ENABLED:
+        graph.add('start npm store', NpmStore.start, depends_on=['cleanup'])
+        npm_ready = ['start npm store']
+    graph.add('install ns cli', __install_ns_cli, depends_on=npm_ready)
+    graph.add('get runtimes', __get_runtimes, depends_on=npm_ready)
     if install_ng_cli:
-        __install_ng_cli()
-        __install_schematics()
+        graph.add('install ng cli', __install_ng_cli, depends_on=npm_ready)
+        graph.add('install schematics', __install_schematics, depends_on=['install ng cli'])
     if clone_templates:
-        __get_templates()
+        graph.add('clone templates', __clone_templates, depends_on=['cleanup'])
+        for app in TEMPLATES:
+            graph.add('pack ' + app.name, lambda app=app: __pack_template(app),
+                      depends_on=['clone templates'] + npm_ready)
     if get_preivew_packages:
-        Preview.get_app_packages()
+        graph.add('get preview packages', Preview.get_app_packages, depends_on=['cleanup'])
+    graph.run()
 
     Log.settings()
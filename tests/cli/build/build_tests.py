@@ -25,8 +25,8 @@ class BuildTests(TnsTest):
     @classmethod
     def setUpClass(cls):
         TnsTest.setUpClass()
-        Tns.create(app_name=cls.app_name, template=Template.HELLO_WORLD_JS.local_package, update=True)
-        Tns.create(cls.app_name_with_space, template=Template.HELLO_WORLD_JS.local_package, update=True)
+        Tns.create(app_name=cls.app_name, template=Template.HELLO_WORLD_JS.local_package, update=True, cache=True)
+        Tns.create(cls.app_name_with_space, template=Template.HELLO_WORLD_JS.local_package, update=True, cache=True)
         # Folder.clean(os.path.join(cls.app_name, 'hooks'))
         # Folder.clean(os.path.join(cls.app_name, 'node_modules'))
         # Folder.clean(os.path.join(cls.app_name_with_space, 'hooks'))
@@ -0,0 +1,27 @@
+import os
+
+from core.enums.os_type import OSType
+from core.settings import Settings
+from core.utils.file_utils import File
+from data.templates import Template
+from products.nativescript.tns import Tns
+
+
+class DebugHelpers(object):
+    @staticmethod
+    def create_js_app(app_name):
+        """
+        Create hello-world-js app for debug tests (app logs console messages on tap) and add platforms.
+        :param app_name: Application name.
+        """
+        Tns.create(app_name=app_name, template=Template.HELLO_WORLD_JS.local_package, update=True, cache=True)
+
+        # Instrument the app so it console log events.
+        source_js = os.path.join(Settings.TEST_RUN_HOME, 'assets', 'runtime', 'debug', 'files', "console_log",
+                                 'main-view-model.js')
+        target_js = os.path.join(Settings.TEST_RUN_HOME, app_name, 'app', 'main-view-model.js')
+        File.copy(source=source_js, target=target_js)
+
+        Tns.platform_add_android(app_name=app_name, framework_path=Settings.Android.FRAMEWORK_PATH)
+        if Settings.HOST_OS == OSType.OSX:
+            Tns.platform_add_ios(app_name=app_name, framework_path=Settings.IOS.FRAMEWORK_PATH)
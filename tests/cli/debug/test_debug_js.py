@@ -6,13 +6,13 @@ from core.base_test.tns_run_test import TnsRunTest
 from core.enums.os_type import OSType
 from core.enums.platform_type import Platform
 from core.settings import Settings
-from core.utils.chrome.chrome import Chrome
 from core.utils.chrome.chrome_dev_tools import ChromeDevTools, ChromeDevToolsTabs
+from core.utils.chrome.chrome_pool import ChromePool
 from core.utils.file_utils import File
 from data.changes import Sync, Changes
-from data.templates import Template
 from products.nativescript.tns import Tns
 from products.nativescript.tns_logs import TnsLogs
+from debug_helpers import DebugHelpers
 
 
 class DebugJSTests(TnsRunTest):
@@ -25,26 +25,16 @@ class DebugJSTests(TnsRunTest):
     @classmethod
     def setUpClass(cls):
         TnsRunTest.setUpClass()
-        Tns.create(app_name=cls.app_name, template=Template.HELLO_WORLD_JS.local_package, update=True)
-
-        # Instrument the app so it console log events.
-        source_js = os.path.join(Settings.TEST_RUN_HOME, 'assets', 'runtime', 'debug', 'files', "console_log",
-                                 'main-view-model.js')
-        target_js = os.path.join(Settings.TEST_RUN_HOME, cls.app_name, 'app', 'main-view-model.js')
-        File.copy(source=source_js, target=target_js)
-
-        Tns.platform_add_android(app_name=cls.app_name, framework_path=Settings.Android.FRAMEWORK_PATH)
-        if Settings.HOST_OS == OSType.OSX:
-            Tns.platform_add_ios(app_name=cls.app_name, framework_path=Settings.IOS.FRAMEWORK_PATH)
+        DebugHelpers.create_js_app(app_name=cls.app_name)
 
     def setUp(self):
         TnsRunTest.setUp(self)
         Sync.revert(app_name=self.app_name, change_set=self.js_change, fail_safe=True)
         Sync.revert(app_name=self.app_name, change_set=self.xml_change, fail_safe=True)
-        self.chrome = Chrome()
+        self.chrome = ChromePool.acquire()
 
     def tearDown(self):
-        self.chrome.kill()
+        ChromePool.release(self.chrome)
         TnsRunTest.tearDown(self)
 
     def test_001_debug_android_elements(self):
@@ -0,0 +1,127 @@
+"""
+Debug tests that talk to debug backend via Chrome DevTools Protocol directly (no Chrome and no UI automation).
+"""
+import unittest
+
+from core.base_test.tns_run_test import TnsRunTest
+from core.enums.os_type import OSType
+from core.enums.platform_type import Platform
+from core.settings import Settings
+from core.utils.chrome.cdp_client import CdpClient
+from core.utils.file_utils import File
+from data.changes import Sync, Changes
+from products.nativescript.tns import Tns
+from debug_helpers import DebugHelpers
+
+
+class DebugJSHeadlessTests(TnsRunTest):
+    app_name = Settings.AppName.DEFAULT
+    xml_change = Changes.JSHelloWord.XML_ACTION_BAR
+    client = None
+
+    @classmethod
+    def setUpClass(cls):
+        TnsRunTest.setUpClass()
+        DebugHelpers.create_js_app(app_name=cls.app_name)
+
+    def setUp(self):
+        TnsRunTest.setUp(self)
+        Sync.revert(app_name=self.app_name, change_set=self.xml_change, fail_safe=True)
+        self.client = None
+
+    def tearDown(self):
+        if self.client is not None:
+            self.client.close()
+        TnsRunTest.tearDown(self)
+
+    def test_010_debug_android_console(self):
+        self.__console(platform=Platform.ANDROID, device=self.emu)
+
+    @unittest.skipIf(Settings.HOST_OS != OSType.OSX, 'Can not debug iOS on non macOS hosts.')
+    def test_010_debug_ios_console(self):
+        self.__console(platform=Platform.IOS, device=self.sim)
+
+    def test_020_debug_android_breakpoint(self):
+        self.__breakpoint(platform=Platform.ANDROID, device=self.emu)
+
+    @unittest.skipIf(Settings.HOST_OS != OSType.OSX, 'Can not debug iOS on non macOS hosts.')
+    def test_020_debug_ios_breakpoint(self):
+        self.__breakpoint(platform=Platform.IOS, device=self.sim)
+
+    def test_030_debug_android_brk(self):
+        self.__debug_brk(platform=Platform.ANDROID, device=self.emu)
+
+    @unittest.skipIf(Settings.HOST_OS != OSType.OSX, 'Can not debug iOS on non macOS hosts.')
+    def test_030_debug_ios_brk(self):
+        self.__debug_brk(platform=Platform.IOS, device=self.sim)
+
+    def test_040_debug_android_elements(self):
+        self.__debug_elements(platform=Platform.ANDROID, device=self.emu)
+
+    @unittest.skipIf(Settings.HOST_OS != OSType.OSX, 'Can not debug iOS on non macOS hosts.')
+    def test_040_debug_ios_elements(self):
+        self.__debug_elements(platform=Platform.IOS, device=self.sim)
+
+    def __connect(self, result, domains):
+        url = CdpClient.get_url(File.read(result.log_file))
+        assert url is not None, 'Debug url not found in CLI output.'
+        self.client = CdpClient(url=url, timeout=30)
+        self.client.enable(domains)
+
+    def __console(self, platform, device):
+        result = Tns.debug(app_name=self.app_name, platform=platform, emulator=True)
+        device.wait_for_text(text='TAP')
+        self.__connect(result=result, domains=['Runtime'])
+
+        # Evaluate expression
+        assert self.client.evaluate('1024+1024') == 2048, 'Failed to evaluate expression.'
+
+        # TAP the button to trigger console log and ensure it is received by debugger
+        device.click(text='TAP', case_sensitive=True)
+        self.client.wait_for_console_message('Test Debug!')
+
+    def __breakpoint(self, platform, device):
+        result = Tns.debug(app_name=self.app_name, platform=platform, emulator=True)
+        device.wait_for_text(text='TAP')
+        self.__connect(result=result, domains=['Runtime', 'Debugger'])
+
+        # Place breakpoint on line 17 of main-view-model.js, tap and check it is hit
+        breakpoint_id = self.client.set_breakpoint(file_name='main-view-model.js', line=17)
+        device.click(text='TAP', case_sensitive=True)
+        paused = self.client.wait_for_paused(timeout=30)
+        assert breakpoint_id in paused.get('hitBreakpoints', []), 'Failed to pause on breakpoint.'
+
+        # Evaluate watch expressions
+        console = self.client.evaluate_on_call_frame('console')
+        assert console in ['Object', 'Console'], 'Unexpected value of `console`: {0}'.format(console)
+        view_model = self.client.evaluate_on_call_frame('viewModel')
+        assert view_model == 'Observable', 'Unexpected value of `viewModel`: {0}'.format(view_model)
+
+        # Resume execution
+        self.client.remove_breakpoint(breakpoint_id)
+        self.client.resume()
+        device.wait_for_text(text='41 taps left', timeout=30)
+
+    def __debug_brk(self, platform, device):
+        # Hack to workaround https://github.com/NativeScript/nativescript-cli/issues/4567
+        Tns.run(app_name=self.app_name, platform=platform, emulator=True, source_map=True, just_launch=True)
+        device.wait_for_text(text='TAP')
+
+        result = Tns.debug(app_name=self.app_name, platform=platform, emulator=True, debug_brk=True)
+        self.__connect(result=result, domains=['Runtime', 'Debugger'])
+        paused = self.client.wait_for_paused(timeout=30)
+        assert paused['callFrames'], 'Failed to stop on first line of code.'
+        assert 'NativeScript' in device.get_text(), 'Failed to stop on first line of code.'
+        self.client.resume()
+        device.wait_for_text(text='TAP', timeout=60)
+
+    def __debug_elements(self, platform, device):
+        result = Tns.debug(app_name=self.app_name, platform=platform, emulator=True)
+        device.wait_for_text(text='TAP')
+        self.__connect(result=result, domains=['DOM'])
+        assert self.client.find_nodes(self.xml_change.old_text), 'DOM tree does not contain expected text.'
+
+        # Sync changes and verify DOM tree is updated
+        Sync.replace(app_name=self.app_name, change_set=self.xml_change)
+        device.wait_for_text(text=self.xml_change.new_text)
+        assert self.client.find_nodes(self.xml_change.new_text), 'DOM tree not updated.'
@@ -5,8 +5,8 @@ from core.base_test.tns_run_test import TnsRunTest
 from core.enums.os_type import OSType
 from core.enums.platform_type import Platform
 from core.settings import Settings
-from core.utils.chrome.chrome import Chrome
 from core.utils.chrome.chrome_dev_tools import ChromeDevTools, ChromeDevToolsTabs
+from core.utils.chrome.chrome_pool import ChromePool
 from core.utils.file_utils import Folder, File
 from core.utils.git import Git
 from core.utils.wait import Wait
@@ -46,10 +46,10 @@ class DebugNetworkTests(TnsRunTest):
 
     def setUp(self):
         TnsRunTest.setUp(self)
-        self.chrome = Chrome()
+        self.chrome = ChromePool.acquire()
 
     def tearDown(self):
-        self.chrome.kill()
+        ChromePool.release(self.chrome)
         TnsRunTest.tearDown(self)
 
     def test_010_debug_android_elements(self):
@@ -4,8 +4,8 @@ from core.base_test.tns_run_test import TnsRunTest
 from core.enums.os_type import OSType
 from core.enums.platform_type import Platform
 from core.settings import Settings
-from core.utils.chrome.chrome import Chrome
 from core.utils.chrome.chrome_dev_tools import ChromeDevTools, ChromeDevToolsTabs
+from core.utils.chrome.chrome_pool import ChromePool
 from data.changes import Sync, Changes
 from data.templates import Template
 from products.nativescript.tns import Tns
@@ -21,7 +21,7 @@ class DebugNGTests(TnsRunTest):
     @classmethod
     def setUpClass(cls):
         TnsRunTest.setUpClass()
-        Tns.create(app_name=cls.app_name, template=Template.HELLO_WORLD_NG.local_package, update=True)
+        Tns.create(app_name=cls.app_name, template=Template.HELLO_WORLD_NG.local_package, update=True, cache=True)
         Tns.platform_add_android(app_name=cls.app_name, framework_path=Settings.Android.FRAMEWORK_PATH)
         if Settings.HOST_OS == OSType.OSX:
             Tns.platform_add_ios(app_name=cls.app_name, framework_path=Settings.IOS.FRAMEWORK_PATH)
@@ -30,10 +30,10 @@ class DebugNGTests(TnsRunTest):
         TnsRunTest.setUp(self)
         Sync.revert(app_name=self.app_name, change_set=self.ts_change, fail_safe=True)
         Sync.revert(app_name=self.app_name, change_set=self.xml_change, fail_safe=True)
-        self.chrome = Chrome()
+        self.chrome = ChromePool.acquire()
 
     def tearDown(self):
-        self.chrome.kill()
+        ChromePool.release(self.chrome)
         TnsRunTest.tearDown(self)
 
     def test_001_debug_android_elements(self):
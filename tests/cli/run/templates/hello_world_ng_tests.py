@@ -21,7 +21,7 @@ class TnsRunNGTests(TnsRunTest):
         TnsRunTest.setUpClass()
 
         # Create app
-        Tns.create(app_name=cls.app_name, template=Template.HELLO_WORLD_NG.local_package, update=True)
+        Tns.create(app_name=cls.app_name, template=Template.HELLO_WORLD_NG.local_package, update=True, cache=True)
         src = os.path.join(Settings.TEST_RUN_HOME, 'assets', 'logs', 'hello-world-ng', 'main.ts')
         target = os.path.join(Settings.TEST_RUN_HOME, cls.app_name, 'src')
         File.copy(source=src, target=target)
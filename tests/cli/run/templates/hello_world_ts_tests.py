@@ -23,7 +23,7 @@ class TnsRunTSTests(TnsRunTest):
         TnsRunTest.setUpClass()
 
         # Create app
-        Tns.create(app_name=cls.app_name, template=Template.HELLO_WORLD_TS.local_package, update=True)
+        Tns.create(app_name=cls.app_name, template=Template.HELLO_WORLD_TS.local_package, update=True, cache=True)
         src = os.path.join(Settings.TEST_RUN_HOME, 'assets', 'logs', 'hello-world-ts', 'app.ts')
         target = os.path.join(Settings.TEST_RUN_HOME, cls.app_name, 'app')
         File.copy(source=src, target=target)
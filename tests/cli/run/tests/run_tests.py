@@ -39,7 +39,7 @@ class TnsRunJSTests(TnsRunTest):
         TnsRunTest.setUpClass()
 
         # Create app
-        Tns.create(app_name=cls.app_name, template=Template.HELLO_WORLD_JS.local_package, update=True)
+        Tns.create(app_name=cls.app_name, template=Template.HELLO_WORLD_JS.local_package, update=True, cache=True)
         src = os.path.join(Settings.TEST_RUN_HOME, 'assets', 'logs', 'hello-world-js', 'app.js')
         target = os.path.join(cls.app_path, 'app')
         File.copy(source=src, target=target)
@@ -48,7 +48,7 @@ class TnsRunJSTests(TnsRunTest):
             Tns.platform_add_ios(app_name=cls.app_name, framework_path=Settings.IOS.FRAMEWORK_PATH)
 
         # Copy TestApp to data folder.
-        Folder.copy(source=cls.source_project_dir, target=cls.target_project_dir)
+        Folder.copy(source=cls.source_project_dir, target=cls.target_project_dir, clone=True, shared=[])
 
     def setUp(self):
         TnsRunTest.setUp(self)
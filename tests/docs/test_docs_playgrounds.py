@@ -7,7 +7,7 @@ from core.base_test.tns_run_test import TnsRunTest
 from core.enums.os_type import OSType
 from core.enums.platform_type import Platform
 from core.settings import Settings
-from core.utils.chrome.chrome import Chrome
+from core.utils.chrome.chrome_pool import ChromePool
 from products.nativescript.preview_helpers import Preview
 
 
@@ -47,10 +47,10 @@ class PlaygroundDocSamples(TnsRunTest):
 
     def setUp(self):
         TnsRunTest.setUp(self)
-        self.chrome = Chrome()
+        self.chrome = ChromePool.acquire()
 
     def tearDown(self):
-        self.chrome.kill()
+        ChromePool.release(self.chrome)
         TnsRunTest.tearDown(self)
 
     @classmethod
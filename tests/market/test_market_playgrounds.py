@@ -11,7 +11,8 @@ from core.enums.os_type import OSType
 from core.enums.platform_type import Platform
 from core.log.log import Log
 from core.settings import Settings
-from core.utils.chrome.chrome import Chrome
+from core.utils.chrome.chrome_pool import ChromePool
+from core.utils.wait import Wait
 from products.nativescript.market_helpers import Market
 from products.nativescript.preview_helpers import Preview
 
@@ -55,7 +56,8 @@ class PlaygroundMarketSamples(TnsRunTest):
         self.is_ios_fail = os.environ.get('is_ios_fail') == 'True'
 
     def tearDown(self):
-        self.chrome.kill()
+        ChromePool.release(self.chrome)
+        self.chrome = None
         TnsRunTest.tearDown(self)
 
     @classmethod
@@ -75,7 +77,8 @@ class PlaygroundMarketSamples(TnsRunTest):
         while retries >= 0:
             # =====================Android RUN========================
             if is_android_fail:
-                self.chrome = Chrome()
+                ChromePool.release(self.chrome)
+                self.chrome = ChromePool.acquire()
                 link, is_slow = PlaygroundMarketSamples.get_link(self.chrome, url)
                 if link == "":
                     Log.info('No Playground URL found in Android stage !!!')
@@ -88,7 +91,7 @@ class PlaygroundMarketSamples(TnsRunTest):
                 image_name = '{0}_{1}.png'.format(name.encode("utf8"), str(Platform.ANDROID))
                 Preview.run_url(url=link, device=self.emu)
                 Log.info(' Waiting Android app to load...')
-                time.sleep(10)
+                PlaygroundMarketSamples.wait_for_device(self.chrome, "Android SDK built")
                 PlaygroundMarketSamples.verify_device_is_connected(self.chrome, "Android SDK built")
                 emulator_result = PlaygroundMarketSamples.get_error(self.chrome)
                 is_android_fail = emulator_result > 0
@@ -98,7 +101,8 @@ class PlaygroundMarketSamples(TnsRunTest):
 
                 if is_android_fail:
                     self.emu.get_screen(os.path.join(Settings.TEST_OUT_IMAGES, image_name))
-                self.chrome.kill()
+                ChromePool.release(self.chrome)
+                self.chrome = None
 
             # =====================iOS RUN========================
             if Settings.HOST_OS == OSType.OSX and is_ios_fail:
@@ -108,7 +112,8 @@ class PlaygroundMarketSamples(TnsRunTest):
                     Log.info(' Installing Preview app on iOS ...')
                     Preview.install_preview_app_no_unpack(self.sim, Platform.IOS)
 
-                self.chrome = Chrome()
+                ChromePool.release(self.chrome)
+                self.chrome = ChromePool.acquire()
                 link, is_slow = PlaygroundMarketSamples.get_link(self.chrome, url)
                 if link == "":
                     Log.info('No Playground URL found in iOS stage !!!')
@@ -120,11 +125,11 @@ class PlaygroundMarketSamples(TnsRunTest):
                 Log.info('Testing iOS !!!')
                 Preview.run_url(url=link, device=self.sim)
                 if "test_0_" in self._testMethodName or "test_000_" in self._testMethodName:
-                    time.sleep(10)
+                    # close_popup waits until popup is shown
                     PlaygroundMarketSamples.close_popup(self.sim)
                 Log.info(' Waiting iOS app to load...')
                 Preview.dismiss_simulator_alert()
-                time.sleep(10)
+                PlaygroundMarketSamples.wait_for_device(self.chrome, self.sim.name)
                 PlaygroundMarketSamples.verify_device_is_connected(self.chrome, self.sim.name)
                 Preview.dismiss_simulator_alert()
 
@@ -223,6 +228,14 @@ class PlaygroundMarketSamples(TnsRunTest):
                 if iterations == 5:
                     break
 
+    @staticmethod
+    def wait_for_device(chrome, device, timeout=10):
+        """
+        Wait until device is listed in Playground (app is loaded in Preview app).
+        :return: True if device is listed before timeout, otherwise False.
+        """
+        return Wait.until(lambda: device in chrome.driver.page_source, timeout=timeout, period=1)
+
     @staticmethod
     def verify_device_is_connected(chrome, device, timeout=15):
         PlaygroundMarketSamples.close_cookie_alert(chrome)
@@ -1,16 +1,16 @@
 """
 Tests for app size ot {N} apps.
 """
-import logging
 import os
 import unittest
 
 from core.base_test.tns_test import TnsTest
 from core.enums.os_type import OSType
+from core.log.log import Log
 from core.settings import Settings
+from core.utils.archive_size import ArchiveSize
 from core.utils.file_utils import File, Folder
 from core.utils.perf_utils import PerfUtils
-from core.utils.run import run
 from data.templates import Template
 from products.nativescript.tns import Tns
 from products.nativescript.tns_paths import TnsPaths
@@ -49,33 +49,32 @@ class AppSizeTests(TnsTest):
 
     def test_002_js_app_node_modules(self):
         folder = os.path.join(TnsPaths.get_app_path(app_name=self.js_app), 'node_modules')
-        assert PerfUtils.is_value_in_range(actual=Folder.get_size(folder), expected=51791943, tolerance=0.2)
+        assert PerfUtils.is_value_in_range(actual=Folder.get_size(folder, workers=4), expected=51791943, tolerance=0.2)
 
     def test_003_js_app_apk(self):
-        # Extract APK
+        # Read content of APK
         apk = TnsPaths.get_apk_path(app_name=self.js_app, release=True)
-        extracted_apk = os.path.join(Settings.TEST_OUT_TEMP, 'js-apk')
-        File.unzip(file_path=apk, dest_dir=extracted_apk)
-
-        res = os.path.join(extracted_apk, 'res')
-        assets_app = os.path.join(extracted_apk, 'assets', 'app')
-        assets_snapshots = os.path.join(extracted_apk, 'assets', 'snapshots')
-        lib = os.path.join(extracted_apk, 'lib')
-        run(cmd='du -hs *', cwd=lib, wait=True, log_level=logging.INFO)
+        entries = Helpers.get_entries(archive=apk, name='js-apk')
+        report = Helpers.get_diff_report(entries=entries, name='js-apk')
 
         # Verify content of APK
-        assert PerfUtils.is_value_in_range(actual=Folder.get_size(lib), expected=38724352, tolerance=0.1)
-        assert PerfUtils.is_value_in_range(actual=Folder.get_size(res), expected=843827, tolerance=0.1)
-        assert PerfUtils.is_value_in_range(actual=Folder.get_size(assets_app), expected=641606, tolerance=0.1)
-        assert PerfUtils.is_value_in_range(actual=Folder.get_size(assets_snapshots), expected=5811260, tolerance=0.1)
+        lib = ArchiveSize.get_size(entries, 'lib')
+        res = ArchiveSize.get_size(entries, 'res')
+        assets_app = ArchiveSize.get_size(entries, 'assets/app')
+        assets_snapshots = ArchiveSize.get_size(entries, 'assets/snapshots')
+        assert PerfUtils.is_value_in_range(actual=lib, expected=38724352, tolerance=0.1), report
+        assert PerfUtils.is_value_in_range(actual=res, expected=843827, tolerance=0.1), report
+        assert PerfUtils.is_value_in_range(actual=assets_app, expected=641606, tolerance=0.1), report
+        assert PerfUtils.is_value_in_range(actual=assets_snapshots, expected=5811260, tolerance=0.1), report
 
         # Verify final apk size
-        assert PerfUtils.is_value_in_range(actual=File.get_size(apk), expected=18216351, tolerance=0.05)
+        assert PerfUtils.is_value_in_range(actual=File.get_size(apk), expected=18216351, tolerance=0.05), report
 
     @unittest.skipIf(Settings.HOST_OS != OSType.OSX, 'iOS tests can be executed only on macOS.')
     def test_102_js_app_ipa(self):
         ipa = TnsPaths.get_ipa_path(app_name=self.js_app, release=True, for_device=True)
-        assert PerfUtils.is_value_in_range(actual=File.get_size(ipa), expected=16001936, tolerance=0.05)
+        report = Helpers.get_diff_report(entries=Helpers.get_entries(archive=ipa, name='js-ipa'), name='js-ipa')
+        assert PerfUtils.is_value_in_range(actual=File.get_size(ipa), expected=16001936, tolerance=0.05), report
 
     def test_100_ng_app_app_resources(self):
         app_folder = os.path.join(TnsPaths.get_app_path(app_name=self.ng_app), 'App_Resources')
@@ -83,25 +82,53 @@ class AppSizeTests(TnsTest):
 
     def test_101_ng_app_node_modules(self):
         app_folder = os.path.join(TnsPaths.get_app_path(app_name=self.ng_app), 'node_modules')
-        assert PerfUtils.is_value_in_range(actual=Folder.get_size(app_folder), expected=200248003, tolerance=0.2)
+        assert PerfUtils.is_value_in_range(actual=Folder.get_size(app_folder, workers=4), expected=200248003,
+                                           tolerance=0.2)
 
     def test_102_ng_app_apk(self):
-        # Extract APK
+        # Read content of APK
         apk = TnsPaths.get_apk_path(app_name=self.ng_app, release=True)
-        extracted_apk = os.path.join(Settings.TEST_OUT_TEMP, 'ng-apk')
-        File.unzip(file_path=apk, dest_dir=extracted_apk)
-
-        assets_app = os.path.join(extracted_apk, 'assets', 'app')
-        assets_snapshots = os.path.join(extracted_apk, 'assets', 'snapshots')
+        entries = Helpers.get_entries(archive=apk, name='ng-apk')
+        report = Helpers.get_diff_report(entries=entries, name='ng-apk')
 
         # No asserts for lib and res, since it is same as JS project
-        assert PerfUtils.is_value_in_range(actual=Folder.get_size(assets_app), expected=1342382, tolerance=0.1)
-        assert PerfUtils.is_value_in_range(actual=Folder.get_size(assets_snapshots), expected=13157964, tolerance=0.1)
+        assets_app = ArchiveSize.get_size(entries, 'assets/app')
+        assets_snapshots = ArchiveSize.get_size(entries, 'assets/snapshots')
+        assert PerfUtils.is_value_in_range(actual=assets_app, expected=1342382, tolerance=0.1), report
+        assert PerfUtils.is_value_in_range(actual=assets_snapshots, expected=13157964, tolerance=0.1), report
 
         # Verify final apk size
-        assert PerfUtils.is_value_in_range(actual=File.get_size(apk), expected=20087522, tolerance=0.05)
+        assert PerfUtils.is_value_in_range(actual=File.get_size(apk), expected=20087522, tolerance=0.05), report
 
     @unittest.skipIf(Settings.HOST_OS != OSType.OSX, 'iOS tests can be executed only on macOS.')
     def test_102_ng_app_ipa(self):
         ipa = TnsPaths.get_ipa_path(app_name=self.ng_app, release=True, for_device=True)
-        assert PerfUtils.is_value_in_range(actual=File.get_size(ipa), expected=16226626, tolerance=0.05)
+        report = Helpers.get_diff_report(entries=Helpers.get_entries(archive=ipa, name='ng-ipa'), name='ng-ipa')
+        assert PerfUtils.is_value_in_range(actual=File.get_size(ipa), expected=16226626, tolerance=0.05), report
+
+
+class Helpers(object):
+    @staticmethod
+    def get_entries(archive, name):
+        """
+        Read content of archive, log sizes grouped by path prefix and save manifest in `out/app_size`.
+        """
+        entries = ArchiveSize.get_entries(archive)
+        for prefix, size in sorted(ArchiveSize.get_sizes(entries).items()):
+            Log.info('{0:<40} {1:>12} {2:>12} ({3} files)'.format(prefix, size['compressed'],
+                                                                  size['uncompressed'], size['count']))
+        ArchiveSize.save_manifest(entries, os.path.join(Settings.TEST_OUT_HOME, 'app_size', name + '.json'))
+        return entries
+
+    @staticmethod
+    def get_diff_report(entries, name):
+        """
+        Compare content of archive with baseline manifest (from `Settings.SIZE_BASELINES`).
+        """
+        baseline = ArchiveSize.load_manifest(os.path.join(Settings.SIZE_BASELINES, name + '.json'))
+        if baseline is None:
+            report = 'No baseline manifest for {0} in {1}.'.format(name, Settings.SIZE_BASELINES)
+        else:
+            report = ArchiveSize.get_diff_report(entries=entries, baseline=baseline)
+        Log.info(report)
+        return report
@@ -0,0 +1,154 @@
+"""
+Tests for startup time of {N} apps on Android emulator.
+
+Apps are built in release with different build flags,
+so results show what `uglify`, `aot` and `snapshot` buy at runtime.
+Launch times are measured with `am start -W` (TotalTime and WaitTime) and `Displayed` events in logcat:
+- cold start: app process is killed before launch.
+- warm start: app process is alive, but activity is destroyed (back button) before launch.
+"""
+# pylint: disable=unused-argument
+import json
+import os
+
+from parameterized import parameterized
+
+from core.base_test.tns_run_android_test import TnsRunAndroidTest
+from core.enums.platform_type import Platform
+from core.log.log import Log
+from core.settings import Settings
+from core.utils.device.adb import Adb
+from core.utils.file_utils import File
+from core.utils.perf_history import PerfHistory
+from core.utils.perf_utils import PerfUtils
+from data.templates import Template
+from products.nativescript.tns import Tns
+from products.nativescript.tns_paths import TnsPaths
+
+START_COUNT = 10
+PERCENTILES = [50, 90]
+
+# Build flags: (name, aot, uglify, snapshot)
+BUILD_FLAGS = [
+    ('release', False, False, False),
+    ('uglify', True, True, False),
+    ('snapshot', False, False, True),
+    ('all', True, True, True),
+]
+
+
+# noinspection PyMethodMayBeStatic,PyUnusedLocal
+class StartupTimeTests(TnsRunAndroidTest):
+    TEST_DATA = [
+        ('hello-world-js', 'StartJS', Template.HELLO_WORLD_JS),
+        ('hello-world-ng', 'StartNG', Template.HELLO_WORLD_NG),
+        ('master-detail-ng', 'StartMDNG', Template.MASTER_DETAIL_NG),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        TnsRunAndroidTest.setUpClass()
+        for _, app_name, template_info in cls.TEST_DATA:
+            Tns.create(app_name=app_name, template=template_info.local_package, update=True)
+            Tns.platform_add_android(app_name=app_name, framework_path=Settings.Android.FRAMEWORK_PATH)
+
+    @classmethod
+    def tearDownClass(cls):
+        TnsRunAndroidTest.tearDownClass()
+
+    @parameterized.expand(TEST_DATA)
+    def test_100_startup_time(self, template, app_name, template_info):
+        for flags in BUILD_FLAGS:
+            Helpers.measure(template=template, app_name=app_name, device_id=self.emu.id, flags=flags)
+        regressions = []
+        for name, _, _, _ in BUILD_FLAGS:
+            for metric in sorted(Helpers.get_result(template, name)['times'].keys()):
+                regressions.extend(PerfHistory.check(template=template, platform=Platform.ANDROID,
+                                                     metric='startup_{0}_{1}'.format(name, metric)))
+        Log.info(Helpers.get_report(template))
+        assert not regressions, 'Regressions in startup time:\n' + '\n'.join(regressions)
+
+
+class Helpers(object):
+    @staticmethod
+    def measure(template, app_name, device_id, flags):
+        """
+        Build release apk with specified flags, install it and measure cold and warm launches.
+        """
+        _, aot, uglify, snapshot = flags
+        Tns.build_android(app_name=app_name, release=True, bundle=True, aot=aot, uglify=uglify, snapshot=snapshot)
+        app_id = TnsPaths.get_bundle_id(app_name)
+        Adb.uninstall(app_id=app_id, device_id=device_id, assert_success=False)
+        Adb.install(apk_path=TnsPaths.get_apk_path(app_name=app_name, release=True), device_id=device_id)
+
+        # First launch after install is slower (runtime extracts assets and compiles dex), so ignore it.
+        Helpers.launch(device_id=device_id, app_id=app_id, cold=True)
+
+        samples = {}
+        for _ in range(START_COUNT):
+            for kind, cold in [('cold', True), ('warm', False)]:
+                for key, value in Helpers.launch(device_id=device_id, app_id=app_id, cold=cold).items():
+                    samples.setdefault('{0}_{1}'.format(kind, key), []).append(value)
+        Adb.stop_application(device_id=device_id, app_id=app_id)
+        Adb.uninstall(app_id=app_id, device_id=device_id, assert_success=False)
+        Helpers.save_result(template=template, flags=flags, samples=samples)
+
+    @staticmethod
+    def launch(device_id, app_id, cold):
+        """
+        Launch app and get launch times.
+        :return: dict {'total': ms, 'wait': ms, 'displayed': ms} (displayed is missing if not found in logcat).
+        """
+        if cold:
+            Adb.stop_application(device_id=device_id, app_id=app_id)
+        else:
+            # Destroy activity, but keep the process alive.
+            Adb.run_adb_command(command='shell input keyevent KEYCODE_BACK', device_id=device_id)
+        Adb.clear_logcat(device_id=device_id)
+        times = Adb.start_application_with_timing(device_id=device_id, app_id=app_id)
+        result = {'total': times['TotalTime'], 'wait': times['WaitTime']}
+        displayed = Adb.parse_displayed_times(logcat=Adb.get_logcat(device_id=device_id), app_id=app_id)
+        if displayed:
+            result['displayed'] = displayed[-1]
+        return result
+
+    @staticmethod
+    def save_result(template, flags, samples):
+        """
+        Save percentiles of launch times (together with the build flags) in results file and results history.
+        Metrics are named `startup_<flags>_<cold|warm>_<total|wait|displayed>_p<percentile>`.
+        """
+        name, aot, uglify, snapshot = flags
+        times = {}
+        for key, values in samples.items():
+            for percentile in PERCENTILES:
+                metric = '{0}_p{1}'.format(key, percentile)
+                times[metric] = PerfUtils.get_percentile(values, percentile)
+                PerfHistory.record(template=template, platform=Platform.ANDROID,
+                                   metric='startup_{0}_{1}'.format(name, metric), value=times[metric])
+        result = {'flags': {'release': True, 'aot': aot, 'uglify': uglify, 'snapshot': snapshot}, 'times': times}
+        File.write(path=Helpers.get_result_file_name(template, name), text=json.dumps(result, sort_keys=True, indent=4))
+
+    @staticmethod
+    def get_result_file_name(template, name):
+        return os.path.join(Settings.TEST_OUT_HOME, 'startup_{0}_{1}.json'.format(template, name))
+
+    @staticmethod
+    def get_result(template, name):
+        return json.loads(File.read(Helpers.get_result_file_name(template, name)))
+
+    @staticmethod
+    def get_report(template):
+        """
+        Get median cold/warm start times for each set of build flags compared to plain release build.
+        """
+        base = Helpers.get_result(template, BUILD_FLAGS[0][0])['times']
+        lines = ['Startup time of {0} (ms):'.format(template)]
+        for name, _, _, _ in BUILD_FLAGS:
+            times = Helpers.get_result(template, name)['times']
+            line = '{0:<10}'.format(name)
+            for metric in ['cold_total_p50', 'warm_total_p50']:
+                change = times[metric] / float(base[metric]) - 1
+                line += ' {0}: {1:>6.0f} ({2:+.0%})'.format(metric, times[metric], change)
+            lines.append(line)
+        return os.linesep.join(lines)
@@ -2,33 +2,44 @@
 # pylint: disable=undefined-variable
 
 import json
+import multiprocessing
 import os
+import threading
 import unittest
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
 
 from parameterized import parameterized
 
 from core.base_test.tns_test import TnsTest
+from core.enums.fixture_type import FixtureType
 from core.enums.os_type import OSType
 from core.enums.platform_type import Platform
+from core.log.log import Log
 from core.settings import Settings
 from core.utils.file_utils import Folder, File
 from core.utils.gradle import Gradle
 from core.utils.json_utils import JsonUtils
 from core.utils.npm import Npm
+from core.utils.perf_history import PerfHistory
 from core.utils.perf_utils import PerfUtils
 from core.utils.xcode import Xcode
 from data.changes import Changes, Sync
 from data.templates import Template
 from products.nativescript.tns import Tns
+from products.nativescript.tns_phases import TnsPhases
 
 RETRY_COUNT = 3
 TOLERANCE = 0.20
 APP_NAME = Settings.AppName.DEFAULT
+# Results measured with fixture pipeline are not compared with results measured before it (see `PerfHistory.record`)
+CONDITIONS = 'fixture-pipeline'
 EXPECTED_RESULTS = JsonUtils.read(os.path.join(Settings.TEST_RUN_HOME, 'tests', 'perf', 'data.json'))
 
 
 # noinspection PyMethodMayBeStatic,PyUnusedLocal
 class PrepareAndBuildPerfTests(TnsTest):
+    FIXTURES = [FixtureType.NO_DEVICES, FixtureType.CLEAN_GRADLE]
     TEST_DATA = [
         ('hello-world-js', Template.HELLO_WORLD_JS.local_package, Changes.JSHelloWord.JS),
         ('hello-world-ng', Template.HELLO_WORLD_NG.local_package, Changes.NGHelloWorld.TS),
@@ -46,14 +57,8 @@ class PrepareAndBuildPerfTests(TnsTest):
     def tearDownClass(cls):
         TnsTest.tearDownClass()
 
-    @parameterized.expand(TEST_DATA)
-    def test_001_prepare_data(self, template, template_package, change_set):
-        android_result_file = Helpers.get_result_file_name(template, Platform.ANDROID)
-        ios_result_file = Helpers.get_result_file_name(template, Platform.IOS)
-        Helpers.prepare_and_build(template=template_package, platform=Platform.ANDROID,
-                                  change_set=change_set, result_file=android_result_file)
-        Helpers.prepare_and_build(template=template_package, platform=Platform.IOS,
-                                  change_set=change_set, result_file=ios_result_file)
+    def test_001_prepare_data(self):
+        Helpers.collect(test_data=self.TEST_DATA)
 
     @parameterized.expand(TEST_DATA)
     def test_200_prepare_android_initial(self, template, template_package, change_set):
@@ -120,6 +125,28 @@ class PrepareAndBuildPerfTests(TnsTest):
         expected = Helpers.get_expected_result(template, Platform.IOS, 'build_incremental')
         assert PerfUtils.is_value_in_range(actual, expected, TOLERANCE), 'Incremental ios build time is not OK.'
 
+    @parameterized.expand(TEST_DATA)
+    def test_400_android_history(self, template, template_package, change_set):
+        regressions = Helpers.get_regressions(template, Platform.ANDROID)
+        assert not regressions, 'Regressions in android history:\n' + '\n'.join(regressions)
+
+    @parameterized.expand(TEST_DATA)
+    @unittest.skipIf(Settings.HOST_OS != OSType.OSX, 'iOS tests can be executed only on macOS.')
+    def test_401_ios_history(self, template, template_package, change_set):
+        regressions = Helpers.get_regressions(template, Platform.IOS)
+        assert not regressions, 'Regressions in ios history:\n' + '\n'.join(regressions)
+
+    @parameterized.expand(TEST_DATA)
+    def test_410_android_phases(self, template, template_package, change_set):
+        regressions = Helpers.get_phase_regressions(template, Platform.ANDROID)
+        assert not regressions, 'Regressions in android phases:\n' + '\n'.join(regressions)
+
+    @parameterized.expand(TEST_DATA)
+    @unittest.skipIf(Settings.HOST_OS != OSType.OSX, 'iOS tests can be executed only on macOS.')
+    def test_411_ios_phases(self, template, template_package, change_set):
+        regressions = Helpers.get_phase_regressions(template, Platform.IOS)
+        assert not regressions, 'Regressions in ios phases:\n' + '\n'.join(regressions)
+
 
 class PrepareBuildInfo(object):
     prepare_initial = 0
@@ -128,58 +155,231 @@ class PrepareBuildInfo(object):
     build_initial = 0
     build_incremental = 0
 
+    def __init__(self):
+        # Duration of phases (webpack, gradle, etc.) for each metric: {metric: {phase: duration}}
+        self.phases = {}
+
+
+class MeasureGate(object):
+    """
+    Setup steps can run in parallel with each other, but never together with measured commands.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.setups = 0
+        self.measuring = False
+
+    @contextmanager
+    def setup(self):
+        with self.condition:
+            while self.measuring:
+                self.condition.wait()
+            self.setups += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.setups -= 1
+                self.condition.notify_all()
+
+    @contextmanager
+    def measure(self):
+        with self.condition:
+            self.measuring = True
+            while self.setups:
+                self.condition.wait()
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.measuring = False
+                self.condition.notify_all()
+
 
 class Helpers(object):
     @staticmethod
-    def prepare_and_build(template, platform, change_set, result_file):
-        prepare_initial = 0
-        prepare_skip = 0
-        prepare_incremental = 0
-        build_initial = 0
-        build_incremental = 0
-        for _ in range(RETRY_COUNT):
-            Tns.kill()
-            Gradle.kill()
-            Npm.cache_clean()
+    def collect(test_data):
+        """
+        Collect prepare and build times for all templates.
+
+        Collection is a pipeline:
+        - Fixture app for each template is created (and updated) once, fixtures are created one by one.
+        - Work apps (copy of the fixture + platform add) are prepared in parallel in thread pool.
+        - Measured commands (prepare and build) are executed serially, one work app at a time,
+          and no setup step is running while commands are measured.
+        :param test_data: List of (template name, template package, change set) tuples.
+        """
+        platforms = [Platform.ANDROID]
+        if Settings.HOST_OS == OSType.OSX:
+            platforms.append(Platform.IOS)
+
+        # Each work app is created for specific template, platform and iteration
+        jobs = []
+        for index, (template, _, change_set) in enumerate(test_data):
+            for platform in platforms:
+                for iteration in range(RETRY_COUNT):
+                    app_name = '{0}{1}{2}{3}'.format(APP_NAME, index, str(platform)[0].upper(), iteration)
+                    jobs.append((template, change_set, platform, app_name))
+
+        workers = Helpers.get_workers(count=len(test_data))
+        fixtures = Helpers.create_fixtures(test_data=test_data)
+
+        # Limit count of work apps on disk (slot is released when work app is measured and deleted)
+        slots = threading.BoundedSemaphore(workers * 2)
+        gate = MeasureGate()
+
+        def setup(job):
+            slots.acquire()
+            _, _, platform, app_name = job
+            with gate.setup():
+                # Fixture is cloned without hard links (builds modify node_modules in place, so each work app needs
+                # its own files to be measured under the same conditions)
+                app_path = os.path.join(Settings.TEST_RUN_HOME, app_name)
+                Folder.clean(folder=app_path)
+                Folder.clone(source=fixtures[job[0]], target=app_path, shared=[])
+                Tns.platform_add(app_name=app_name, platform=platform, framework_path=Helpers.get_framework(platform))
+            return job
+
+        results = {}
+        pool = ThreadPool(workers)
+        try:
+            for template, change_set, platform, app_name in pool.imap_unordered(setup, jobs):
+                result = results.setdefault((template, platform), PrepareBuildInfo())
+                with gate.measure():
+                    Helpers.prepare_and_build(app_name=app_name, platform=platform, change_set=change_set,
+                                              result=result)
+                Folder.clean(folder=os.path.join(Settings.TEST_RUN_HOME, app_name))
+                slots.release()
+        finally:
+            # Unblock setup workers waiting for free slot (in case measurement failed) and stop the pool
+            for _ in jobs:
+                try:
+                    slots.release()
+                except ValueError:
+                    break
+            pool.terminate()
+            pool.join()
+            for fixture in fixtures.values():
+                Folder.clean(folder=fixture)
+
+        for (template, platform), result in results.items():
+            Helpers.save_result(template=template, platform=platform, result=result)
+
+    @staticmethod
+    def get_workers(count):
+        """
+        Get count of parallel setup workers (each one runs `tns platform add` and copy of node_modules).
+        :param count: Max count of workers.
+        """
+        return max(1, min(count, multiprocessing.cpu_count() // 2))
+
+    @staticmethod
+    def get_framework(platform):
+        if platform == Platform.ANDROID:
+            return Settings.Android.FRAMEWORK_PATH
+        elif platform == Platform.IOS:
+            return Settings.IOS.FRAMEWORK_PATH
+        else:
+            raise Exception('Unknown platform: ' + str(platform))
+
+    @staticmethod
+    def create_fixtures(test_data):
+        """
+        Create and update app for each template.
+        Fixtures are created serially (`tns create` and `npm install` share the CLI, npm cache and the test context).
+        :return: dict with template name as key and path to fixture app as value.
+        """
+        fixtures = {}
+        for index, (template, template_package, _) in enumerate(test_data):
+            app_name = '{0}Fixture{1}'.format(APP_NAME, index)
+            Tns.create(app_name=app_name, template=template_package, update=True)
+            fixtures[template] = os.path.join(Settings.TEST_RUN_HOME, app_name)
+        return fixtures
+
+    @staticmethod
+    def prepare_and_build(app_name, platform, change_set, result):
+        """
+        Measure prepare and build times of work app (prepared by setup step of the pipeline).
+        Measured values are added to `result`, averages are calculated in `save_result`.
+        """
+        # Each iteration is measured from the same state: no CLI processes, clean npm cache and cold Gradle daemon
+        # (even if daemon is reused between functional tests).
+        Tns.kill()
+        Gradle.kill()
+        Npm.cache_clean()
+        if platform == Platform.IOS:
             Xcode.cache_clean()
-            Folder.clean(folder=os.path.join(Settings.TEST_RUN_HOME, APP_NAME))
-            Tns.create(app_name=APP_NAME, template=template, update=True)
-            if platform == Platform.ANDROID:
-                Tns.platform_add_android(app_name=APP_NAME, framework_path=Settings.Android.FRAMEWORK_PATH)
-            elif platform == Platform.IOS:
-                Tns.platform_add_ios(app_name=APP_NAME, framework_path=Settings.IOS.FRAMEWORK_PATH)
-            else:
-                raise Exception('Unknown platform: ' + str(platform))
-
-            # Prepare
-            time = Tns.prepare(app_name=APP_NAME, platform=platform, bundle=True).duration
-            prepare_initial = prepare_initial + time
-            time = Tns.prepare(app_name=APP_NAME, platform=platform, bundle=True).duration
-            prepare_skip = prepare_skip + time
-            Sync.replace(app_name=APP_NAME, change_set=change_set)
-            time = Tns.prepare(app_name=APP_NAME, platform=platform, bundle=True).duration
-            prepare_incremental = prepare_incremental + time
-
-            # Build
-            time = Tns.build(app_name=APP_NAME, platform=platform, bundle=True).duration
-            build_initial = build_initial + time
-            Sync.revert(app_name=APP_NAME, change_set=change_set)
-            time = Tns.build(app_name=APP_NAME, platform=platform, bundle=True).duration
-            build_incremental = build_incremental + time
 
+        def prepare(metric):
+            Helpers.add_result(result, metric, Tns.prepare(app_name=app_name, platform=platform, bundle=True,
+                                                           log_trace=True, timeline=True))
+
+        def build(metric):
+            Helpers.add_result(result, metric, Tns.build(app_name=app_name, platform=platform, bundle=True,
+                                                         log_trace=True, timeline=True))
+
+        # Prepare
+        prepare('prepare_initial')
+        prepare('prepare_skip')
+        Sync.replace(app_name=app_name, change_set=change_set)
+        prepare('prepare_incremental')
+
+        # Build
+        build('build_initial')
+        Sync.revert(app_name=app_name, change_set=change_set)
+        build('build_incremental')
+
+    @staticmethod
+    def add_result(result, metric, process_info):
+        """
+        Add duration of command and duration of its phases to result.
+        """
+        setattr(result, metric, getattr(result, metric) + process_info.duration)
+        phases = result.phases.setdefault(metric, {})
+        for phase, duration in TnsPhases.get_phases(process_info.timeline).items():
+            phases[phase] = phases.get(phase, 0) + duration
+
+    @staticmethod
+    def save_result(template, platform, result):
         # Calculate averages
-        result = PrepareBuildInfo()
-        result.prepare_initial = prepare_initial / RETRY_COUNT
-        result.prepare_skip = prepare_skip / RETRY_COUNT
-        result.prepare_incremental = prepare_incremental / RETRY_COUNT
-        result.build_initial = build_initial / RETRY_COUNT
-        result.build_incremental = build_incremental / RETRY_COUNT
+        result.prepare_initial = result.prepare_initial / RETRY_COUNT
+        result.prepare_skip = result.prepare_skip / RETRY_COUNT
+        result.prepare_incremental = result.prepare_incremental / RETRY_COUNT
+        result.build_initial = result.build_initial / RETRY_COUNT
+        result.build_incremental = result.build_incremental / RETRY_COUNT
+        for phases in result.phases.values():
+            for phase in phases:
+                phases[phase] = phases[phase] / RETRY_COUNT
 
         # Save to results file
+        result_file = Helpers.get_result_file_name(template, platform)
         File.delete(path=result_file)
         result_json = json.dumps(result, default=lambda o: o.__dict__, sort_keys=True, indent=4)
         File.write(path=result_file, text=str(result_json))
 
+        # Save to results history (phases are saved as `<metric>.<phase>`, for example `build_incremental.gradle`)
+        for metric, value in sorted(Helpers.get_metrics(result.__dict__).items()):
+            PerfHistory.record(template=template, platform=platform, metric=metric, value=value,
+                               conditions=CONDITIONS)
+
+    @staticmethod
+    def get_metrics(results):
+        """
+        Get flat dict of metrics from results.
+        :param results: Results as dict (content of the results file).
+        :return: dict {metric: value}.
+        """
+        metrics = {}
+        for metric, value in results.items():
+            if metric == 'phases':
+                for command, phases in value.items():
+                    for phase, duration in phases.items():
+                        metrics['{0}.{1}'.format(command, phase)] = duration
+            else:
+                metrics[metric] = value
+        return metrics
+
     @staticmethod
     def get_result_file_name(template, platform):
         result_file = os.path.join(Settings.TEST_OUT_HOME, '{0}_{1}.json'.format(template, str(platform)))
@@ -190,6 +390,39 @@ class Helpers(object):
         result_file = Helpers.get_result_file_name(template, platform)
         return JsonUtils.read(result_file)[entry]
 
+    @staticmethod
+    def get_regressions(template, platform):
+        regressions = []
+        for metric in sorted(Helpers.get_metrics(Helpers.get_actual_results(template, platform)).keys()):
+            regressions.extend(PerfHistory.check(template=template, platform=platform, metric=metric,
+                                                 conditions=CONDITIONS))
+        Log.info('Perf history:' + os.linesep + PerfHistory.get_report())
+        return regressions
+
+    @staticmethod
+    def get_phase_regressions(template, platform):
+        """
+        Compare phases of each command with baseline (median of previous results in history).
+        """
+        regressions = []
+        for metric, phases in sorted(Helpers.get_actual_results(template, platform)['phases'].items()):
+            baseline = {}
+            for phase in phases:
+                value = PerfHistory.get_baseline(template=template, platform=platform,
+                                                 metric='{0}.{1}'.format(metric, phase), skip=1,
+                                                 conditions=CONDITIONS)
+                if value is not None:
+                    baseline[phase] = value
+            Log.info('{0} {1} {2} phases: {3}, baseline: {4}'.format(template, str(platform), metric, phases,
+                                                                     baseline))
+            for regression in TnsPhases.compare(phases=phases, baseline=baseline, tolerance=TOLERANCE):
+                regressions.append('{0} {1}'.format(metric, regression))
+        return regressions
+
+    @staticmethod
+    def get_actual_results(template, platform):
+        return JsonUtils.read(Helpers.get_result_file_name(template, platform))
+
     @staticmethod
     def get_expected_result(template, platform, entry):
         platform = str(platform)
@@ -7,6 +7,7 @@ from core.base_test.tns_test import TnsTest
 from core.settings import Settings
 from core.utils.json_utils import JsonUtils
 from core.utils.npm import Npm
+from core.utils.npm_store import NpmStore
 from core.utils.perf_utils import PerfUtils
 from data.templates import Template
 from products.nativescript.tns import Tns
@@ -23,6 +24,8 @@ class CreateAppPerfTests(TnsTest):
     @classmethod
     def setUpClass(cls):
         TnsTest.setUpClass()
+        # Measure with cold npm cache (packages are downloaded from npm registry).
+        NpmStore.stop()
 
     def setUp(self):
         TnsTest.setUp(self)
@@ -6,6 +6,7 @@ from core.enums.os_type import OSType
 from core.settings import Settings
 from core.utils.json_utils import JsonUtils
 from core.utils.npm import Npm
+from core.utils.npm_store import NpmStore
 from core.utils.perf_utils import PerfUtils
 from data.templates import Template
 from products.nativescript.tns import Tns
@@ -23,6 +24,8 @@ class PlatformAddPerfTests(TnsTest):
     @classmethod
     def setUpClass(cls):
         TnsTest.setUpClass()
+        # Measure with cold npm cache (packages are downloaded from npm registry).
+        NpmStore.stop()
 
     def setUp(self):
         TnsTest.setUp(self)
@@ -0,0 +1,195 @@
+# pylint: disable=unused-argument
+# pylint: disable=undefined-variable
+
+import json
+import os
+import time
+import unittest
+
+from parameterized import parameterized
+
+from core.base_test.tns_run_test import TnsRunTest
+from core.enums.os_type import OSType
+from core.enums.platform_type import Platform
+from core.log.log import Log
+from core.settings import Settings
+from core.utils.file_utils import File
+from core.utils.perf_history import PerfHistory
+from core.utils.perf_utils import PerfUtils
+from data.changes import Changes, Sync
+from data.templates import Template
+from products.nativescript.run_type import RunType
+from products.nativescript.tns import Tns
+from products.nativescript.tns_logs import TnsLogs
+
+SYNC_COUNT = 10
+SYNC_TIMEOUT = 120
+PERCENTILES = [50, 90]
+SYNCED_MESSAGE = 'Successfully synced application'
+
+JS_APP = 'SyncJS'
+NG_APP = 'SyncNG'
+JS_CHANGES = [Changes.JSHelloWord.JS, Changes.JSHelloWord.XML, Changes.JSHelloWord.CSS]
+NG_CHANGES = [Changes.NGHelloWorld.TS, Changes.NGHelloWorld.XML_ACTION_BAR, Changes.NGHelloWorld.CSS]
+
+
+# noinspection PyMethodMayBeStatic,PyUnusedLocal
+class SyncPerfTests(TnsRunTest):
+    TEST_DATA = [
+        ('hello-world-js', JS_APP, JS_CHANGES, True),
+        ('hello-world-js', JS_APP, JS_CHANGES, False),
+        ('hello-world-ng', NG_APP, NG_CHANGES, True),
+        ('hello-world-ng', NG_APP, NG_CHANGES, False),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        TnsRunTest.setUpClass()
+        for app_name, template in [(JS_APP, Template.HELLO_WORLD_JS), (NG_APP, Template.HELLO_WORLD_NG)]:
+            Tns.create(app_name=app_name, template=template.local_package, update=True)
+            Tns.platform_add_android(app_name=app_name, framework_path=Settings.Android.FRAMEWORK_PATH)
+            if Settings.HOST_OS is OSType.OSX:
+                Tns.platform_add_ios(app_name=app_name, framework_path=Settings.IOS.FRAMEWORK_PATH)
+
+    def setUp(self):
+        TnsRunTest.setUp(self)
+        # Revert changes left by previous test (in case it failed in the middle of the sync).
+        Sync.revert_all(app_name=JS_APP, change_sets=JS_CHANGES, fail_safe=True)
+        Sync.revert_all(app_name=NG_APP, change_sets=NG_CHANGES, fail_safe=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        TnsRunTest.tearDownClass()
+
+    @parameterized.expand(TEST_DATA)
+    def test_100_sync_android(self, template, app_name, changes, hmr):
+        Helpers.measure(template=template, app_name=app_name, platform=Platform.ANDROID, device=self.emu,
+                        changes=changes, hmr=hmr)
+        regressions = Helpers.get_regressions(template=template, platform=Platform.ANDROID, hmr=hmr)
+        assert not regressions, 'Regressions in android sync:\n' + '\n'.join(regressions)
+
+    @parameterized.expand(TEST_DATA)
+    @unittest.skipIf(Settings.HOST_OS != OSType.OSX, 'iOS tests can be executed only on macOS.')
+    def test_101_sync_ios(self, template, app_name, changes, hmr):
+        Helpers.measure(template=template, app_name=app_name, platform=Platform.IOS, device=self.sim,
+                        changes=changes, hmr=hmr)
+        regressions = Helpers.get_regressions(template=template, platform=Platform.IOS, hmr=hmr)
+        assert not regressions, 'Regressions in ios sync:\n' + '\n'.join(regressions)
+
+
+class Helpers(object):
+    @staticmethod
+    def measure(template, app_name, platform, device, changes, hmr):
+        """
+        Start `tns run`, apply each change (and revert it) `SYNC_COUNT` times and measure:
+        - log latency: time from the edit until 'Successfully synced application' is logged.
+        - ui latency: time from the edit until the change is visible on device.
+        UI is polled without delay, so resolution of ui latency is the time needed to read the screen (~1 sec).
+        """
+        result = Tns.run(app_name=app_name, platform=platform, emulator=True, wait=False, hmr=hmr)
+        strings = TnsLogs.run_messages(app_name=app_name, platform=platform, run_type=RunType.UNKNOWN, hmr=hmr,
+                                       device=device)
+        TnsLogs.wait_for_log(log_file=result.log_file, string_list=strings, timeout=240)
+
+        samples = {}
+        for _ in range(SYNC_COUNT):
+            for change_set in changes:
+                latencies = samples.setdefault(Helpers.get_change_name(change_set), {'log': [], 'ui': []})
+                for revert in [False, True]:
+                    log_latency, ui_latency = Helpers.sync(app_name=app_name, device=device, change_set=change_set,
+                                                           log_file=result.log_file, revert=revert)
+                    latencies['log'].append(log_latency)
+                    if ui_latency is not None:
+                        latencies['ui'].append(ui_latency)
+        Tns.kill()
+        Helpers.save_result(template=template, platform=platform, hmr=hmr, samples=samples)
+
+    @staticmethod
+    def sync(app_name, device, change_set, log_file, revert=False):
+        """
+        Apply (or revert) change and wait until it is synced.
+        :return: Tuple (log latency, ui latency) in seconds, ui latency is None if change has no visible text/color.
+        """
+        synced_count = File.read(log_file).count(SYNCED_MESSAGE)
+        if revert:
+            text, color = change_set.old_text, change_set.old_color
+            start = time.time()
+            Sync.revert(app_name=app_name, change_set=change_set)
+        else:
+            text, color = change_set.new_text, change_set.new_color
+            start = time.time()
+            Sync.replace(app_name=app_name, change_set=change_set)
+
+        def is_text_visible():
+            return device.is_text_visible(text=text, case_sensitive=True)
+
+        def is_color_visible():
+            return (device.get_main_color() == color).all()
+
+        if text is not None:
+            is_visible = is_text_visible
+        elif color is not None:
+            is_visible = is_color_visible
+        else:
+            is_visible = None
+
+        log_latency = None
+        ui_latency = None
+        end_time = start + SYNC_TIMEOUT
+        while time.time() < end_time:
+            if log_latency is None and File.read(log_file).count(SYNCED_MESSAGE) > synced_count:
+                log_latency = time.time() - start
+            if ui_latency is None and is_visible is not None and is_visible():
+                ui_latency = time.time() - start
+            if log_latency is not None and (ui_latency is not None or is_visible is None):
+                break
+            time.sleep(0.1)
+        assert log_latency is not None, \
+            'Failed to sync {0} in {1} seconds.'.format(change_set.file_path, SYNC_TIMEOUT)
+        assert ui_latency is not None or is_visible is None, \
+            'Changes in {0} not visible in {1} seconds.'.format(change_set.file_path, SYNC_TIMEOUT)
+        Log.info('{0} synced in {1:.2f} sec, visible in {2} sec.'.format(change_set.file_path, log_latency,
+                                                                         ui_latency))
+        return log_latency, ui_latency
+
+    @staticmethod
+    def get_change_name(change_set):
+        """
+        Get short name of change, for example `js` for changes in `app/main-view-model.js`.
+        """
+        return os.path.splitext(change_set.file_path)[1][1:]
+
+    @staticmethod
+    def get_mode(hmr):
+        return 'hmr' if hmr else 'bundle'
+
+    @staticmethod
+    def save_result(template, platform, hmr, samples):
+        """
+        Save percentiles of sync latencies in results file and results history.
+        Metrics are named `sync_<mode>_<change>_<log|ui>_p<percentile>`, for example `sync_hmr_js_ui_p90`.
+        """
+        result = {}
+        for change, latencies in samples.items():
+            for kind, values in latencies.items():
+                if not values:
+                    continue
+                for percentile in PERCENTILES:
+                    metric = 'sync_{0}_{1}_{2}_p{3}'.format(Helpers.get_mode(hmr), change, kind, percentile)
+                    result[metric] = PerfUtils.get_percentile(values, percentile)
+                    PerfHistory.record(template=template, platform=platform, metric=metric, value=result[metric])
+        result_file = Helpers.get_result_file_name(template, platform, hmr)
+        File.write(path=result_file, text=json.dumps(result, sort_keys=True, indent=4))
+
+    @staticmethod
+    def get_result_file_name(template, platform, hmr):
+        return os.path.join(Settings.TEST_OUT_HOME, 'sync_{0}_{1}_{2}.json'.format(template, str(platform),
+                                                                                   Helpers.get_mode(hmr)))
+
+    @staticmethod
+    def get_regressions(template, platform, hmr):
+        regressions = []
+        result_file = Helpers.get_result_file_name(template, platform, hmr)
+        for metric in sorted(json.loads(File.read(result_file)).keys()):
+            regressions.extend(PerfHistory.check(template=template, platform=platform, metric=metric))
+        return regressions
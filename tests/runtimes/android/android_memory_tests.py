@@ -0,0 +1,86 @@
+"""
+Test for memory footprint of apps on Android runtime.
+
+Memory is sampled while test scenario runs and peak values are compared with baseline (median of previous results).
+"""
+import json
+import os
+
+from core.base_test.tns_test import TnsTest
+from core.enums.platform_type import Platform
+from core.log.log import Log
+from core.settings.Settings import Emulators, Android, TEST_RUN_HOME, TEST_OUT_HOME, AppName
+from core.utils.device.adb import Adb
+from core.utils.device.device_manager import DeviceManager
+from core.utils.device.memory_sampler import MemorySampler
+from core.utils.file_utils import File, Folder
+from core.utils.perf_history import PerfHistory
+from core.utils.perf_utils import PerfUtils
+from data.templates import Template
+from products.nativescript.tns import Tns
+from products.nativescript.tns_paths import TnsPaths
+
+APP_NAME = AppName.DEFAULT
+TOLERANCE = 0.15
+TAP_COUNT = 20
+
+
+class AndroidMemoryTests(TnsTest):
+
+    @classmethod
+    def setUpClass(cls):
+        TnsTest.setUpClass()
+        cls.emulator = DeviceManager.Emulator.ensure_available(Emulators.DEFAULT)
+        Folder.clean(os.path.join(TEST_RUN_HOME, APP_NAME))
+        Tns.create(app_name=APP_NAME, template=Template.HELLO_WORLD_JS.local_package, update=True)
+        Tns.platform_add_android(APP_NAME, framework_path=Android.FRAMEWORK_PATH)
+        cls.app_id = TnsPaths.get_bundle_id(APP_NAME)
+
+    def tearDown(self):
+        TnsTest.tearDown(self)
+
+    @classmethod
+    def tearDownClass(cls):
+        TnsTest.tearDownClass()
+        Folder.clean(os.path.join(TEST_RUN_HOME, APP_NAME))
+
+    def test_100_memory_on_start(self):
+        Adb.stop_application(device_id=self.emulator.id, app_id=self.app_id)
+        with MemorySampler(device_id=self.emulator.id, app_id=self.app_id) as sampler:
+            Tns.run_android(APP_NAME, device=self.emulator.id, just_launch=True, wait=True)
+            self.emulator.wait_for_text(text='TAP')
+        Helpers.assert_memory(name='memory_on_start', summary=sampler.get_summary())
+
+    def test_200_memory_on_tap(self):
+        Tns.run_android(APP_NAME, device=self.emulator.id, just_launch=True, wait=True)
+        self.emulator.wait_for_text(text='TAP')
+        with MemorySampler(device_id=self.emulator.id, app_id=self.app_id) as sampler:
+            for _ in range(TAP_COUNT):
+                Adb.click_element_by_text(device_id=self.emulator.id, text='TAP', case_sensitive=True)
+        self.emulator.wait_for_text(text='{0} taps left'.format(42 - TAP_COUNT))
+        Helpers.assert_memory(name='memory_on_tap', summary=sampler.get_summary())
+
+
+class Helpers(object):
+    @staticmethod
+    def assert_memory(name, summary, keys=('pss', 'java_heap', 'native_heap')):
+        """
+        Save peak and mean memory usage and compare peak values with baseline (median of previous results).
+        :param name: Name of the test scenario.
+        :param summary: Summary of MemorySampler.
+        :param keys: Memory info keys to compare with baseline.
+        """
+        File.write(path=os.path.join(TEST_OUT_HOME, '{0}.json'.format(name)),
+                   text=json.dumps(summary, sort_keys=True, indent=4))
+        errors = []
+        for key in keys:
+            assert key in summary, 'Failed to get {0} of {1}.'.format(key, APP_NAME)
+            metric = '{0}_{1}_peak'.format(name, key)
+            baseline = PerfHistory.get_baseline(template='hello-world-js', platform=Platform.ANDROID, metric=metric)
+            actual = summary[key]['peak']
+            PerfHistory.record(template='hello-world-js', platform=Platform.ANDROID, metric=metric, value=actual)
+            if baseline is None:
+                Log.info('No baseline for {0}, {1} KB recorded.'.format(metric, actual))
+            elif not PerfUtils.is_value_in_range(actual=actual, expected=baseline, tolerance=TOLERANCE):
+                errors.append('{0}: {1} KB, baseline: {2} KB.'.format(metric, actual, baseline))
+        assert not errors, 'Memory usage is not OK:\n' + '\n'.join(errors)